@@ -1,7 +1,10 @@
 import streamlit as st
-import asyncio
 from datetime import datetime, timedelta
-import scraper
+import browser_service
+import cache_manager
+import memory_cache
+import page_sections
+import search_index
 import storage
 import analysis
 import time
@@ -10,7 +13,7 @@ import time
 st.set_page_config(page_title="나의 뉴스룸", layout="wide")
 
 # 사이드바 메뉴
-menu = st.sidebar.selectbox("메뉴 선택", ["뉴스룸", "스크랩 북", "환경 설정"])
+menu = st.sidebar.selectbox("메뉴 선택", ["뉴스룸", "스크랩 북", "기사 검색", "환경 설정"])
 
 # 사이드바: 키워드 필터 (Feature 1)
 st.sidebar.markdown("---")
@@ -19,19 +22,10 @@ keyword_filter = st.sidebar.text_input("키워드 입력", placeholder="예: 삼
 if keyword_filter:
     st.sidebar.caption(f"🏷️ 필터 적용 중: **{keyword_filter}**")
 
-# 세션 상태 초기화 (데이터 캐싱용)
+# 세션 상태 초기화 (이 세션에서 이미 불러온 지면 표시용, 지면 데이터는 storage 메모리 캐시가 세션 간 공유)
 if "news_data" not in st.session_state:
     st.session_state.news_data = {}
 
-# 스크랩 상태 캐싱 (UI 반응 속도 향상용)
-if "scrapped_urls" not in st.session_state:
-    st.session_state.scrapped_urls = set()
-    # 초기 로드 시 한 번 채워넣기
-    all_scraps = storage.load_scraps()
-    for date_key in all_scraps:
-        for s in all_scraps[date_key]:
-            st.session_state.scrapped_urls.add(s['url'])
-
 def get_today():
     return datetime.now()
 
@@ -86,98 +80,39 @@ if menu == "뉴스룸":
         oid = next(m['oid'] for m in media_list if m['name'] == selected_media)
         cache_key = f"{oid}_{date_str}"
         
-        # 1단계: 세션 상태 확인 (가장 빠름)
-        if cache_key not in st.session_state.news_data:
-            # 2단계: 로컬 파일 캐시 확인 (네트워크 요청 없음)
-            cached_data = storage.load_news_cache(date_str, oid)
-            if cached_data:
-                st.session_state.news_data[cache_key] = cached_data
-                st.toast(f"⚡ {selected_media} 캐시에서 로드 완료!", icon="💾")
-            else:
-                # 3단계: 네트워크에서 가져오기 (가장 느림)
-                with st.spinner(f"{selected_media} 뉴스를 가져오는 중... (최초 1회만 발생)"):
-                    data = asyncio.run(scraper.get_newspaper_data(oid, date_str))
-                    if data:
-                        st.session_state.news_data[cache_key] = data
-                    else:
-                        st.session_state.news_data[cache_key] = [] # 데이터 없음 표시
+        # 1단계: 캐시 확인 (프로세스 메모리 → 로컬 파일, 네트워크 요청 없음)
+        display_data = storage.load_news_cache(date_str, oid)
+        if display_data and cache_key not in st.session_state.news_data:
+            st.session_state.news_data[cache_key] = True
+            st.toast(f"⚡ {selected_media} 캐시에서 로드 완료!", icon="💾")
+        elif display_data is None and cache_key not in st.session_state.news_data:
+            # 2단계: 네트워크에서 가져오기 (가장 느림)
+            with st.spinner(f"{selected_media} 뉴스를 가져오는 중... (최초 1회만 발생)"):
+                # 상시 실행 브라우저 서비스 사용 (세션 간 브라우저 공유)
+                try:
+                    display_data = browser_service.get_service().scrape(oid, date_str)
+                    # 데이터가 없어도 표시 (다시 가져오지 않음)
+                    st.session_state.news_data[cache_key] = True
+                except Exception as e:
+                    # 실패는 세션에 저장하지 않음 (다음 실행 시 재시도)
+                    st.error(f"뉴스를 가져오지 못했습니다: {e}")
         
                 
         # 새로고침 버튼 (강제 새로고침)
         if st.button("🔄 뉴스 새로고침", help="캐시를 무시하고 최신 데이터를 가져옵니다."):
             with st.spinner(f"{selected_media} 뉴스를 다시 가져옵니다..."):
-                 data = asyncio.run(scraper.get_newspaper_data(oid, date_str, force_refresh=True))
-                 st.session_state.news_data[cache_key] = data if data else []
-                 st.rerun()
+                 try:
+                     browser_service.get_service().scrape(oid, date_str, force_refresh=True)
+                     st.session_state.news_data[cache_key] = True
+                     st.rerun()
+                 except Exception as e:
+                     st.error(f"뉴스를 다시 가져오지 못했습니다: {e}")
 
-        display_data = st.session_state.news_data.get(cache_key)
-        
         if not display_data:
             st.info("데이터가 없습니다. 날짜를 확인하거나 '뉴스 새로고침'을 눌러주세요.")
         else:
-            # 섹션별로 페이지 그룹화 (A, B, E, S 등)
-            import re
-            from collections import defaultdict
-            
-            section_pages = defaultdict(list)
-            for page_data in display_data:
-                page_name = page_data['page']
-                # 섹션 추출 (A, B, E 등)
-                section_match = re.search(r'^([A-Z]+)', page_name)
-                if section_match:
-                    section = section_match.group(1)
-                    section_pages[section].append(page_data)
-            
-            # 각 섹션 내에서 페이지 번호로 정렬
-            def sort_key_number(page_dict):
-                p = page_dict['page']
-                match = re.search(r'(\d+)', p)
-                if match:
-                    return int(match.group(1))
-                return 999
-            
-            for section in section_pages:
-                section_pages[section].sort(key=sort_key_number)
-            
-            # 섹션을 알파벳 순으로 정렬
-            sorted_sections = sorted(section_pages.keys())
-            
-            # 각 섹션을 페이지 번호 범위로 나누기 (1-10, 11-20, 21-30, ...)
-            section_chunks = []
-            
-            for section in sorted_sections:
-                pages_in_section = section_pages[section]
-                
-                # 페이지 번호 범위별로 그룹화
-                range_groups = defaultdict(list)
-                for page_data in pages_in_section:
-                    page_num = sort_key_number(page_data)
-                    # 페이지 번호를 10 단위로 그룹화 (1-10=0, 11-20=1, 21-30=2, ...)
-                    range_idx = (page_num - 1) // 10
-                    range_groups[range_idx].append(page_data)
-                
-                # 각 범위 그룹을 청크로 변환
-                for range_idx in sorted(range_groups.keys()):
-                    chunk_pages = range_groups[range_idx]
-                    
-                    # 실제 시작/끝 페이지 번호
-                    start_num = sort_key_number(chunk_pages[0])
-                    end_num = sort_key_number(chunk_pages[-1])
-                    
-                    # 범위 레이블 (1-10, 11-20, 21-30, ...)
-                    range_start = range_idx * 10 + 1
-                    range_end = (range_idx + 1) * 10
-                    
-                    chunk_size = len(chunk_pages)
-                    
-                    section_chunks.append({
-                        'section': section,
-                        'start': start_num,
-                        'end': end_num,
-                        'pages': chunk_pages,
-                        'label': f"{section}{range_start}-{range_end}",
-                        'size': chunk_size
-                    })
+            # 섹션별 / 10면 단위로 묶기 (A1-10, A11-20, B1-10, ...)
+            section_chunks = page_sections.build_section_chunks(display_data)
             
             # 세션 상태에 선택된 섹션 청크 저장
             selected_chunk_key = f"selected_chunk_{cache_key}"
@@ -242,6 +177,9 @@ if menu == "뉴스룸":
                                     if not filtered_articles and keyword_filter:
                                         st.caption("필터 결과 없음")
                                     
+                                    # 스크랩 여부 (프로세스 전역 URL 인덱스로 한 번에 확인)
+                                    scrapped_urls = storage.get_scrapped_urls(art['url'] for art in filtered_articles)
+
                                     for idx, art in enumerate(filtered_articles):
                                         col_a, col_b = st.columns([0.85, 0.15])
                                         with col_a:
@@ -255,13 +193,12 @@ if menu == "뉴스룸":
 
                                         with col_b:
                                             # 스크랩 버튼 (Popover)
-                                            is_scrapped = art['url'] in st.session_state.scrapped_urls
+                                            is_scrapped = art['url'] in scrapped_urls
                                             
                                             if is_scrapped:
                                                 # 이미 스크랩된 경우 바로 삭제 버튼
                                                 if st.button("★", key=f"scr_{cache_key}_{page['page']}_{idx}", help="스크랩 해제"):
                                                     storage.toggle_scrap(format_date_display(selected_date), selected_media, art)
-                                                    st.session_state.scrapped_urls.discard(art['url'])
                                                     st.toast("삭제됨!", icon="🗑️")
                                                     st.rerun()
                                             else:
@@ -287,7 +224,6 @@ if menu == "뉴스룸":
                                                             art,
                                                             folder=selected_folder
                                                         )
-                                                        st.session_state.scrapped_urls.add(art['url'])
                                                         st.toast(f"'{selected_folder}' 폴더에 저장!", icon="✅")
                                                         st.rerun()
                                         st.divider()
@@ -296,27 +232,35 @@ if menu == "뉴스룸":
 elif menu == "스크랩 북":
     st.title("📑 스크랩 북")
     
-    scraps = storage.load_scraps()
-    
-    if not scraps:
+    # 개수만 확인 (스크랩 항목은 아래에서 선택한 폴더 / 태그만 불러옴)
+    if not storage.count_scraps():
         st.info("저장된 스크랩이 없습니다. 뉴스룸에서 마음에 드는 기사를 스크랩해 보세요!")
     else:
         # 폴더 필터 (Feature 3)
         folder_list = storage.get_folder_list()
-        col_folder, col_new_folder = st.columns([3, 1])
+        tag_counts = storage.get_tag_counts()
+        col_folder, col_tags, col_new_folder = st.columns([2, 2, 1])
         with col_folder:
             selected_folder = st.selectbox("📁 폴더 선택", ["전체"] + folder_list)
+        with col_tags:
+            selected_tags = st.multiselect(
+                "🏷️ 태그",
+                sorted(tag_counts, key=lambda tag: -tag_counts[tag]),
+                format_func=lambda tag: f"#{tag} ({tag_counts[tag]})"
+            )
+            match_all_tags = len(selected_tags) > 1 and st.checkbox("모든 태그 포함", value=False)
         with col_new_folder:
             new_folder = st.text_input("새 폴더", placeholder="폴더명")
             if new_folder and st.button("추가"):
                 storage.add_folder(new_folder)
                 st.rerun()
         
-        # 폴더별 필터링
-        if selected_folder == "전체":
-            filtered_scraps = scraps
-        else:
-            filtered_scraps = storage.get_scraps_by_folder(selected_folder)
+        # 폴더 / 태그 필터링 (폴더·태그 인덱스로 해당 스크랩만 불러옴)
+        filtered_scraps = storage.query_scraps(
+            folder=None if selected_folder == "전체" else selected_folder,
+            tags=selected_tags,
+            match="all" if match_all_tags else "any"
+        )
         
         # 날짜별 역순 정렬
         sorted_dates = sorted(filtered_scraps.keys(), reverse=True) if filtered_scraps else []
@@ -336,6 +280,11 @@ elif menu == "스크랩 북":
         # 주간 리포트 버튼 (사이드바 혹은 상단)
         with st.expander("📊 AI 주간 리포트 (Beta)", expanded=False):
             st.info("지난 월요일부터 오늘(또는 어제)까지의 스크랩을 모아 AI가 분석해줍니다.")
+            # 날짜별 집계만 읽음 (스크랩 항목을 불러오지 않음)
+            week_summary = storage.get_scrap_summary(*storage.get_week_range())
+            if week_summary["total"]:
+                top_media = ", ".join(name for name, _ in sorted(week_summary["media"].items(), key=lambda kv: -kv[1])[:3])
+                st.caption(f"이번 주 {week_summary['total']}개 (읽음 {week_summary['read']}개) · 많이 스크랩한 언론사: {top_media}")
             if st.button("이번 주 리포트 생성하기"):
                 with st.spinner("Gemini가 기사를 읽고 분석 중입니다... (약 10~20초 소요)"):
                     weekly_scraps = storage.get_weekly_scraps()
@@ -377,10 +326,52 @@ elif menu == "스크랩 북":
                     with col_del:
                         if st.button("🗑️", key=f"del_{date_str}_{idx}", help="삭제"):
                             storage.remove_scrap(date_str, item['url'])
-                            st.session_state.scrapped_urls.discard(item['url']) # 캐시 동기화
                             st.rerun()
 
-# 3. 환경 설정 화면
+# 3. 기사 검색 화면 (보관된 모든 지면의 제목 / 부제목)
+elif menu == "기사 검색":
+    st.title("🔎 기사 검색")
+
+    settings = storage.load_settings()
+    media_names = {m['oid']: m['name'] for m in settings.get("media_list", [])}
+
+    query = st.text_input("검색어", placeholder="예: 반도체, 금리 인상")
+    col_start, col_end, col_media = st.columns([1, 1, 2])
+    with col_start:
+        search_start = st.date_input("시작 날짜", get_today().replace(day=1))
+    with col_end:
+        search_end = st.date_input("끝 날짜", get_today())
+    with col_media:
+        search_media = st.multiselect("언론사 (비우면 전체)", list(media_names.values()))
+
+    if query:
+        oids = [oid for oid, name in media_names.items() if name in search_media]
+        started = time.perf_counter()
+        results = search_index.search(
+            query,
+            start=format_date_param(search_start),
+            end=format_date_param(search_end),
+            oids=oids or None
+        )
+        elapsed = (time.perf_counter() - started) * 1000
+        st.caption(f"📊 {len(results)}건 ({elapsed:.0f}ms, 최대 {search_index.DEFAULT_LIMIT}건)")
+
+        for item in results:
+            with st.container(border=True):
+                media_name = media_names.get(item['oid'], item['oid'])
+                st.markdown(f"**[{media_name}] {item['title']}**")
+                if item['subtitle']:
+                    st.caption(item['subtitle'])
+                edition_date = datetime.strptime(item['date'], "%Y%m%d")
+                st.markdown(
+                    f"{format_date_display(edition_date)} · {item['page']} · "
+                    f"<a href='{item['url']}' target='_blank' style='text-decoration:none; color:gray;'>기사 원문 ></a>",
+                    unsafe_allow_html=True
+                )
+    else:
+        st.info("검색어를 입력하면 보관된 지면에서 제목 / 부제목을 찾아 줍니다.")
+
+# 4. 환경 설정 화면
 elif menu == "환경 설정":
     st.title("⚙️ 환경 설정")
     
@@ -419,6 +410,40 @@ elif menu == "환경 설정":
             else:
                 st.error("이름과 OID를 모두 입력해 주세요.")
     
+    st.divider()
+
+    st.subheader("아침 사전 수집 상태")
+    prefetch_status = storage.load_json("prefetch_status.json", {})
+    last_run = prefetch_status.get("last_run")
+    if last_run:
+        st.write(f"마지막 실행: {last_run['started_at']} ({last_run.get('duration', '-')}초, 실패 {last_run.get('failures', '-')}개)")
+        if last_run.get("error"):
+            st.error(last_run["error"])
+        if prefetch_status.get("next_run"):
+            st.caption(f"다음 실행: {prefetch_status['next_run']}")
+        for oid, entry in prefetch_status.get("media", {}).items():
+            if entry.get("error"):
+                st.warning(f"{entry['name']} ({oid}): {entry['error']} (마지막 성공: {entry.get('last_success', '-')})")
+    else:
+        st.caption("`python prefetch_worker.py`를 실행하면 설정된 시각마다 오늘 자 지면을 미리 수집합니다.")
+
+    st.divider()
+
+    st.subheader("캐시 사용량")
+    cache_usage = cache_manager.get_usage()
+    cache_policy = cache_manager.get_policy(settings)
+    hit_rate = f"{cache_usage['hit_rate']:.1%}" if cache_usage['hit_rate'] is not None else "-"
+    st.write(f"{cache_usage['dates']}일 / {cache_usage['entries']}개 지면 / {cache_manager.format_bytes(cache_usage['bytes'])} (적중률 {hit_rate})")
+    if cache_policy['max_bytes']:
+        st.progress(min(1.0, cache_usage['bytes'] / cache_policy['max_bytes']), text=f"예산 {cache_manager.format_bytes(cache_policy['max_bytes'])}")
+    st.caption("보관 정책은 settings.json의 `cache_policy`, 정리: `python cache_manager.py enforce --dry-run`")
+    memory_stats = memory_cache.stats()
+    memory_hit_rate = f"{memory_stats['hit_rate']:.1%}" if memory_stats['hit_rate'] is not None else "-"
+    st.write(
+        f"메모리 캐시: {memory_stats['entries']}개 지면 / {cache_manager.format_bytes(memory_stats['bytes'])} "
+        f"(예산 {cache_manager.format_bytes(memory_stats['budget'])}, 적중률 {memory_hit_rate}, 밀려남 {memory_stats['evictions']})"
+    )
+
     st.info("""
     **OID 찾는 법:** 
     네이버 뉴스 '신문 보기' 페이지에서 해당 언론사를 클릭했을 때, 
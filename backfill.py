@@ -0,0 +1,181 @@
+"""
+날짜 범위 백필 (scraped_data 캐시 채우기)
+- 날짜 × 언론사 목록을 워커 프로세스들에 나눠서 스크래핑
+- 이미 캐시된 날짜 / 발행되지 않은 것으로 확인된 날짜는 건너뜀
+- 체크포인트 파일에 진행 상황 기록 → 중단 후 다시 실행하면 이어서 진행
+- 진행 중 처리량(기사/초) 출력
+
+사용법:
+    python backfill.py --start 20260101 --end 20260131
+    python backfill.py --start 20260101 --end 20260131 --media 023,025 --workers 4 --engine httpx
+"""
+
+import argparse
+import asyncio
+import multiprocessing.util
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+import news_parser
+import storage
+
+CHECKPOINT_FILE = "backfill_checkpoint.json"
+
+DEFAULT_WORKERS = 2
+
+def parse_date(value):
+    """YYYYMMDD 또는 YYYY-MM-DD"""
+    return datetime.strptime(value.replace("-", ""), "%Y%m%d")
+
+def date_range(start, end, include_sundays=False):
+    """start ~ end (포함) 날짜 문자열 목록 (일요일은 신문 미발행이므로 기본 제외)"""
+    dates = []
+    curr = start
+    while curr <= end:
+        if include_sundays or curr.weekday() != 6:
+            dates.append(curr.strftime("%Y%m%d"))
+        curr += timedelta(days=1)
+    return dates
+
+def load_checkpoint(path):
+    """
+    체크포인트: {"done": {date: [oid, ...]}, "empty": {date: [oid, ...]}, "failed": {date: {oid: error}}}
+    done: 캐시 저장 완료 / empty: 발행 없음 (다시 시도하지 않음) / failed: 다음 실행에서 재시도
+    """
+    checkpoint = storage.load_json(path, {})
+    for key in ["done", "empty", "failed"]:
+        checkpoint.setdefault(key, {})
+    return checkpoint
+
+def save_checkpoint(path, checkpoint):
+    checkpoint["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    storage.save_json(path, checkpoint)
+
+def pending_media(checkpoint, date, oids):
+    """이 날짜에 아직 처리하지 않은 언론사 (캐시 / 발행 없음은 제외)"""
+    skip = set(checkpoint["done"].get(date, [])) | set(checkpoint["empty"].get(date, []))
+    return [oid for oid in oids if oid not in skip and not storage.has_news_cache(date, oid)]
+
+def _stop_browser_service():
+    import sys
+    if "browser_service" in sys.modules and sys.modules["browser_service"]._service is not None:
+        sys.modules["browser_service"]._service.stop()
+
+def _init_worker():
+    # 워커 프로세스 종료 시 브라우저 정리 (multiprocessing은 atexit을 실행하지 않음)
+    multiprocessing.util.Finalize(None, _stop_browser_service, exitpriority=10)
+
+def backfill_date(date, oids, engine):
+    """
+    워커 프로세스: 한 날짜의 여러 언론사 스크래핑 → {oid: {"articles": n, "error": ..., "no_edition": bool}}
+    no_edition은 스크래퍼가 발행 없음 안내를 확인한 경우(news_parser.NoEdition)만 True
+    """
+    import scraper_optimized
+
+    media_list = [{"oid": oid} for oid in oids]
+    results = asyncio.run(scraper_optimized.scrape_multiple_media(media_list, date, engine=engine))
+
+    summary = {}
+    for oid, result in results.items():
+        data = result['data']
+        summary[oid] = {
+            "articles": sum(len(page['articles']) for page in data) if data else 0,
+            "error": result['error'],
+            "no_edition": isinstance(data, news_parser.NoEdition)
+        }
+    return summary
+
+def record_summary(checkpoint, date, summary):
+    """
+    한 날짜의 결과를 체크포인트에 반영하고 저장한 기사 수를 반환합니다.
+    발행 없음이 확인된 경우만 empty (다시 시도하지 않음), 오류 없이 빈 결과라도 확인되지 않았으면 failed
+    """
+    date_articles = 0
+    for oid, result in summary.items():
+        checkpoint["failed"].get(date, {}).pop(oid, None)
+        if result['error']:
+            checkpoint["failed"].setdefault(date, {})[oid] = result['error']
+        elif result['articles']:
+            checkpoint["done"].setdefault(date, []).append(oid)
+            date_articles += result['articles']
+        elif result.get('no_edition'):
+            checkpoint["empty"].setdefault(date, []).append(oid)
+        else:
+            checkpoint["failed"].setdefault(date, {})[oid] = "빈 결과 (발행 없음 안내 확인 안 됨)"
+    if not checkpoint["failed"].get(date):
+        checkpoint["failed"].pop(date, None)
+    return date_articles
+
+def run_backfill(dates, oids, workers=DEFAULT_WORKERS, engine="playwright", checkpoint_path=CHECKPOINT_FILE):
+    checkpoint = load_checkpoint(checkpoint_path)
+
+    jobs = []
+    for date in dates:
+        todo = pending_media(checkpoint, date, oids)
+        if todo:
+            jobs.append((date, todo))
+
+    skipped = len(dates) - len(jobs)
+    print(f"📅 {len(dates)}일 중 {len(jobs)}일 처리 예정 ({skipped}일은 캐시 / 발행 없음으로 건너뜀)")
+    if not jobs:
+        return checkpoint
+
+    start = time.time()
+    total_articles = 0
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {executor.submit(backfill_date, date, todo, engine): date for date, todo in jobs}
+
+        for finished, future in enumerate(as_completed(futures), 1):
+            date = futures[future]
+            try:
+                summary = future.result()
+            except Exception as e:
+                summary = {oid: {"articles": 0, "error": str(e)} for oid in dict(jobs)[date]}
+
+            date_articles = record_summary(checkpoint, date, summary)
+            save_checkpoint(checkpoint_path, checkpoint)
+
+            total_articles += date_articles
+            elapsed = time.time() - start
+            rate = total_articles / elapsed if elapsed > 0 else 0
+            failed = len(checkpoint["failed"].get(date, {}))
+            failed_str = f", 실패 {failed}개" if failed else ""
+            print(f"[{finished}/{len(jobs)}] {date}: {date_articles}개 기사{failed_str} | 누적 {total_articles}개, {rate:.1f} 기사/초")
+
+    elapsed = time.time() - start
+    print(f"\n⏱️ 총 소요 시간: {elapsed:.2f}초")
+    print(f"📰 총 기사 수: {total_articles}개")
+    return checkpoint
+
+def main():
+    parser = argparse.ArgumentParser(description="scraped_data 날짜 범위 백필")
+    parser.add_argument("--start", required=True, help="시작 날짜 (YYYYMMDD)")
+    parser.add_argument("--end", help="끝 날짜 (YYYYMMDD, 기본: 시작 날짜)")
+    parser.add_argument("--media", help="언론사 OID 목록 (쉼표 구분, 기본: settings.json)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="워커 프로세스 수")
+    parser.add_argument("--engine", choices=["playwright", "httpx"], default="playwright")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_FILE, help="체크포인트 파일 경로")
+    parser.add_argument("--include-sundays", action="store_true", help="일요일도 시도")
+    args = parser.parse_args()
+
+    start = parse_date(args.start)
+    end = parse_date(args.end) if args.end else start
+    dates = date_range(start, end, args.include_sundays)
+
+    if args.media:
+        oids = [oid.strip() for oid in args.media.split(",") if oid.strip()]
+    else:
+        oids = [m['oid'] for m in storage.load_settings().get("media_list", [])]
+
+    print("=" * 60)
+    print("📦 scraped_data 백필")
+    print(f"📅 기간: {dates[0] if dates else '-'} ~ {dates[-1] if dates else '-'} ({len(dates)}일)")
+    print(f"📰 언론사: {', '.join(oids)}")
+    print(f"⚙️ 엔진: {args.engine}, 워커: {args.workers}")
+    print("=" * 60)
+
+    run_backfill(dates, oids, args.workers, args.engine, args.checkpoint)
+
+if __name__ == "__main__":
+    main()
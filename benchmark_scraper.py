@@ -38,7 +38,7 @@ async def benchmark_httpx():
     import scraper_httpx  # httpx 기반 스크래퍼
     
     start = time.time()
-    tasks = [scraper_httpx.get_newspaper_data(m['oid'], TEST_DATE) for m in TEST_MEDIA]
+    tasks = [scraper_httpx.get_newspaper_data(m['oid'], TEST_DATE, force_refresh=True) for m in TEST_MEDIA]
     results = await asyncio.gather(*tasks)
     elapsed = time.time() - start
     
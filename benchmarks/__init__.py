@@ -0,0 +1,11 @@
+"""
+News Room 벤치마크 모음
+- micro: 부제목 / 지면 목록 파싱, storage 스크랩 함수, 캐시 로드, 면 묶기
+- macro: 픽스처 서버 재생으로 전체 스크래핑 (네트워크 불필요)
+
+사용법:
+    python -m benchmarks run                          # 전체 실행 → benchmarks/results/*.json
+    python -m benchmarks run --suite micro -k storage --out benchmarks/baseline.json
+    python -m benchmarks compare benchmarks/baseline.json benchmarks/results/latest.json
+    python -m benchmarks report benchmarks/results/latest.json   # README용 마크다운 표
+"""
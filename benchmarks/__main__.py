@@ -0,0 +1,52 @@
+"""
+python -m benchmarks run | compare | report
+"""
+
+import argparse
+import sys
+from benchmarks import core
+
+VERDICT_ICONS = {"regression": "❌", "improvement": "🚀", "same": "  ", "missing": "⚠️"}
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="News Room 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="벤치마크 실행")
+    run_parser.add_argument("--suite", choices=["micro", "macro", "all"], default="all")
+    run_parser.add_argument("-k", dest="keyword", help="이름에 이 문자열이 포함된 케이스만 실행")
+    run_parser.add_argument("--repeat", type=int, help="측정 반복 횟수 (기본: 케이스별 설정)")
+    run_parser.add_argument("--warmup", type=int, help="워밍업 횟수 (기본: 1)")
+    run_parser.add_argument("--out", help="결과 JSON 경로 (기본: benchmarks/results/{시각}.json)")
+
+    compare_parser = sub.add_parser("compare", help="기준 결과와 비교 (회귀가 있으면 종료 코드 1)")
+    compare_parser.add_argument("baseline", help="기준 결과 JSON")
+    compare_parser.add_argument("current", help="비교할 결과 JSON")
+    compare_parser.add_argument("--threshold", type=float, default=core.DEFAULT_THRESHOLD, help="회귀 판정 비율 (기본: 0.10)")
+
+    report_parser = sub.add_parser("report", help="결과를 마크다운 표로 출력")
+    report_parser.add_argument("results", help="결과 JSON")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        document = core.run_suite(args.suite, args.keyword, args.repeat, args.warmup)
+        path = core.save_results(document, args.out)
+        print(f"\n💾 결과 저장: {path}")
+        return 0
+
+    if args.command == "report":
+        print(core.format_report(core.load_results(args.results)))
+        return 0
+
+    rows = core.compare_results(core.load_results(args.baseline), core.load_results(args.current), args.threshold)
+    for row in rows:
+        ratio = f"x{row['ratio']:.2f}" if row['ratio'] is not None else "-"
+        print(f"{VERDICT_ICONS[row['verdict']]} {row['name']:<40} {core.format_seconds(row['baseline']):>10} → {core.format_seconds(row['current']):>10}  {ratio}")
+
+    regressions = [row for row in rows if row['verdict'] == "regression"]
+    print(f"\n회귀 {len(regressions)}개 (기준: 중앙값 {args.threshold:.0%} 이상 느려짐)")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
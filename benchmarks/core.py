@@ -0,0 +1,225 @@
+"""
+벤치마크 실행기
+- 케이스 등록 (@case), 워밍업 + 반복 측정, 통계 (중앙값 / 평균 / 표준편차 / p95)
+- 시간 외의 측정값 (예: 디스크 크기)은 케이스가 돌려준 metrics로 기록
+- 결과 JSON 저장 / 로드, 기준 결과와 비교 (회귀 판정), 마크다운 표 출력
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+LATEST_RESULT = "latest.json"
+
+DEFAULT_REPEAT = 5
+DEFAULT_WARMUP = 1
+
+# 중앙값이 기준보다 이 비율 이상 느려지면 회귀
+DEFAULT_THRESHOLD = 0.10
+
+STATUS_OK = "ok"
+STATUS_SKIPPED = "skipped"
+STATUS_ERROR = "error"
+
+class SkipCase(Exception):
+    """실행 환경에서 돌릴 수 없는 케이스 (예: playwright 미설치)"""
+
+# 등록된 케이스: [{"suite", "name", "setup", "repeat", "warmup", "params"}, ...]
+CASES = []
+
+def case(suite, name, repeat=None, warmup=None, params=None):
+    """
+    케이스 등록 데코레이터. setup은 컨텍스트 매니저 함수로,
+    (측정할 함수, 처리 항목 수)를 yield 하고 끝나면 정리합니다.
+    (측정할 함수, 처리 항목 수, metrics 함수)를 yield 하면 측정이 끝난 뒤 metrics()의 dict를 결과에 기록
+    (예: {"bytes": 디스크 크기})
+    """
+    def decorator(setup):
+        CASES.append({
+            "suite": suite,
+            "name": name,
+            "setup": setup,
+            "repeat": repeat,
+            "warmup": warmup,
+            "params": params or {}
+        })
+        return setup
+    return decorator
+
+def select_cases(suite=None, keyword=None):
+    return [
+        c for c in CASES
+        if (suite in (None, "all") or c["suite"] == suite) and (not keyword or keyword in c["name"])
+    ]
+
+def summarize(samples):
+    """측정값(초) 목록 → 통계"""
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "median": statistics.median(ordered),
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "min": ordered[0],
+        "max": ordered[-1],
+        "p95": ordered[p95_index],
+        "samples": ordered
+    }
+
+def run_case(bench, repeat=None, warmup=None):
+    """케이스 하나 실행 → 결과 dict (실패 / 건너뜀도 결과로 기록)"""
+    # 명령줄 값 > 케이스 기본값 > 전역 기본값
+    if repeat is None:
+        repeat = bench["repeat"] or DEFAULT_REPEAT
+    if warmup is None:
+        warmup = bench["warmup"] if bench["warmup"] is not None else DEFAULT_WARMUP
+    result = {"suite": bench["suite"], "params": bench["params"], "repeat": repeat, "warmup": warmup}
+
+    try:
+        with bench["setup"]() as prepared:
+            fn, items = prepared[:2]
+            for _ in range(warmup):
+                fn()
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                samples.append(time.perf_counter() - start)
+            metrics = prepared[2]() if len(prepared) > 2 else None
+    except SkipCase as e:
+        result.update({"status": STATUS_SKIPPED, "reason": str(e)})
+        return result
+    except Exception as e:
+        result.update({"status": STATUS_ERROR, "reason": f"{type(e).__name__}: {e}"})
+        return result
+
+    result.update(summarize(samples))
+    result.update({"status": STATUS_OK, "items": items})
+    if metrics:
+        result["metrics"] = metrics
+    if items:
+        result["items_per_sec"] = items / result["median"] if result["median"] > 0 else None
+    return result
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+def run_suite(suite=None, keyword=None, repeat=None, warmup=None, verbose=True):
+    """선택한 케이스 실행 → 결과 문서"""
+    # 케이스 모듈 로드 (등록)
+    from benchmarks import micro, macro  # noqa: F401
+
+    document = {
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "git_commit": git_commit(),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count()
+        },
+        "cases": {}
+    }
+
+    for bench in select_cases(suite, keyword):
+        if verbose:
+            print(f"▶️ {bench['name']} ...", end=" ", flush=True)
+        result = run_case(bench, repeat, warmup)
+        document["cases"][bench["name"]] = result
+        if verbose:
+            if result["status"] == STATUS_OK:
+                print(f"{format_seconds(result['median'])} (±{format_seconds(result['stdev'])}, n={result['repeat']})")
+            else:
+                print(f"{result['status']}: {result['reason']}")
+    return document
+
+def save_results(document, path=None):
+    """결과 저장 (경로가 없으면 results/{시각}.json + results/latest.json)"""
+    if path is None:
+        if not os.path.exists(RESULTS_DIR):
+            os.makedirs(RESULTS_DIR)
+        path = os.path.join(RESULTS_DIR, datetime.now().strftime("%Y%m%d_%H%M%S") + ".json")
+        write_json(os.path.join(RESULTS_DIR, LATEST_RESULT), document)
+    write_json(path, document)
+    return path
+
+def write_json(path, document):
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    케이스별 중앙값 비교 → [{"name", "baseline", "current", "ratio", "verdict"}, ...]
+    verdict: "regression"(threshold 이상 느려짐) / "improvement"(threshold 이상 빨라짐) / "same" / "missing"
+    """
+    rows = []
+    for name, base in baseline["cases"].items():
+        curr = current["cases"].get(name)
+        if base.get("status") != STATUS_OK:
+            continue
+        if not curr or curr.get("status") != STATUS_OK:
+            rows.append({"name": name, "baseline": base["median"], "current": None, "ratio": None, "verdict": "missing"})
+            continue
+
+        ratio = curr["median"] / base["median"] if base["median"] > 0 else 1.0
+        if ratio > 1 + threshold:
+            verdict = "regression"
+        elif ratio < 1 / (1 + threshold):
+            verdict = "improvement"
+        else:
+            verdict = "same"
+        rows.append({"name": name, "baseline": base["median"], "current": curr["median"], "ratio": ratio, "verdict": verdict})
+    return rows
+
+def format_seconds(seconds):
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
+
+def format_report(document):
+    """README에 붙일 마크다운 표"""
+    lines = [
+        f"측정: {document['created_at']} (commit {document.get('git_commit') or '-'}, "
+        f"Python {document['machine']['python']}, CPU {document['machine']['cpu_count']}개)",
+        "",
+        "| 케이스 | 중앙값 | 표준편차 | 처리량 | 반복 |",
+        "|------|------|------|------|------|",
+    ]
+    for name, result in document["cases"].items():
+        if result["status"] != STATUS_OK:
+            lines.append(f"| `{name}` | {result['status']} | - | - | - |")
+            continue
+        rate = result.get("items_per_sec")
+        rate = "-" if not rate else (f"{rate:,.1f}/초" if rate < 100 else f"{rate:,.0f}/초")
+        lines.append(f"| `{name}` | {format_seconds(result['median'])} | {format_seconds(result['stdev'])} | {rate} | {result['repeat']} |")
+
+    sizes = [(name, result["metrics"]["bytes"]) for name, result in document["cases"].items() if "bytes" in result.get("metrics", {})]
+    if sizes:
+        lines += ["", "| 케이스 | 디스크 크기 |", "|------|------|"]
+        lines += [f"| `{name}` | {format_bytes(size)} |" for name, size in sizes]
+    return "\n".join(lines)
+
+def format_bytes(size):
+    if size < 1024:
+        return f"{size:,}B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:,.1f}KB"
+    return f"{size / 1024 / 1024:,.2f}MB"
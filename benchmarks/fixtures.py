@@ -0,0 +1,129 @@
+"""
+벤치마크용 데이터 준비
+- 저장소에 포함된 scraped_data의 기준 날짜 지면을 샘플로 사용
+- storage 경로를 임시 디렉터리로 바꿔 실제 스크랩 / 캐시 파일을 건드리지 않음
+"""
+
+import glob
+import json
+import os
+import random
+import shutil
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import search_index
+import storage
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 샘플 지면 날짜 (저장소에 캐시가 있는 날짜)
+REFERENCE_DATE = "20260130"
+REFERENCE_CACHE_DIR = os.path.join(ROOT_DIR, "scraped_data")
+
+SUBTITLE_CORPUS_DIR = os.path.join(ROOT_DIR, "test_data", "subtitle_corpus")
+
+SEED = 20260130
+
+def load_sample_editions(date=REFERENCE_DATE):
+    """{oid: 지면 데이터} (기준 날짜의 캐시 원본)"""
+    editions = {}
+    for path in sorted(glob.glob(os.path.join(REFERENCE_CACHE_DIR, date, "*.json"))):
+        name = os.path.basename(path)
+        if name.count(".") != 1:
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            editions[name[:-len(".json")]] = json.load(f)
+    return editions
+
+def load_subtitle_corpus():
+    documents = []
+    for path in sorted(glob.glob(os.path.join(SUBTITLE_CORPUS_DIR, "*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            documents.append(f.read())
+    return documents
+
+def count_articles(newspaper_data):
+    return sum(len(page['articles']) for page in newspaper_data) if newspaper_data else 0
+
+@contextmanager
+def temp_storage(backend="json"):
+    """
+    storage의 스크랩 / 설정 / 폴더 파일과 캐시 디렉터리를 임시 디렉터리로 교체
+    backend: 스크랩 저장 방식 (storage.SCRAPS_BACKEND_ENV)
+    """
+    names = ["SCRAPS_FILE", "SCRAPS_DB_FILE", "SCRAPS_JOURNAL_FILE", "SETTINGS_FILE", "FOLDERS_FILE", "CACHE_DIR"]
+    original = {name: getattr(storage, name) for name in names}
+    original_backend = os.environ.get(storage.SCRAPS_BACKEND_ENV)
+    temp_dir = tempfile.mkdtemp(prefix="newsroom_bench_")
+    try:
+        os.environ[storage.SCRAPS_BACKEND_ENV] = backend
+        storage.SCRAPS_FILE = os.path.join(temp_dir, "scraps.json")
+        storage.SCRAPS_DB_FILE = os.path.join(temp_dir, "scraps.db")
+        storage.SCRAPS_JOURNAL_FILE = os.path.join(temp_dir, "scraps.journal")
+        storage.SETTINGS_FILE = os.path.join(temp_dir, "settings.json")
+        storage.FOLDERS_FILE = os.path.join(temp_dir, "folders.json")
+        storage.CACHE_DIR = os.path.join(temp_dir, "scraped_data")
+        os.makedirs(storage.CACHE_DIR)
+        yield temp_dir
+    finally:
+        search_index.close_connections()
+        for name, value in original.items():
+            setattr(storage, name, value)
+        if original_backend is None:
+            os.environ.pop(storage.SCRAPS_BACKEND_ENV, None)
+        else:
+            os.environ[storage.SCRAPS_BACKEND_ENV] = original_backend
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def make_scraps(count, days=365, seed=SEED):
+    """
+    스크랩 데이터 생성: 오늘부터 days일 전까지 고르게 분포 (이번 주 포함)
+    Returns: {"YYYY-MM-DD": [스크랩, ...]} (storage.load_scraps 형식)
+    """
+    rng = random.Random(seed)
+    articles = [
+        (oid, article)
+        for oid, edition in load_sample_editions().items()
+        for page in edition
+        for article in page['articles']
+    ]
+    folders = ["기본", "정치", "경제", "사회", "국제"]
+    tags = ["분석", "인물", "정책", "시장", "칼럼", "단독"]
+    today = datetime.now()
+
+    scraps = {}
+    for i in range(count):
+        oid, article = articles[i % len(articles)]
+        date_str = (today - timedelta(days=rng.randrange(days))).strftime("%Y-%m-%d")
+        item = article.copy()
+        # 같은 기사가 여러 번 쓰이므로 URL을 고유하게 만듦
+        item['url'] = f"{article['url'].split('?')[0]}?bench={i}"
+        item['media'] = oid
+        item['scrapped_at'] = f"{date_str} 08:{i % 60:02d}:00"
+        item['read'] = rng.random() < 0.5
+        item['folder'] = rng.choice(folders)
+        item['tags'] = rng.sample(tags, rng.randrange(3))
+        scraps.setdefault(date_str, []).append(item)
+    return scraps
+
+def write_month_cache(days=30, cache_format=None):
+    """
+    현재 storage.CACHE_DIR에 기준 날짜 지면을 days일치(일요일 제외) 복사합니다.
+    cache_format: 저장 형식 (없으면 storage 기본값)
+    Returns: [(date, oid), ...]
+    """
+    editions = load_sample_editions()
+    start = datetime.strptime(REFERENCE_DATE, "%Y%m%d")
+    entries = []
+    offset = 0
+    while len({date for date, _ in entries}) < days:
+        day = start - timedelta(days=offset)
+        offset += 1
+        if day.weekday() == 6:
+            continue
+        date = day.strftime("%Y%m%d")
+        for oid, edition in editions.items():
+            storage.save_news_cache(date, oid, edition, cache_format)
+            entries.append((date, oid))
+    return entries
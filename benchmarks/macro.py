@@ -0,0 +1,101 @@
+"""
+매크로 벤치마크 (전체 스크래핑)
+- 기준 날짜 캐시로 만든 픽스처 아카이브를 로컬 서버로 재생 (고정 지연 + 지터, 시드 고정)
+- 캐시는 임시 디렉터리에 쓰므로 매 반복이 같은 조건에서 실행됨
+- Playwright 케이스는 playwright가 설치된 환경에서만 실행
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+from contextlib import contextmanager
+import fixture_server
+import news_parser
+from benchmarks import fixtures
+from benchmarks.core import SkipCase, case
+
+# 재생 서버 응답 지연 (초)
+REPLAY_LATENCY = 0.05
+REPLAY_JITTER = 0.02
+
+@contextmanager
+def replay_environment():
+    """픽스처 서버 시작 + 스크래퍼가 서버를 바라보게 설정 + 임시 storage"""
+    editions = fixtures.load_sample_editions()
+    archive = fixture_server.build_archive(fixtures.REFERENCE_DATE, list(editions))
+    server = fixture_server.start_server(archive, port=0, latency=REPLAY_LATENCY, jitter=REPLAY_JITTER, seed=fixtures.SEED)
+
+    env_names = [news_parser.MEDIA_BASE_URL_ENV, news_parser.ARTICLE_BASE_URL_ENV]
+    original_env = {name: os.environ.get(name) for name in env_names}
+    try:
+        fixture_server.use_server(server)
+        with fixtures.temp_storage():
+            media_list = [{"oid": oid} for oid in editions]
+            articles = sum(fixtures.count_articles(edition) for edition in editions.values())
+            yield media_list, articles
+    finally:
+        for name, value in original_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        fixture_server.stop_server(server)
+
+def quiet(fn):
+    """스크래퍼 진행 로그 숨김"""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn()
+    return run
+
+def check_outcomes(results):
+    errors = {oid: result['error'] for oid, result in results.items() if result['error']}
+    if errors:
+        raise RuntimeError(f"스크래핑 실패: {errors}")
+
+def require_playwright():
+    try:
+        import playwright  # noqa: F401
+    except ImportError:
+        raise SkipCase("playwright 미설치")
+
+def scrape_all(media_list, engine, incremental):
+    import scraper_optimized
+    results = asyncio.run(scraper_optimized.scrape_multiple_media(
+        media_list, fixtures.REFERENCE_DATE, force_refresh=True, engine=engine, incremental=incremental))
+    check_outcomes(results)
+
+@case("macro", "scrape.httpx.full", repeat=3)
+@contextmanager
+def httpx_full_case():
+    with replay_environment() as (media_list, articles):
+        yield quiet(lambda: scrape_all(media_list, "httpx", incremental=False)), articles
+
+@case("macro", "scrape.httpx.refresh_unchanged", repeat=5)
+@contextmanager
+def httpx_refresh_case():
+    with replay_environment() as (media_list, articles):
+        # 첫 수집 후 변경 없는 새로고침 (지면 지문 일치 → 부제목 요청 없음)
+        quiet(lambda: scrape_all(media_list, "httpx", incremental=False))()
+        yield quiet(lambda: scrape_all(media_list, "httpx", incremental=True)), len(media_list)
+
+@case("macro", "scrape.playwright.optimized", repeat=3)
+@contextmanager
+def playwright_optimized_case():
+    require_playwright()
+    with replay_environment() as (media_list, articles):
+        yield quiet(lambda: scrape_all(media_list, "playwright", incremental=False)), articles
+
+@case("macro", "scrape.playwright.legacy", repeat=3)
+@contextmanager
+def playwright_legacy_case():
+    require_playwright()
+    import scraper
+
+    async def scrape_legacy(media_list):
+        tasks = [scraper.get_newspaper_data(m['oid'], fixtures.REFERENCE_DATE, force_refresh=True) for m in media_list]
+        return await asyncio.gather(*tasks)
+
+    with replay_environment() as (media_list, articles):
+        yield quiet(lambda: asyncio.run(scrape_legacy(media_list))), articles
@@ -0,0 +1,191 @@
+"""
+마이크로 벤치마크
+- 부제목 파싱 (단일 패스 추출기 / bs4 기준 구현)
+- 지면 목록 파싱, 지면 지문
+- storage 스크랩 함수 (1만 / 10만 건, json / sqlite / journal 저장 방식, 주간 목록 / 주간 요약 / 폴더·태그 조회, 전체 읽기 후 거르기 비교)
+- 한 달치 지면 캐시 로드 (nrc / json, 전체 / 한 면 / 면 목록, 디스크 / 메모리 캐시)
+- 한 달치 지면 캐시 저장 + 디스크 크기 (nrc / json)
+- 한 달치 지면 전체 검색 (search_index)
+- 면 묶기 (page_sections)
+"""
+
+import os
+from contextlib import contextmanager
+import fixture_server
+import memory_cache
+import news_parser
+import page_sections
+import search_index
+import storage
+import subtitle_extractor
+from benchmarks import fixtures
+from benchmarks.core import case
+
+# --- 파싱 ---
+
+@case("micro", "parse.subtitle.extractor")
+@contextmanager
+def subtitle_extractor_case():
+    documents = fixtures.load_subtitle_corpus()
+    yield (lambda: [subtitle_extractor.extract_subtitle(doc) for doc in documents]), len(documents)
+
+@case("micro", "parse.subtitle.bs4")
+@contextmanager
+def subtitle_bs4_case():
+    documents = fixtures.load_subtitle_corpus()
+    yield (lambda: [news_parser.parse_article_subtitle(doc) for doc in documents]), len(documents)
+
+@case("micro", "parse.index")
+@contextmanager
+def index_case():
+    editions = list(fixtures.load_sample_editions().values())
+    documents = [fixture_server.render_index_html(edition) for edition in editions]
+    articles = sum(fixtures.count_articles(edition) for edition in editions)
+    yield (lambda: [news_parser.parse_newspaper_index(doc) for doc in documents]), articles
+
+@case("micro", "parse.index.fingerprint")
+@contextmanager
+def fingerprint_case():
+    editions = list(fixtures.load_sample_editions().values())
+    articles = sum(fixtures.count_articles(edition) for edition in editions)
+    yield (lambda: [news_parser.fingerprint_newspaper_index(edition) for edition in editions]), articles
+
+# --- storage 스크랩 ---
+
+SCRAP_COUNTS = [10_000, 100_000]
+
+SCRAP_BACKENDS = ["json", "sqlite", "journal"]
+
+def scrap_case(count, operation, backend):
+    @contextmanager
+    def setup():
+        with fixtures.temp_storage(backend):
+            scraps = fixtures.make_scraps(count)
+            # scraps.json을 만들면 sqlite는 첫 연결 시 가져옴
+            storage.save_json(storage.SCRAPS_FILE, scraps)
+            storage.load_scraps()
+
+            # 가장 최근 날짜의 마지막 스크랩 (파일 끝까지 찾아야 하는 경우)
+            date_str = max(scraps)
+            target = scraps[date_str][-1]
+            state = {"read": False}
+
+            if operation == "toggle_scrap":
+                # 같은 기사를 추가 / 삭제 반복 (파일 크기 유지)
+                article = {"page": "A1면", "title": "벤치마크 기사", "url": "https://n.news.naver.com/article/newspaper/000/bench", "subtitle": ""}
+                fn = lambda: storage.toggle_scrap(date_str, "벤치마크", article)
+            elif operation == "mark_as_read":
+                def fn():
+                    state["read"] = not state["read"]
+                    storage.mark_as_read(date_str, target['url'], state["read"])
+            elif operation == "query_scraps":
+                # 폴더 1개 AND 태그 2개 (스크랩북에서 폴더 / 태그를 고른 경우)
+                fn = lambda: storage.query_scraps(folder="경제", tags=["단독", "칼럼"], match="all")
+            elif operation == "query_scraps_scan":
+                # 비교용: 전체 스크랩을 불러와 거르던 이전 방식 (같은 조건)
+                def fn():
+                    selected = {}
+                    for day, items in storage.load_scraps().items():
+                        for s in items:
+                            if s.get('folder', '기본') == "경제" and {"단독", "칼럼"} <= set(s.get('tags', [])):
+                                selected.setdefault(day, []).append(s)
+                    return selected
+            elif operation == "get_scrap_summary":
+                fn = lambda: storage.get_scrap_summary(*storage.get_week_range())
+            else:
+                fn = storage.get_weekly_scraps
+            yield fn, 1
+
+    # json은 기존 이름 유지 (기준 결과와 비교 가능하도록)
+    prefix = "storage" if backend == "json" else f"storage.{backend}"
+    label = f"{count // 1000}k"
+    case("micro", f"{prefix}.{operation}.{label}", repeat=5 if count <= 10_000 else 3, params={"scraps": count, "backend": backend})(setup)
+
+for _backend in SCRAP_BACKENDS:
+    for _count in SCRAP_COUNTS:
+        for _operation in ["toggle_scrap", "mark_as_read", "get_weekly_scraps", "get_scrap_summary", "query_scraps"]:
+            scrap_case(_count, _operation, _backend)
+
+# 인덱스 조회와 비교할 전체 읽기 방식 (json만)
+for _count in SCRAP_COUNTS:
+    scrap_case(_count, "query_scraps_scan", "json")
+
+# --- 캐시 로드 ---
+
+def month_cache_case(name, cache_format, load, memory=False):
+    @contextmanager
+    def setup():
+        # memory가 아니면 메모리 캐시를 끄고 디스크 읽기만 측정
+        budget = memory_cache.news_cache.budget
+        memory_cache.news_cache.clear()
+        memory_cache.news_cache.budget = budget if memory else 0
+        try:
+            with fixtures.temp_storage():
+                entries = fixtures.write_month_cache(days=30, cache_format=cache_format)
+                yield (lambda: [load(date, oid) for date, oid in entries]), len(entries)
+        finally:
+            memory_cache.news_cache.clear()
+            memory_cache.news_cache.budget = budget
+
+    case("micro", name, params={"days": 30, "format": cache_format, "memory": memory})(setup)
+
+month_cache_case("storage.load_news_cache.month", "json", storage.load_news_cache)
+month_cache_case("storage.load_news_cache.month.memory", "json", storage.load_news_cache, memory=True)
+month_cache_case("storage.load_news_cache.month.nrc", "nrc", storage.load_news_cache)
+month_cache_case("storage.load_news_cache_page.month", "nrc", lambda date, oid: storage.load_news_cache_page(date, oid, "A1면"))
+month_cache_case("storage.load_news_cache_index.month", "nrc", storage.load_news_cache_index)
+
+def month_save_case(name, cache_format):
+    @contextmanager
+    def setup():
+        with fixtures.temp_storage():
+            entries = fixtures.write_month_cache(days=30, cache_format=cache_format)
+            editions = [(date, oid, storage.load_news_cache(date, oid)) for date, oid in entries]
+            # 지면 캐시 파일 크기 합 (기사 기록 / 지문 / 검색 색인 제외)
+            size = lambda: sum(os.path.getsize(storage.find_cache_path(date, oid)) for date, oid in entries)
+            yield (lambda: [storage.save_news_cache(date, oid, data, cache_format) for date, oid, data in editions]), len(entries), lambda: {"bytes": size()}
+
+    case("micro", name, params={"days": 30, "format": cache_format})(setup)
+
+month_save_case("storage.save_news_cache.month", "json")
+month_save_case("storage.save_news_cache.month.nrc", "nrc")
+
+# --- 전체 검색 ---
+
+SEARCH_QUERIES = ["현대차", "정부 공급", "트럼프", "반도체"]
+
+@case("micro", "search_index.search.month", params={"days": 30, "queries": len(SEARCH_QUERIES)})
+@contextmanager
+def search_month_case():
+    with fixtures.temp_storage():
+        # save_news_cache가 저장하면서 색인
+        fixtures.write_month_cache(days=30)
+        search_index.ensure_synced()
+        yield (lambda: [search_index.search(query) for query in SEARCH_QUERIES]), len(SEARCH_QUERIES)
+
+@case("micro", "search_index.index_edition", params={"editions": "sample"})
+@contextmanager
+def index_edition_case():
+    with fixtures.temp_storage():
+        editions = fixtures.load_sample_editions()
+        date = fixtures.REFERENCE_DATE
+        for oid, edition in editions.items():
+            storage.save_news_cache(date, oid, edition)
+        yield (lambda: [search_index.index_edition(date, oid, edition) for oid, edition in editions.items()]), len(editions)
+
+# --- 면 묶기 ---
+
+# 한 번 호출이 수십 µs라 여러 번 묶어서 측정
+SECTION_ROUNDS = 100
+
+@case("micro", "sections.build_chunks", params={"rounds": SECTION_ROUNDS})
+@contextmanager
+def section_chunks_case():
+    editions = list(fixtures.load_sample_editions().values())
+
+    def fn():
+        for _ in range(SECTION_ROUNDS):
+            for edition in editions:
+                page_sections.build_section_chunks(edition)
+
+    yield fn, SECTION_ROUNDS * len(editions)
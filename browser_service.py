@@ -0,0 +1,233 @@
+"""
+상시 실행 브라우저 서비스
+- 프로세스당 Chromium 1개를 띄워두고 재사용 (매 요청마다의 콜드 스타트 제거)
+- 전용 이벤트 루프 스레드에서 실행 → 어떤 Streamlit 세션(스레드)에서도 요청 가능
+- 리소스 차단이 미리 적용된 컨텍스트 풀 (컨텍스트마다 필요할 때 늘어나는 페이지 풀, 최대 동시 요청 한도)
+- 모든 요청이 하나의 요청 제어기(fetch_control.FetchController)를 공유
+- 브라우저가 죽으면 다음 요청에서 재시작, 컨텍스트는 N회 사용 후 재생성 (메모리 제한)
+
+사용법:
+    service = browser_service.get_service()
+    data = service.scrape(oid, date_str)                     # 동기 (Streamlit)
+    data = await asyncio.wrap_future(service.submit_scrape(oid, date_str))  # 다른 이벤트 루프
+"""
+
+import asyncio
+import atexit
+import threading
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
+import fetch_control
+import page_pool
+import scrape_metrics
+import scraper_optimized
+import single_flight
+import storage
+
+# 컨텍스트 풀 크기 (동시에 스크래핑할 수 있는 언론사 수)
+CONTEXT_POOL_SIZE = 4
+
+# 컨텍스트 재생성 주기 (스크래핑 N회 사용 후)
+CONTEXT_MAX_USES = 20
+
+# 모든 언론사가 공유하는 동시 요청(열린 페이지) 한도 초기값 (fetch_control이 조절)
+GLOBAL_REQUEST_LIMIT = scraper_optimized.SEM_LIMIT
+
+# 동기 요청 대기 시간 (초)
+REQUEST_TIMEOUT = 180
+
+class BrowserService:
+    """브라우저 1개 + 컨텍스트 풀을 소유하는 스크래핑 서비스"""
+
+    def __init__(self, pool_size=CONTEXT_POOL_SIZE, max_uses=CONTEXT_MAX_USES, request_limit=GLOBAL_REQUEST_LIMIT):
+        self.pool_size = pool_size
+        self.max_uses = max_uses
+        self.request_limit = request_limit
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, name="browser-service", daemon=True)
+
+        self._playwright = None
+        self._browser = None
+        # 브라우저 재시작마다 증가 (이전 세대 컨텍스트는 폐기)
+        self._generation = 0
+        self._idle_contexts = []
+        self._context_uses = {}
+        self._closed_contexts = set()
+        self._page_pools = {}
+        self._slots = None
+        self._budget = None
+        self._launch_lock = None
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def start(self):
+        """루프 스레드 시작 + 브라우저/컨텍스트 미리 준비"""
+        self.thread.start()
+        self.run(self._setup())
+
+    async def _setup(self):
+        self._slots = asyncio.Semaphore(self.pool_size)
+        self._budget = fetch_control.FetchController(self.request_limit)
+        self._launch_lock = asyncio.Lock()
+        await self._ensure_browser()
+
+    def submit(self, coro):
+        """코루틴을 서비스 루프에서 실행합니다. (concurrent.futures.Future 반환)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout=REQUEST_TIMEOUT):
+        """코루틴을 서비스 루프에서 실행하고 결과를 기다립니다."""
+        return self.submit(coro).result(timeout)
+
+    async def _ensure_browser(self):
+        """브라우저가 없거나 죽었으면 (재)시작하고 컨텍스트 풀을 채웁니다."""
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            if self._browser is not None:
+                print("[browser_service] Browser disconnected. Restarting...")
+                await self._close_browser()
+
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._generation += 1
+            self._idle_contexts = []
+            self._context_uses = {}
+            self._closed_contexts = set()
+            self._page_pools = {}
+
+            # 컨텍스트 미리 생성 (첫 요청 대기 시간 제거)
+            for _ in range(self.pool_size):
+                self._idle_contexts.append(await self._new_context())
+
+            print(f"[browser_service] Browser ready (generation {self._generation})")
+            return self._browser
+
+    async def _new_context(self):
+        # 컨텍스트는 언론사와 무관하게 미리 / 재생성되므로 oid 없이 기록
+        with scrape_metrics.timer(scrape_metrics.STAGE_CONTEXT, None):
+            context = await scraper_optimized.create_context(self._browser)
+        self._context_uses[id(context)] = 0
+        # 진행 중인 요청 수는 공유 한도가 제한하므로 언론사 하나도 한도 전체를 쓸 수 있게 함 (페이지는 필요할 때만 생성)
+        self._page_pools[id(context)] = page_pool.PagePool(context, self._budget.max_limit)
+        context.on("close", lambda _: self._closed_contexts.add(id(context)))
+        return context
+
+    async def _close_browser(self):
+        try:
+            await self._browser.close()
+        except Exception:
+            pass
+        self._browser = None
+        self._idle_contexts = []
+
+    @asynccontextmanager
+    async def context(self):
+        """리소스 차단이 적용된 컨텍스트를 빌려옵니다. (풀 크기만큼 동시 사용)"""
+        async with self._slots:
+            await self._ensure_browser()
+            generation = self._generation
+            if self._idle_contexts:
+                context = self._idle_contexts.pop()
+            else:
+                context = await self._new_context()
+
+            try:
+                yield context
+            finally:
+                await self._release_context(context, generation)
+
+    async def _release_context(self, context, generation):
+        """컨텍스트 반납 (재시작된 브라우저의 것이거나 사용 횟수 초과 시 폐기)"""
+        if generation != self._generation:
+            return
+
+        key = id(context)
+        self._context_uses[key] = self._context_uses.get(key, 0) + 1
+
+        if not self._browser.is_connected():
+            return
+
+        if key in self._closed_contexts or self._context_uses[key] >= self.max_uses:
+            self._context_uses.pop(key, None)
+            self._closed_contexts.discard(key)
+            await self._page_pools.pop(key).close()
+            try:
+                await context.close()
+            except Exception:
+                pass
+            return
+
+        self._idle_contexts.append(context)
+
+    async def scrape_async(self, oid, date, force_refresh=False, incremental=True):
+        """
+        서비스 루프 안에서 실행되는 스크래핑 (캐시 확인 포함)
+        force_refresh 시에도 incremental이면 새 기사 / 바뀐 기사만 다시 가져옵니다.
+        같은 (oid, date)를 스크래핑 중이면 새로 시작하지 않고 그 결과를 기다립니다.
+        """
+        if not force_refresh:
+            cached_data = storage.load_news_cache(date, oid)
+            if cached_data:
+                print(f"[{oid}] Cache Hit!")
+                return cached_data
+
+        async def scrape():
+            print(f"[{oid}] Service Scraping started...")
+            async with self.context() as context:
+                # 전역 한도를 공유하므로 동시에 몇 개의 언론사를 처리해도 진행 중인 요청 수가 제한됨
+                pages = self._page_pools[id(context)]
+                return await scraper_optimized.scrape_with_context(context, oid, date, self._budget, incremental, pages)
+
+        # 여러 세션이 같은 지면을 동시에 열면 한 번만 스크래핑 (다른 프로세스와도 파일 잠금으로 합침)
+        return await single_flight.run(oid, date, scrape)
+
+    def submit_scrape(self, oid, date, force_refresh=False, incremental=True):
+        """스크래핑 요청 (Future 반환, 다른 이벤트 루프에서는 asyncio.wrap_future로 대기)"""
+        return self.submit(self.scrape_async(oid, date, force_refresh, incremental))
+
+    def scrape(self, oid, date, force_refresh=False, incremental=True, timeout=REQUEST_TIMEOUT):
+        """스크래핑 요청 후 결과 대기 (Streamlit 등 동기 코드용)"""
+        return self.submit_scrape(oid, date, force_refresh, incremental).result(timeout)
+
+    async def _shutdown(self):
+        if self._browser is not None:
+            await self._close_browser()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def stop(self):
+        """브라우저 종료 및 루프 스레드 정지"""
+        if not self.thread.is_alive():
+            return
+        try:
+            self.run(self._shutdown(), timeout=30)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_service():
+    """프로세스 전역 서비스 (최초 호출 시 브라우저 시작)"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            service = BrowserService()
+            try:
+                service.start()
+            except Exception:
+                service.stop()
+                raise
+            atexit.register(service.stop)
+            _service = service
+    return _service
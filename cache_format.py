@@ -0,0 +1,173 @@
+"""
+압축 지면 캐시 형식 (.nrc, News Room Cache)
+- 면 이름 / 기사 URL 앞부분(https://n.news.naver.com/article/newspaper/{oid}/) / 쿼리(?date=...)는 표에 한 번만 저장
+- 면마다 따로 zlib 압축 → 머리말의 위치 표로 한 면(예: A1면)만 읽어서 풀 수 있음
+- 머리말만 읽으면 면 목록 / 기사 수를 알 수 있음 (보관 지면 전체 훑기용)
+
+파일 구조:
+    b"NRC" + 버전(1바이트) + 머리말 길이(4바이트, big endian) + 머리말(zlib JSON) + 면 블록...
+    머리말: {"prefixes": [...], "queries": [...],
+            "pages": [{"page": 면 이름, "offset": 블록 시작(머리말 뒤 기준), "length": 바이트 수, "count": 기사 수}]}
+    면 블록(zlib JSON): [[제목, prefix 번호, URL 나머지, query 번호, 부제목(, 기타 키)], ...]
+
+기존 JSON 캐시 변환: python cache_format.py convert [--to nrc|json] [--start 20260101 --end 20260131]
+"""
+
+import io
+import json
+import struct
+import zlib
+
+MAGIC = b"NRC"
+VERSION = 1
+
+HEADER_STRUCT = struct.Struct(">4sI")
+COMPRESS_LEVEL = 6
+
+# 면 블록에 열로 저장하는 기사 키 (나머지는 기타 키로 보관, 부제목이 없으면 ""로 저장)
+ARTICLE_KEYS = {"page", "title", "url", "subtitle"}
+
+class CacheFormatError(ValueError):
+    """.nrc 파일이 아니거나 지원하지 않는 버전"""
+
+def split_url(url):
+    """URL → (앞부분, 나머지, 쿼리) - 이어 붙이면 원래 URL"""
+    base, sep, query = url.partition("?")
+    cut = base.rfind("/") + 1
+    return base[:cut], base[cut:], sep + query
+
+def _intern(table, lookup, value):
+    idx = lookup.get(value)
+    if idx is None:
+        idx = lookup[value] = len(table)
+        table.append(value)
+    return idx
+
+def _pack(value):
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), COMPRESS_LEVEL)
+
+def _unpack(data):
+    return json.loads(zlib.decompress(data))
+
+def encode(newspaper_data):
+    """지면 데이터 → .nrc 바이트"""
+    prefixes, prefix_lookup = [], {}
+    queries, query_lookup = [], {}
+    pages, blocks = [], []
+    offset = 0
+    for page in newspaper_data:
+        rows = []
+        for article in page['articles']:
+            prefix, rest, query = split_url(article['url'])
+            row = [
+                article['title'], _intern(prefixes, prefix_lookup, prefix), rest,
+                _intern(queries, query_lookup, query), article.get('subtitle', "")
+            ]
+            extra = {key: value for key, value in article.items() if key not in ARTICLE_KEYS}
+            if article.get('page', page['page']) != page['page']:
+                extra['page'] = article['page']
+            if extra:
+                row.append(extra)
+            rows.append(row)
+
+        block = _pack(rows)
+        entry = {"page": page['page'], "offset": offset, "length": len(block), "count": len(rows)}
+        page_extra = {key: value for key, value in page.items() if key not in ("page", "articles")}
+        if page_extra:
+            entry["extra"] = page_extra
+        pages.append(entry)
+        blocks.append(block)
+        offset += len(block)
+
+    header = _pack({"prefixes": prefixes, "queries": queries, "pages": pages})
+    return HEADER_STRUCT.pack(MAGIC + bytes([VERSION]), len(header)) + header + b"".join(blocks)
+
+def _decode_page(entry, rows, header):
+    prefixes, queries = header["prefixes"], header["queries"]
+    articles = []
+    for row in rows:
+        title, prefix_idx, rest, query_idx, subtitle = row[:5]
+        article = {
+            "page": entry["page"],
+            "title": title,
+            "url": prefixes[prefix_idx] + rest + queries[query_idx],
+            "subtitle": subtitle
+        }
+        if len(row) > 5:
+            article.update(row[5])
+        articles.append(article)
+    page = {"page": entry["page"], "articles": articles}
+    page.update(entry.get("extra", {}))
+    return page
+
+def read_header(f):
+    """열린 파일(바이너리)에서 머리말 읽기 → (머리말, 면 블록 시작 위치)"""
+    fixed = f.read(HEADER_STRUCT.size)
+    if len(fixed) < HEADER_STRUCT.size:
+        raise CacheFormatError("truncated header")
+    magic, length = HEADER_STRUCT.unpack(fixed)
+    if magic[:3] != MAGIC:
+        raise CacheFormatError("not a news room cache file")
+    if magic[3] != VERSION:
+        raise CacheFormatError(f"unsupported version {magic[3]}")
+    return _unpack(f.read(length)), HEADER_STRUCT.size + length
+
+def decode(data):
+    """.nrc 바이트 → 지면 데이터"""
+    header, start = read_header(io.BytesIO(data))
+    # 면마다 json.loads를 부르지 않고 풀어낸 블록을 하나의 배열로 이어 한 번에 파싱
+    blocks = [
+        zlib.decompress(data[start + entry["offset"]:start + entry["offset"] + entry["length"]])
+        for entry in header["pages"]
+    ]
+    pages_rows = json.loads(b"[" + b",".join(blocks) + b"]")
+    return [_decode_page(entry, rows, header) for entry, rows in zip(header["pages"], pages_rows)]
+
+def load(path):
+    with open(path, "rb") as f:
+        return decode(f.read())
+
+def load_page(path, page_name):
+    """한 면만 읽기 (없으면 None)"""
+    with open(path, "rb") as f:
+        header, start = read_header(f)
+        for entry in header["pages"]:
+            if entry["page"] == page_name:
+                f.seek(start + entry["offset"])
+                return _decode_page(entry, _unpack(f.read(entry["length"])), header)
+    return None
+
+def load_index(path):
+    """면 목록과 기사 수: [{"page", "count"}] (기사는 풀지 않음)"""
+    with open(path, "rb") as f:
+        header, _ = read_header(f)
+    return [{"page": entry["page"], "count": entry["count"]} for entry in header["pages"]]
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    import storage
+
+    parser = argparse.ArgumentParser(description="지면 캐시 형식 변환 (json ↔ nrc)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    convert_parser = sub.add_parser("convert", help="scraped_data의 캐시를 다른 형식으로 변환")
+    convert_parser.add_argument("--to", choices=sorted(storage.CACHE_EXTENSIONS), default="nrc")
+    convert_parser.add_argument("--start", help="시작 날짜 (YYYYMMDD)")
+    convert_parser.add_argument("--end", help="끝 날짜 (YYYYMMDD)")
+    args = parser.parse_args()
+
+    before = after = converted = 0
+    for date in storage.list_cache_dates():
+        if (args.start and date < args.start) or (args.end and date > args.end):
+            continue
+        for oid in storage.list_cached_media(date):
+            path = storage.find_cache_path(date, oid)
+            if path.endswith(storage.CACHE_EXTENSIONS[args.to]):
+                continue
+            size = os.path.getsize(path)
+            if storage.convert_news_cache(date, oid, args.to):
+                before += size
+                after += os.path.getsize(storage.get_cache_path(date, oid, args.to))
+                converted += 1
+
+    print(f"✅ {converted}개 캐시를 {args.to} 형식으로 변환: {before / 1024:,.0f}KB → {after / 1024:,.0f}KB")
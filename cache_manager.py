@@ -0,0 +1,307 @@
+"""
+지면 캐시(scraped_data) 보관 정책
+- 기본은 아무것도 삭제하지 않음: settings.json에 "cache_policy"를 설정했을 때만 적용
+- 디스크 예산: 캐시 전체 크기 max_bytes 이하, 디스크 남은 공간 min_free_bytes 이상
+- 최대 보관 기간: 지면 날짜 기준 max_age_days일 지나면 삭제
+- 언론사별 규칙: per_oid[oid] = {"max_age_days": N, "pinned": true} (pinned는 삭제하지 않음)
+- 예산을 넘으면 마지막으로 읽은 시각이 오래된 (날짜, 언론사)부터 삭제 (LRU)
+  삭제 단위는 지면 캐시 + 기사 기록 + 지면 지문 + 검색 색인의 기사, 스크래핑 중(잠금 사용 중)이거나 protect로 넘긴 항목은 건너뜀
+- 읽은 시각: storage.load_news_cache가 읽을 때마다 캐시 파일의 atime을 직접 기록 (noatime 마운트에서도 동작)
+- 검색 색인(scraped_data/search_index.db)도 디스크 예산에 포함 (삭제 대상은 아님)
+- 적중 / 실패 횟수는 캐시 폴더별로 모아서 그 폴더의 cache_stats.json에 기록
+
+정책 설정: settings.json의 "cache_policy" (없는 값은 DEFAULT_POLICY)
+사용법:
+    python cache_manager.py stats
+    python cache_manager.py enforce --dry-run
+"""
+
+import atexit
+import os
+import shutil
+import threading
+import time
+from datetime import datetime, timedelta
+import search_index
+import single_flight
+import storage
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# 제한 없음 (None) - 보관 정책은 사용자가 켜야 동작 (예: max_bytes 2GB, min_free_bytes 1GB)
+DEFAULT_POLICY = {
+    "max_bytes": None,
+    "min_free_bytes": None,
+    "max_age_days": None,
+    "per_oid": {}
+}
+
+STATS_FILE_NAME = "cache_stats.json"
+
+# 적중 / 실패 횟수를 파일에 모아 쓰는 주기 (초)
+STATS_FLUSH_INTERVAL = 30
+
+_counter_lock = threading.Lock()
+# 아직 기록하지 않은 적중 / 실패 횟수: {캐시 폴더: {"hits": n, "misses": n}}
+# (기록 시점의 storage.CACHE_DIR이 아니라 횟수를 센 폴더에 기록)
+_pending = {}
+_last_flush = time.monotonic()
+
+def get_policy(settings=None):
+    settings = settings if settings is not None else storage.load_settings()
+    policy = dict(DEFAULT_POLICY)
+    policy.update(settings.get("cache_policy") or {})
+    return policy
+
+def get_stats_path(cache_dir=None):
+    return os.path.join(cache_dir or storage.CACHE_DIR, STATS_FILE_NAME)
+
+# --- 읽기 기록 ---
+
+def record_hit(path):
+    """캐시를 읽었음: atime을 지금으로 (mtime은 유지 - 새로 저장됐는지 판단에 쓰임)"""
+    try:
+        os.utime(path, ns=(time.time_ns(), os.stat(path).st_mtime_ns))
+    except OSError:
+        pass
+    _count("hits")
+
+def record_miss():
+    _count("misses")
+
+def _count(key):
+    global _last_flush
+    with _counter_lock:
+        counts = _pending.setdefault(storage.CACHE_DIR, {"hits": 0, "misses": 0})
+        counts[key] += 1
+        due = time.monotonic() - _last_flush >= STATS_FLUSH_INTERVAL
+    if due:
+        flush_stats()
+
+def flush_stats():
+    """모아 둔 적중 / 실패 횟수를 센 캐시 폴더의 통계 파일에 더함 (폴더가 없어졌으면 버림)"""
+    global _last_flush
+    with _counter_lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _last_flush = time.monotonic()
+    for cache_dir, counts in pending.items():
+        if not any(counts.values()) or not os.path.isdir(cache_dir):
+            continue
+        path = get_stats_path(cache_dir)
+        with storage.file_lock(path):
+            stats = storage.load_json(path, {})
+            for key, value in counts.items():
+                stats[key] = stats.get(key, 0) + value
+            stats["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            storage.save_json(path, stats)
+
+atexit.register(flush_stats)
+
+# --- 캐시 목록 ---
+
+def scan():
+    """
+    캐시 항목 목록: [{"date", "oid", "files", "bytes", "accessed"}]
+    accessed: 캐시 파일의 atime (캐시 없이 부속 파일만 있으면 그중 최근 mtime)
+    """
+    entries = []
+    for date in storage.list_cache_dates():
+        date_dir = os.path.join(storage.CACHE_DIR, date)
+        groups = {}
+        for name in os.listdir(date_dir):
+            path = os.path.join(date_dir, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            oid = name.split(".", 1)[0]
+            entry = groups.setdefault(oid, {"date": date, "oid": oid, "files": [], "bytes": 0, "accessed": 0.0})
+            entry["files"].append(path)
+            entry["bytes"] += st.st_size
+            _, ext = os.path.splitext(name)
+            is_cache = name == f"{oid}{ext}" and ext in storage.CACHE_EXTENSIONS.values()
+            entry["accessed"] = max(entry["accessed"], st.st_atime if is_cache else st.st_mtime)
+        entries.extend(groups[oid] for oid in sorted(groups))
+    return entries
+
+def get_shared_bytes():
+    """날짜 폴더 밖에서 예산에 포함하는 파일 크기 (검색 색인 + SQLite WAL / SHM)"""
+    total = 0
+    for suffix in ["", "-wal", "-shm"]:
+        try:
+            total += os.path.getsize(search_index.get_index_path() + suffix)
+        except OSError:
+            pass
+    return total
+
+def get_usage(entries=None):
+    """사용량 통계: 항목 / 파일 / 바이트(검색 색인 포함) / 날짜 수, 언론사별 바이트, 적중 / 실패 횟수"""
+    entries = scan() if entries is None else entries
+    stats = storage.load_json(get_stats_path(), {})
+    with _counter_lock:
+        pending = _pending.get(storage.CACHE_DIR, {})
+        hits = stats.get("hits", 0) + pending.get("hits", 0)
+        misses = stats.get("misses", 0) + pending.get("misses", 0)
+    shared = get_shared_bytes()
+    by_oid = {}
+    for entry in entries:
+        by_oid[entry["oid"]] = by_oid.get(entry["oid"], 0) + entry["bytes"]
+    return {
+        "entries": len(entries),
+        "files": sum(len(entry["files"]) for entry in entries),
+        "bytes": sum(entry["bytes"] for entry in entries) + shared,
+        "index_bytes": shared,
+        "dates": len({entry["date"] for entry in entries}),
+        "by_oid": by_oid,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / (hits + misses) if hits + misses else None
+    }
+
+# --- 정책 적용 ---
+
+def _is_expired(entry, policy, today):
+    rule = policy["per_oid"].get(entry["oid"], {})
+    max_age_days = rule.get("max_age_days", policy["max_age_days"])
+    if max_age_days is None:
+        return False
+    try:
+        edition = datetime.strptime(entry["date"], "%Y%m%d")
+    except ValueError:
+        return False
+    return edition < today - timedelta(days=max_age_days)
+
+def _is_pinned(entry, policy):
+    return policy["per_oid"].get(entry["oid"], {}).get("pinned", False)
+
+def _is_busy(entry):
+    """스크래핑 중인지 (single_flight 잠금을 누가 잡고 있으면 True)"""
+    lock_path = single_flight.get_lock_path(entry["date"], entry["oid"])
+    if fcntl is None or not os.path.exists(lock_path):
+        return False
+    fd = os.open(lock_path, os.O_RDWR)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return False
+    except BlockingIOError:
+        return True
+    finally:
+        os.close(fd)
+
+def _free_bytes():
+    return shutil.disk_usage(storage.CACHE_DIR).free
+
+def plan(policy=None, entries=None, today=None, protect=None):
+    """
+    삭제할 항목 목록: [(항목, 이유)] - 이유는 "age" / "budget"
+    보관 기간이 지난 항목을 먼저 고르고, 남은 항목이 예산을 넘으면 오래전에 읽은 것부터 고름
+    protect: 삭제하지 않을 {(date, oid)} (방금 수집한 지면 등)
+    """
+    policy = policy or get_policy()
+    entries = scan() if entries is None else entries
+    today = today or datetime.now()
+
+    evict = []
+    remaining = []
+    protect = protect or set()
+    for entry in entries:
+        if _is_pinned(entry, policy) or (entry["date"], entry["oid"]) in protect:
+            continue
+        if _is_expired(entry, policy, today):
+            evict.append((entry, "age"))
+        else:
+            remaining.append(entry)
+
+    # 검색 색인은 지우지 않지만 디스크를 쓰므로 예산에 포함
+    total = sum(entry["bytes"] for entry in entries) - sum(entry["bytes"] for entry, _ in evict) + get_shared_bytes()
+    free = _free_bytes() + sum(entry["bytes"] for entry, _ in evict) if policy["min_free_bytes"] else None
+    for entry in sorted(remaining, key=lambda e: e["accessed"]):
+        over_budget = policy["max_bytes"] is not None and total > policy["max_bytes"]
+        low_disk = free is not None and free < policy["min_free_bytes"]
+        if not over_budget and not low_disk:
+            break
+        evict.append((entry, "budget"))
+        total -= entry["bytes"]
+        if free is not None:
+            free += entry["bytes"]
+    return evict
+
+def enforce(policy=None, dry_run=False, protect=None):
+    """
+    정책 적용 → {"evicted": [...], "skipped": [...], "freed": 바이트, "usage": 적용 후 사용량}
+    dry_run이면 삭제하지 않고 삭제할 목록만 반환, protect: 삭제하지 않을 {(date, oid)}
+    """
+    entries = scan()
+    evicted, skipped, freed = [], [], 0
+    for entry, reason in plan(policy, entries, protect=protect):
+        summary = {"date": entry["date"], "oid": entry["oid"], "bytes": entry["bytes"], "reason": reason}
+        if dry_run:
+            evicted.append(summary)
+            freed += entry["bytes"]
+            continue
+        if _is_busy(entry):
+            skipped.append(summary)
+            continue
+        for path in entry["files"]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        # 전체 검색 결과에서도 뺌 (지워진 캐시를 가리키지 않도록)
+        try:
+            search_index.remove_edition(entry["date"], entry["oid"])
+        except Exception as e:
+            print(f"[cache_manager] search index removal failed for {entry['date']}/{entry['oid']}: {e}")
+        evicted.append(summary)
+        freed += entry["bytes"]
+
+    if not dry_run:
+        # 빈 날짜 폴더 정리
+        for date in {entry["date"] for entry in evicted}:
+            date_dir = os.path.join(storage.CACHE_DIR, date)
+            try:
+                os.rmdir(date_dir)
+            except OSError:
+                pass
+        entries = scan()
+
+    evicted_keys = {(entry["date"], entry["oid"]) for entry in evicted}
+    remaining = entries if not dry_run else [e for e in entries if (e["date"], e["oid"]) not in evicted_keys]
+    return {"evicted": evicted, "skipped": skipped, "freed": freed, "dry_run": dry_run, "usage": get_usage(remaining)}
+
+def format_bytes(size):
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024 or unit == "GB":
+            return f"{size:,.0f}{unit}" if unit == "B" else f"{size:,.1f}{unit}"
+        size /= 1024
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="scraped_data 캐시 보관 정책")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="사용량 / 적중률 출력")
+    enforce_parser = sub.add_parser("enforce", help="보관 기간 / 디스크 예산 적용")
+    enforce_parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 삭제할 목록만 출력")
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        usage = get_usage()
+    else:
+        result = enforce(dry_run=args.dry_run)
+        label = "삭제 예정" if result["dry_run"] else "삭제"
+        for item in result["evicted"]:
+            print(f"  {label}: {item['date']}/{item['oid']} ({format_bytes(item['bytes'])}, {item['reason']})")
+        for item in result["skipped"]:
+            print(f"  건너뜀(스크래핑 중): {item['date']}/{item['oid']}")
+        print(f"🧹 {len(result['evicted'])}개 {label}, {format_bytes(result['freed'])} 확보")
+        usage = result["usage"]
+
+    hit_rate = f"{usage['hit_rate']:.1%}" if usage["hit_rate"] is not None else "-"
+    print(f"📦 {usage['dates']}일 / {usage['entries']}개 지면 / 파일 {usage['files']}개 / {format_bytes(usage['bytes'])}")
+    print(f"   적중 {usage['hits']} / 실패 {usage['misses']} (적중률 {hit_rate})")
@@ -0,0 +1,44 @@
+"""pytest 공용 fixture: storage를 임시 폴더로 바꾼 저장소"""
+
+import itertools
+import os
+
+import pytest
+
+import cache_manager
+import search_index
+import storage
+import storage_sqlite
+
+@pytest.fixture
+def make_storage(tmp_path, monkeypatch):
+    """
+    make_storage(backend) → storage의 스크랩 / 설정 / 폴더 파일과 캐시 디렉터리를 새 임시 폴더로 바꾸고 그 경로 반환
+    한 테스트에서 여러 번 부르면 매번 빈 저장소로 바뀜, 테스트가 끝나면 원래 경로와 캐시 적중 / 실패 횟수를 되돌림
+    """
+    numbers = itertools.count()
+    # 테스트 중 쌓인 적중 / 실패 횟수가 실제 scraped_data로 기록되지 않도록
+    monkeypatch.setattr(cache_manager, "_pending", {})
+
+    def make(backend="json"):
+        search_index.close_connections()
+        storage_sqlite.close_connections()
+        root = tmp_path / f"storage{next(numbers)}"
+        monkeypatch.setenv(storage.SCRAPS_BACKEND_ENV, backend)
+        monkeypatch.setattr(storage, "SCRAPS_FILE", str(root / "scraps.json"))
+        monkeypatch.setattr(storage, "SCRAPS_DB_FILE", str(root / "scraps.db"))
+        monkeypatch.setattr(storage, "SCRAPS_JOURNAL_FILE", str(root / "scraps.journal"))
+        monkeypatch.setattr(storage, "SETTINGS_FILE", str(root / "settings.json"))
+        monkeypatch.setattr(storage, "FOLDERS_FILE", str(root / "folders.json"))
+        monkeypatch.setattr(storage, "CACHE_DIR", str(root / "scraped_data"))
+        os.makedirs(storage.CACHE_DIR)
+        return root
+
+    yield make
+    search_index.close_connections()
+    storage_sqlite.close_connections()
+
+@pytest.fixture
+def temp_storage(make_storage):
+    """json 저장 방식의 임시 저장소 (폴더 경로)"""
+    return make_storage()
@@ -0,0 +1,204 @@
+"""
+기사 요청 동시성 / 재시도 제어
+- AdaptiveLimiter: 지연 시간과 오류율에 따라 동시 요청 수 조절 (AIMD: 가산 증가, 승산 감소)
+- HostRateLimiter: 호스트별 토큰 버킷 (초당 요청 수 제한)
+- FetchController: 위 두 가지 + 지터가 섞인 지수 백오프 재시도
+결과 상태: "ok"(부제목 있음) / "empty"(정상 응답, 부제목 없음) / "failed"(재시도 후에도 실패)
+"""
+
+import asyncio
+import random
+import time
+from urllib.parse import urlparse
+
+STATUS_OK = "ok"
+STATUS_EMPTY = "empty"
+STATUS_FAILED = "failed"
+
+# 동시 요청 수 범위
+MIN_LIMIT = 2
+MAX_LIMIT = 30
+
+# 이 시간(초)보다 느린 응답은 과부하 신호로 간주
+LATENCY_THRESHOLD = 2.5
+
+# 감소 후 다시 감소하기까지 대기 시간 (초) - 한 번의 혼잡에 연속으로 반토막 나는 것 방지
+DECREASE_COOLDOWN = 1.0
+
+# 재시도 설정
+MAX_RETRIES = 2
+BACKOFF_BASE = 0.3
+BACKOFF_MAX = 3.0
+
+# 호스트별 초당 요청 수 / 순간 허용량
+HOST_RATE = 40.0
+HOST_BURST = 20
+
+# 요청 타임아웃 범위 (초) - 관측 지연 시간에 비례
+TIMEOUT_MIN = 3.0
+TIMEOUT_MAX = 10.0
+
+class AdaptiveLimiter:
+    """
+    AIMD 동시성 제한기 (async with limiter: ...)
+    - 정상 응답이 현재 한도만큼 쌓이면 한도 +1
+    - 오류 또는 느린 응답이면 한도 x0.5 (쿨다운 적용)
+    """
+
+    def __init__(self, initial, min_limit=MIN_LIMIT, max_limit=MAX_LIMIT, latency_threshold=LATENCY_THRESHOLD):
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, initial)
+        self.limit = initial
+        self.latency_threshold = latency_threshold
+        self.in_flight = 0
+        self.successes = 0
+        self.last_decrease = 0.0
+        # 지수 이동 평균 지연 시간 (타임아웃 계산용)
+        self.avg_latency = None
+        self._condition = None
+
+    def _get_condition(self):
+        # 이벤트 루프 안에서 생성 (스레드/루프 간 공유 방지)
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def __aenter__(self):
+        condition = self._get_condition()
+        async with condition:
+            while self.in_flight >= self.limit:
+                await condition.wait()
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+    def record(self, latency, ok):
+        """요청 결과를 반영해 한도를 조정합니다."""
+        self.avg_latency = latency if self.avg_latency is None else 0.8 * self.avg_latency + 0.2 * latency
+
+        if ok and latency <= self.latency_threshold:
+            self.successes += 1
+            if self.successes >= self.limit:
+                self.successes = 0
+                self.limit = min(self.max_limit, self.limit + 1)
+            return
+
+        self.successes = 0
+        now = time.monotonic()
+        if now - self.last_decrease >= DECREASE_COOLDOWN:
+            self.last_decrease = now
+            self.limit = max(self.min_limit, int(self.limit * 0.5))
+
+    def timeout(self):
+        """관측된 평균 지연 시간의 4배 (TIMEOUT_MIN ~ TIMEOUT_MAX)"""
+        if self.avg_latency is None:
+            return TIMEOUT_MIN
+        return min(TIMEOUT_MAX, max(TIMEOUT_MIN, self.avg_latency * 4))
+
+class TokenBucket:
+    """초당 rate개, 최대 burst개까지 모아둘 수 있는 토큰 버킷"""
+
+    def __init__(self, rate=HOST_RATE, burst=HOST_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷"""
+
+    def __init__(self, rate=HOST_RATE, burst=HOST_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+
+    async def acquire(self, url):
+        host = urlparse(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.burst)
+        await self.buckets[host].acquire()
+
+def backoff_delay(attempt):
+    """지수 백오프 + full jitter"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+class FetchController:
+    """
+    여러 언론사가 공유하는 요청 제어기.
+    - async with controller: 단순히 동시 요청 슬롯만 사용 (지면 목록 등)
+    - await controller.fetch(fn, url): fn(url, timeout) 호출을 제한/재시도하고 (결과, 상태) 반환
+    - await controller.fetch(fn, url, lease): 자원(페이지 등)을 먼저 빌린 뒤 슬롯을 잡음 (대기 시간은 지연 시간에서 제외)
+    """
+
+    def __init__(self, initial_limit, max_retries=MAX_RETRIES, min_limit=MIN_LIMIT, max_limit=MAX_LIMIT):
+        self.limiter = AdaptiveLimiter(initial_limit, min_limit, max_limit)
+        self.rate_limiter = HostRateLimiter()
+        self.max_retries = max_retries
+        self.stats = {STATUS_OK: 0, STATUS_EMPTY: 0, STATUS_FAILED: 0, "retries": 0}
+
+    @property
+    def max_limit(self):
+        return self.limiter.max_limit
+
+    async def __aenter__(self):
+        await self.limiter.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.limiter.__aexit__(exc_type, exc, tb)
+
+    async def fetch(self, fn, url, lease=None):
+        """
+        fn(url, timeout)은 부제목 문자열을 반환하거나 실패 시 예외를 던져야 합니다.
+        lease: 요청 슬롯보다 먼저 빌릴 자원 (예: 페이지 풀의 lease), 주면 fn(url, timeout, 자원)으로 호출
+               자원을 기다리는 시간은 지연 시간에 포함하지 않고, 실패한 시도의 예외는 lease에도 전달
+        Returns: (subtitle, status)
+        """
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                self.stats["retries"] += 1
+                await asyncio.sleep(backoff_delay(attempt - 1))
+
+            try:
+                if lease is None:
+                    subtitle = await self._attempt(fn, url)
+                else:
+                    async with lease() as resource:
+                        subtitle = await self._attempt(lambda u, timeout: fn(u, timeout, resource), url)
+            except Exception:
+                continue
+
+            status = STATUS_OK if subtitle else STATUS_EMPTY
+            self.stats[status] += 1
+            return subtitle, status
+
+        self.stats[STATUS_FAILED] += 1
+        return "", STATUS_FAILED
+
+    async def _attempt(self, fn, url):
+        """속도 제한 + 요청 슬롯 안에서 한 번 호출 (슬롯을 잡은 뒤의 시간만 지연 시간으로 기록)"""
+        await self.rate_limiter.acquire(url)
+        async with self.limiter:
+            start = time.monotonic()
+            try:
+                subtitle = await fn(url, self.limiter.timeout())
+            except Exception:
+                self.limiter.record(time.monotonic() - start, ok=False)
+                raise
+            self.limiter.record(time.monotonic() - start, ok=True)
+        return subtitle
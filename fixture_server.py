@@ -0,0 +1,305 @@
+"""
+녹화/재생 픽스처 서버 (네트워크 없이 재현 가능한 스크래퍼 벤치마크용)
+- record: 실제 네이버에서 지면 목록 + 기사 응답을 받아 픽스처 아카이브(.json.gz)로 저장
+- build: 네트워크 없이 scraped_data 캐시로 지면 목록 / 기사 HTML을 만들어 아카이브 생성
+- serve: 아카이브를 로컬 HTTP 서버로 재생 (지연 시간, 지터, 오류 주입)
+
+스크래퍼는 news_parser의 NEWSROOM_MEDIA_BASE_URL / NEWSROOM_ARTICLE_BASE_URL 환경 변수로
+로컬 서버를 바라보게 합니다.
+
+사용법:
+    python fixture_server.py record --date 20260130 --media 023,025 --out fixtures/20260130.json.gz
+    python fixture_server.py build --date 20260130 --out fixtures/20260130.json.gz
+    python fixture_server.py serve fixtures/20260130.json.gz --port 8765 --latency 80 --jitter 40 --error-rate 0.02
+    NEWSROOM_MEDIA_BASE_URL=http://127.0.0.1:8765 NEWSROOM_ARTICLE_BASE_URL=http://127.0.0.1:8765 python benchmark_scraper.py
+"""
+
+import argparse
+import gzip
+import html
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+import news_parser
+import storage
+
+ARCHIVE_VERSION = 1
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# build 모드에서 기사 HTML 크기 (실제 기사 페이지처럼 부제목 뒤에 본문을 채움)
+DEFAULT_ARTICLE_SIZE = 60000
+
+HTML_CONTENT_TYPE = "text/html; charset=utf-8"
+
+def url_key(url):
+    """아카이브 키: 경로 + 쿼리 (호스트 제외 → 지면 목록과 기사를 한 서버에서 재생)"""
+    parts = urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+# --- 아카이브 ---
+# {"version", "created_at", "source": "record"|"build", "date", "media": [oid, ...],
+#  "responses": {키: {"status", "content_type", "body"}}}
+
+def new_archive(source, date, oids):
+    return {
+        "version": ARCHIVE_VERSION,
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "source": source,
+        "date": date,
+        "media": list(oids),
+        "responses": {}
+    }
+
+def save_archive(path, archive):
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(archive, f, ensure_ascii=False)
+
+def load_archive(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        archive = json.load(f)
+    if archive.get("version") != ARCHIVE_VERSION:
+        raise ValueError(f"지원하지 않는 아카이브 버전: {archive.get('version')}")
+    return archive
+
+def add_response(archive, url, status, body, content_type=HTML_CONTENT_TYPE):
+    archive["responses"][url_key(url)] = {"status": status, "content_type": content_type, "body": body}
+
+# --- record: 실제 응답 녹화 ---
+
+async def record_archive(date, oids):
+    """지면 목록과 모든 기사 페이지를 받아 아카이브로 만듭니다. (실패한 기사는 상태 코드만 기록)"""
+    import asyncio
+    import scraper_httpx
+
+    archive = new_archive("record", date, oids)
+    async with scraper_httpx.create_client() as client:
+        sem = asyncio.Semaphore(scraper_httpx.SEM_LIMIT)
+
+        async def record(url):
+            async with sem:
+                try:
+                    response = await client.get(url, timeout=scraper_httpx.INDEX_TIMEOUT)
+                except Exception as e:
+                    print(f"  ❌ {url}: {e}")
+                    return
+                add_response(archive, url, response.status_code, response.text,
+                             response.headers.get("content-type", HTML_CONTENT_TYPE))
+
+        for oid in oids:
+            url = news_parser.build_index_url(oid, date)
+            await record(url)
+            entry = archive["responses"].get(url_key(url))
+            if not entry or entry["status"] != 200:
+                print(f"[{oid}] 지면 목록을 받지 못했습니다.")
+                continue
+
+            newspaper_data = news_parser.parse_newspaper_index(entry["body"])
+            articles = list(news_parser.iter_articles(newspaper_data))
+            print(f"[{oid}] {len(articles)}개 기사 녹화 중...")
+            await asyncio.gather(*(record(article['url']) for article in articles))
+
+    return archive
+
+# --- build: 캐시에서 아카이브 생성 (네트워크 불필요) ---
+
+def render_index_html(newspaper_data):
+    """지면 목록 HTML (news_parser.parse_newspaper_index가 읽는 구조)"""
+    sections = []
+    for page in newspaper_data:
+        items = "".join(
+            f'<li><a href="{html.escape(article["url"])}" class="newspaper_article">'
+            f'<strong>{html.escape(article["title"])}</strong></a></li>'
+            for article in page['articles']
+        )
+        sections.append(
+            f'<div class="newspaper_inner"><div class="newspaper_head">'
+            f'<span class="page_notation">{html.escape(page["page"])}</span></div>'
+            f'<ul class="newspaper_article_lst">{items}</ul></div>'
+        )
+    if not sections:
+        # 발행 없음 안내 (스크래퍼가 빈 지면으로 판단하는 문구)
+        sections.append(f'<p class="newspaper_empty">{news_parser.NO_EDITION_TEXTS[0]}</p>')
+    return f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>신문 보기</title></head><body>{"".join(sections)}</body></html>'
+
+def render_article_html(article, size=DEFAULT_ARTICLE_SIZE):
+    """기사 상세 HTML (부제목이 있으면 media_end_head_subheadline, 뒤에 본문을 size까지 채움)"""
+    title = html.escape(article['title'])
+    subtitle = f'<div class="media_end_head_subheadline">{html.escape(article["subtitle"])}</div>' if article.get('subtitle') else ""
+    head = (
+        f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{title}</title></head><body>'
+        f'<div class="media_end_head"><h2 class="media_end_head_headline">{title}</h2></div>{subtitle}'
+        f'<div id="newsct_article"><article id="dic_area">'
+    )
+    paragraph = f"<p>{title} 본문 내용입니다.</p>"
+    body = paragraph * max(0, (size - len(head)) // len(paragraph))
+    return f"{head}{body}</article></div></body></html>"
+
+def build_archive(date, oids=None, article_size=DEFAULT_ARTICLE_SIZE):
+    """scraped_data/{date}의 캐시로 아카이브를 만듭니다. (oids가 없으면 캐시된 모든 언론사)"""
+    if oids is None:
+        oids = storage.list_cached_media(date)
+
+    archive = new_archive("build", date, [])
+    for oid in oids:
+        newspaper_data = storage.load_news_cache(date, oid)
+        if not newspaper_data:
+            print(f"[{oid}] 캐시 없음, 건너뜀")
+            continue
+
+        archive["media"].append(oid)
+        add_response(archive, news_parser.build_index_url(oid, date), 200, render_index_html(newspaper_data))
+        for article in news_parser.iter_articles(newspaper_data):
+            add_response(archive, article['url'], 200, render_article_html(article, article_size))
+    return archive
+
+# --- serve: 재생 서버 ---
+
+class FixtureServer(ThreadingHTTPServer):
+    """
+    아카이브 재생 서버
+    latency / jitter: 응답 전 대기 시간 (초, latency ± jitter 균등 분포)
+    error_rate: 이 확률로 503 응답 (seed로 재현 가능)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, archive, host=DEFAULT_HOST, port=DEFAULT_PORT, latency=0.0, jitter=0.0, error_rate=0.0, seed=None, quiet=True):
+        super().__init__((host, port), FixtureHandler)
+        self.responses = archive["responses"]
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.quiet = quiet
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+        self.stats = {"requests": 0, "served": 0, "missing": 0, "injected_errors": 0}
+        self.stats_lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def plan_response(self):
+        """(대기 시간, 오류 주입 여부) - 요청 순서대로 같은 난수열 사용"""
+        with self.random_lock:
+            delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+            inject_error = self.random.random() < self.error_rate
+        return delay, inject_error
+
+    def count(self, key):
+        with self.stats_lock:
+            self.stats[key] += 1
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.count("requests")
+        delay, inject_error = server.plan_response()
+        if delay:
+            time.sleep(delay)
+
+        entry = server.responses.get(self.path)
+        if inject_error:
+            server.count("injected_errors")
+            self.send_body(503, b"injected error", "text/plain")
+        elif entry is None:
+            server.count("missing")
+            self.send_body(404, b"not in archive", "text/plain")
+        else:
+            server.count("served")
+            self.send_body(entry["status"], entry["body"].encode("utf-8"), entry["content_type"])
+
+    def send_body(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+def start_server(archive, **options):
+    """백그라운드 스레드로 서버 시작 → FixtureServer (server.base_url, 끝나면 stop_server)"""
+    server = FixtureServer(archive, **options)
+    thread = threading.Thread(target=server.serve_forever, name="fixture-server", daemon=True)
+    thread.start()
+    return server
+
+def stop_server(server):
+    server.shutdown()
+    server.server_close()
+
+def use_server(server):
+    """현재 프로세스의 스크래퍼가 서버를 바라보도록 환경 변수 설정 (자식 프로세스에도 상속)"""
+    os.environ[news_parser.MEDIA_BASE_URL_ENV] = server.base_url
+    os.environ[news_parser.ARTICLE_BASE_URL_ENV] = server.base_url
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화/재생 픽스처 서버")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = sub.add_parser("record", help="실제 응답을 녹화")
+    record_parser.add_argument("--date", required=True, help="날짜 (YYYYMMDD)")
+    record_parser.add_argument("--media", help="언론사 OID 목록 (쉼표 구분, 기본: settings.json)")
+    record_parser.add_argument("--out", required=True, help="아카이브 경로 (.json.gz)")
+
+    build_parser = sub.add_parser("build", help="scraped_data 캐시로 아카이브 생성")
+    build_parser.add_argument("--date", required=True, help="날짜 (YYYYMMDD)")
+    build_parser.add_argument("--media", help="언론사 OID 목록 (쉼표 구분, 기본: 캐시된 전체)")
+    build_parser.add_argument("--article-size", type=int, default=DEFAULT_ARTICLE_SIZE, help="기사 HTML 크기 (바이트)")
+    build_parser.add_argument("--out", required=True, help="아카이브 경로 (.json.gz)")
+
+    serve_parser = sub.add_parser("serve", help="아카이브 재생")
+    serve_parser.add_argument("archive", help="아카이브 경로 (.json.gz)")
+    serve_parser.add_argument("--host", default=DEFAULT_HOST)
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve_parser.add_argument("--latency", type=float, default=0, help="응답 지연 (ms)")
+    serve_parser.add_argument("--jitter", type=float, default=0, help="지연 편차 (ms)")
+    serve_parser.add_argument("--error-rate", type=float, default=0, help="503 응답 확률 (0~1)")
+    serve_parser.add_argument("--seed", type=int, default=0, help="지터 / 오류 주입 난수 시드")
+    serve_parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+
+    args = parser.parse_args()
+    media = [oid.strip() for oid in args.media.split(",") if oid.strip()] if getattr(args, "media", None) else None
+
+    if args.command == "record":
+        import asyncio
+        oids = media or [m['oid'] for m in storage.load_settings().get("media_list", [])]
+        archive = asyncio.run(record_archive(args.date, oids))
+        save_archive(args.out, archive)
+        print(f"✅ {len(archive['responses'])}개 응답 저장: {args.out}")
+    elif args.command == "build":
+        archive = build_archive(args.date, media, args.article_size)
+        save_archive(args.out, archive)
+        print(f"✅ {len(archive['media'])}개 언론사, {len(archive['responses'])}개 응답 저장: {args.out}")
+    else:
+        archive = load_archive(args.archive)
+        server = FixtureServer(archive, args.host, args.port, args.latency / 1000, args.jitter / 1000,
+                               args.error_rate, args.seed, quiet=not args.verbose)
+        print(f"▶️ {server.base_url} ({archive['date']}, {len(archive['responses'])}개 응답)")
+        print(f"   {news_parser.MEDIA_BASE_URL_ENV}={server.base_url} {news_parser.ARTICLE_BASE_URL_ENV}={server.base_url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            print(f"⏹️ {server.stats}")
+
+if __name__ == "__main__":
+    main()
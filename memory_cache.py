@@ -0,0 +1,137 @@
+"""
+프로세스 전역 지면 메모리 캐시 (LRU, 바이트 예산)
+- storage.load_news_cache 앞단: 같은 지면을 여러 세션 / 탭이 읽어도 디스크 읽기와 JSON 파싱은 한 번
+- 파일 크기 / mtime / inode로 검증 (다른 프로세스가 캐시를 새로 저장하면 다시 읽음)
+- storage.save_news_cache가 저장한 내용으로 바로 갱신
+- 예산(바이트)을 넘으면 가장 오래전에 쓴 지면부터 버림
+- 반환값은 복사본 (호출한 쪽이 기사 dict를 고쳐도 캐시는 그대로)
+
+예산: 환경 변수 NEWSROOM_MEMORY_CACHE_BYTES (기본 64MB, 0이면 사용 안 함)
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+MEMORY_CACHE_BYTES_ENV = "NEWSROOM_MEMORY_CACHE_BYTES"
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+# 기사 1건의 dict / 문자열 객체 오버헤드 추정값 (바이트)
+ARTICLE_OVERHEAD = 600
+
+def file_signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (path, st.st_size, st.st_mtime_ns, st.st_ino)
+
+def estimate_size(newspaper_data):
+    """지면 데이터의 대략적인 메모리 크기 (문자열 길이 합 + 기사당 오버헤드)"""
+    size = 0
+    for page in newspaper_data:
+        size += 200 + len(page['page'])
+        for article in page['articles']:
+            size += ARTICLE_OVERHEAD + sum(len(value) for value in article.values() if isinstance(value, str))
+    return size
+
+def copy_edition(newspaper_data):
+    return [dict(page, articles=[dict(article) for article in page['articles']]) for page in newspaper_data]
+
+class ByteLRU:
+    """{key: (signature, 값, 크기)} - 크기 합이 budget 이하가 되도록 오래된 것부터 버림"""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def get(self, key, signature):
+        """signature가 같을 때만 값 반환 (다르면 버리고 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] != signature:
+                self._remove(key)
+                self.invalidations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, signature, value, size):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.budget:
+                return
+            self._entries[key] = (signature, value, size)
+            self._bytes += size
+            while self._bytes > self.budget:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def discard(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def _remove(self, key):
+        self._bytes -= self._entries.pop(key)[2]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "budget": self.budget,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else None
+            }
+
+def get_budget():
+    value = os.environ.get(MEMORY_CACHE_BYTES_ENV)
+    if value is not None and value.strip():
+        return max(0, int(value))
+    return DEFAULT_BUDGET
+
+news_cache = ByteLRU(get_budget())
+
+# --- storage에서 쓰는 함수 ---
+
+def get_edition(date, oid, signature):
+    """메모리에 있는 지면 복사본 (없거나 파일이 바뀌었으면 None)"""
+    if news_cache.budget == 0:
+        return None
+    data = news_cache.get((date, oid), signature)
+    return copy_edition(data) if data is not None else None
+
+def put_edition(date, oid, signature, newspaper_data):
+    """
+    읽거나 저장한 지면을 메모리에 보관 (넘겨준 데이터는 복사해서 보관)
+    signature는 파일을 읽기 전에 구한 값 (읽는 도중 바뀌었으면 다음 조회에서 다시 읽음)
+    """
+    if news_cache.budget == 0 or newspaper_data is None or signature is None:
+        return
+    news_cache.put((date, oid), signature, copy_edition(newspaper_data), estimate_size(newspaper_data))
+
+def discard_edition(date, oid):
+    news_cache.discard((date, oid))
+
+def stats():
+    return news_cache.stats()
@@ -0,0 +1,138 @@
+"""
+네이버 신문 지면 HTML 파서
+- 지면 목록 페이지(media.naver.com/press/{oid}/newspaper) 파싱
+- 기사 상세 페이지 부제목 파싱
+Playwright / httpx 스크래퍼가 같은 결과 구조를 만들도록 공통으로 사용합니다.
+"""
+
+import hashlib
+import os
+from urllib.parse import urlsplit
+from bs4 import BeautifulSoup
+
+MEDIA_BASE_URL = "https://media.naver.com"
+
+# 요청 대상 변경 (오프라인 벤치마크용 fixture_server 등)
+# 예: NEWSROOM_MEDIA_BASE_URL=http://127.0.0.1:8765 NEWSROOM_ARTICLE_BASE_URL=http://127.0.0.1:8765
+MEDIA_BASE_URL_ENV = "NEWSROOM_MEDIA_BASE_URL"
+ARTICLE_BASE_URL_ENV = "NEWSROOM_ARTICLE_BASE_URL"
+
+def get_media_base_url():
+    return os.environ.get(MEDIA_BASE_URL_ENV) or MEDIA_BASE_URL
+
+def build_index_url(oid, date):
+    """지면 목록 페이지 URL"""
+    return f"{get_media_base_url()}/press/{oid}/newspaper?date={date}"
+
+def resolve_article_url(url):
+    """
+    실제 요청할 기사 URL (NEWSROOM_ARTICLE_BASE_URL이 있으면 호스트만 바꿈)
+    캐시 / 기사 기록에는 원래 URL을 저장합니다.
+    """
+    base_url = os.environ.get(ARTICLE_BASE_URL_ENV)
+    if not base_url:
+        return url
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    return base_url.rstrip("/") + path
+
+# 발행 없는 날짜의 지면 목록 페이지 안내 문구 (지면 대신 표시됨)
+NO_EDITION_TEXTS = ("발행된 지면이 없습니다", "지면 정보가 없습니다", "해당 날짜의 지면이 없습니다")
+
+class NoEdition(list):
+    """발행 없음 안내를 확인한 빈 지면 (빈 리스트처럼 쓰이고, backfill 등은 isinstance로 일반 빈 결과와 구분)"""
+
+def is_no_edition_page(content):
+    """지면 목록 페이지가 '발행 없음' 안내를 표시하는지 (지면이 있거나 다른 페이지면 False)"""
+    soup = BeautifulSoup(content, 'html.parser')
+    if soup.select_one('div.newspaper_inner'):
+        return False
+    text = soup.get_text(" ", strip=True)
+    return any(marker in text for marker in NO_EDITION_TEXTS)
+
+def parse_newspaper_index(content):
+    """
+    지면 목록 HTML을 면(page) 단위 리스트로 변환합니다.
+    Returns: [{"page": "A1면", "articles": [{"page", "title", "url", "subtitle"}, ...]}, ...]
+    (부제목은 빈 문자열로 채워지며 스크래퍼가 나중에 채웁니다)
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+    page_sections = soup.select('div.newspaper_inner')
+
+    newspaper_data = []
+    for section in page_sections:
+        page_name_elem = section.select_one('span.page_notation')
+        if not page_name_elem:
+            continue
+
+        page_name = page_name_elem.get_text(strip=True)
+
+        articles = []
+        article_elems = section.select('ul.newspaper_article_lst > li > a')
+
+        for a in article_elems:
+            title_elem = a.select_one('strong')
+            if not title_elem:
+                continue
+
+            articles.append({
+                "page": page_name,
+                "title": title_elem.get_text(strip=True),
+                "url": a['href'],
+                "subtitle": ""
+            })
+
+        if articles:
+            newspaper_data.append({
+                "page": page_name,
+                "articles": articles
+            })
+
+    return newspaper_data
+
+def parse_article_subtitle(content):
+    """기사 상세 HTML에서 부제목을 추출합니다. (없으면 빈 문자열)"""
+    soup = BeautifulSoup(content, 'html.parser')
+
+    subtitle = ""
+    # 1. Standard Subtitle
+    sub_elem = soup.select_one('div.media_end_head_subheadline')
+    if sub_elem:
+        subtitle = sub_elem.get_text(strip=True)
+
+    # 2. Summary
+    if not subtitle:
+        summary_elem = soup.select_one('strong.media_end_summary')
+        if summary_elem:
+            subtitle = summary_elem.get_text(strip=True)
+
+        if not subtitle:
+            summary_div = soup.select_one('div.media_end_summary')
+            if summary_div:
+                subtitle = summary_div.get_text(strip=True)
+
+    # 3. Guide
+    if not subtitle:
+        guide_elem = soup.select_one('div.media_end_head_guide')
+        if guide_elem:
+            subtitle = guide_elem.get_text(strip=True)
+
+    return subtitle
+
+def iter_articles(newspaper_data):
+    """면 구조를 펼쳐 기사 dict를 순서대로 돌려줍니다."""
+    for page in newspaper_data:
+        for article in page['articles']:
+            yield article
+
+def fingerprint_newspaper_index(newspaper_data):
+    """
+    면별 지문 (변경 감지용): {"A1면": sha1(면 이름 + 기사 URL/제목 순서), ...}
+    부제목은 포함하지 않으므로 지면 목록만으로 계산할 수 있습니다.
+    """
+    hashers = {}
+    for page in newspaper_data:
+        hasher = hashers.setdefault(page['page'], hashlib.sha1(page['page'].encode("utf-8")))
+        for article in page['articles']:
+            hasher.update(b"\0" + article['url'].encode("utf-8") + b"\0" + article['title'].encode("utf-8"))
+    return {name: hasher.hexdigest() for name, hasher in hashers.items()}
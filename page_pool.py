@@ -0,0 +1,110 @@
+"""
+Playwright 페이지 풀 (대여/반납)
+- 진행 중인 요청마다 페이지를 독점 사용 (같은 페이지에 동시에 goto 하지 않음)
+- 반납 시 상태 확인: 닫힌 페이지는 버리고, 오류가 난 페이지는 about:blank로 초기화
+- 최대 크기는 동시 요청 한도에 맞춤 (필요할 때만 생성)
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+# 오류 후 페이지 초기화 타임아웃 (ms)
+RESET_TIMEOUT = 2000
+
+class PagePool:
+    """컨텍스트 하나에 속한 페이지 풀"""
+
+    def __init__(self, context, size):
+        self.context = context
+        self.size = size
+        self.idle = []
+        self.created = 0
+        self.closed = False
+        self._condition = None
+
+    def _get_condition(self):
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self):
+        """페이지 대여 (유휴 페이지가 없고 풀이 가득 차면 반납될 때까지 대기, 닫힌 풀이면 RuntimeError)"""
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                # 닫히는 컨텍스트에 새 페이지를 열지 않음 (기다리던 요청도 깨워서 실패 처리)
+                if self.closed:
+                    raise RuntimeError("Page pool is closed")
+                while self.idle:
+                    page = self.idle.pop()
+                    if not page.is_closed():
+                        return page
+                    # 닫힌 페이지 (크래시 등) 제거
+                    self.created -= 1
+                if self.created < self.size:
+                    self.created += 1
+                    break
+                await condition.wait()
+
+        try:
+            return await self.context.new_page()
+        except Exception:
+            async with condition:
+                self.created -= 1
+                condition.notify()
+            raise
+
+    async def release(self, page, healthy=True):
+        """페이지 반납 (오류가 있었으면 초기화 후 반납, 실패 시 폐기)"""
+        if not healthy and not page.is_closed():
+            try:
+                await page.goto("about:blank", timeout=RESET_TIMEOUT)
+            except Exception:
+                await self._discard(page)
+                return
+
+        condition = self._get_condition()
+        async with condition:
+            if page.is_closed():
+                self.created -= 1
+            elif self.closed:
+                self.created -= 1
+                await close_page(page)
+            else:
+                self.idle.append(page)
+            condition.notify()
+
+    async def _discard(self, page):
+        await close_page(page)
+        condition = self._get_condition()
+        async with condition:
+            self.created -= 1
+            condition.notify()
+
+    @asynccontextmanager
+    async def lease(self):
+        """async with pool.lease() as page: ... (예외 발생 시 페이지 초기화)"""
+        page = await self.acquire()
+        healthy = False
+        try:
+            yield page
+            healthy = True
+        finally:
+            await self.release(page, healthy)
+
+    async def close(self):
+        """유휴 페이지를 모두 닫음 (대여 중인 페이지는 반납 시 닫힘, 이후 대여는 실패)"""
+        condition = self._get_condition()
+        async with condition:
+            self.closed = True
+            idle, self.idle = self.idle, []
+            self.created -= len(idle)
+            condition.notify_all()
+        for page in idle:
+            await close_page(page)
+
+async def close_page(page):
+    try:
+        await page.close()
+    except Exception:
+        pass
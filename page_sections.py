@@ -0,0 +1,68 @@
+"""
+지면 면(page) 묶기 (뉴스룸 화면의 "면 선택" 버튼용)
+- 면 이름의 섹션 문자(A, B, E, S 등)로 그룹화
+- 섹션 안에서 면 번호 순 정렬 후 10면 단위 청크로 나눔 (A1-10, A11-20, ...)
+"""
+
+import re
+from collections import defaultdict
+
+SECTION_PATTERN = re.compile(r'^([A-Z]+)')
+PAGE_NUMBER_PATTERN = re.compile(r'(\d+)')
+
+# 청크당 면 수
+CHUNK_PAGES = 10
+
+# 면 번호가 없을 때 정렬 순서 (맨 뒤)
+UNKNOWN_PAGE_NUMBER = 999
+
+def get_page_number(page_data):
+    """면 이름의 첫 번호 (없으면 999)"""
+    match = PAGE_NUMBER_PATTERN.search(page_data['page'])
+    if match:
+        return int(match.group(1))
+    return UNKNOWN_PAGE_NUMBER
+
+def group_pages_by_section(newspaper_data):
+    """{섹션: [면, ...]} (섹션 안은 면 번호 순, 섹션 문자가 없는 면은 제외)"""
+    section_pages = defaultdict(list)
+    for page_data in newspaper_data:
+        section_match = SECTION_PATTERN.search(page_data['page'])
+        if section_match:
+            section_pages[section_match.group(1)].append(page_data)
+
+    for section in section_pages:
+        section_pages[section].sort(key=get_page_number)
+    return section_pages
+
+def build_section_chunks(newspaper_data, chunk_pages=CHUNK_PAGES):
+    """
+    섹션(알파벳 순) → 면 번호 범위별 청크 목록
+    Returns: [{"section", "start", "end", "pages", "label", "size"}, ...]
+    """
+    section_pages = group_pages_by_section(newspaper_data)
+
+    section_chunks = []
+    for section in sorted(section_pages.keys()):
+        # 페이지 번호를 chunk_pages 단위로 그룹화 (1-10=0, 11-20=1, 21-30=2, ...)
+        range_groups = defaultdict(list)
+        for page_data in section_pages[section]:
+            range_idx = (get_page_number(page_data) - 1) // chunk_pages
+            range_groups[range_idx].append(page_data)
+
+        for range_idx in sorted(range_groups.keys()):
+            chunk = range_groups[range_idx]
+
+            # 범위 레이블 (1-10, 11-20, 21-30, ...)
+            range_start = range_idx * chunk_pages + 1
+            range_end = (range_idx + 1) * chunk_pages
+
+            section_chunks.append({
+                'section': section,
+                'start': get_page_number(chunk[0]),
+                'end': get_page_number(chunk[-1]),
+                'pages': chunk,
+                'label': f"{section}{range_start}-{range_end}",
+                'size': len(chunk)
+            })
+    return section_chunks
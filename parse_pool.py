@@ -0,0 +1,88 @@
+"""
+HTML 파싱 작업자 풀
+- 지면 목록 / 부제목 파싱을 이벤트 루프 밖(작업자 프로세스)에서 실행 → 진행 중인 다른 요청이 멈추지 않음
+- HTML 문자열을 넘기고 결과(면 구조 / 부제목 문자열)만 돌려받음
+- 프로세스 전역으로 한 번 만들어 재사용 (스크래핑마다 새로 만들지 않음)
+- GIL 없는 파이썬(free-threaded)에서는 프로세스 대신 스레드 풀 사용
+
+작업자 수: 환경 변수 NEWSROOM_PARSE_WORKERS (0이면 풀 없이 이벤트 루프에서 바로 파싱)
+기본값은 CPU 수 - 1 (최대 4, 단일 코어면 0)
+작업자 프로세스는 spawn으로 시작하므로 실행 스크립트에 if __name__ == "__main__": 가드가 필요합니다.
+"""
+
+import asyncio
+import atexit
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import news_parser
+import subtitle_extractor
+
+PARSE_WORKERS_ENV = "NEWSROOM_PARSE_WORKERS"
+MAX_DEFAULT_WORKERS = 4
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def gil_enabled():
+    # Python 3.13+ free-threaded 빌드에서만 False
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+def get_worker_count():
+    value = os.environ.get(PARSE_WORKERS_ENV)
+    if value is not None and value.strip():
+        return max(0, int(value))
+    return max(0, min(MAX_DEFAULT_WORKERS, (os.cpu_count() or 1) - 1))
+
+def get_executor():
+    """공유 풀 (작업자 수가 0이면 None)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = get_worker_count()
+            if workers == 0:
+                return None
+            if gil_enabled():
+                # spawn: 브라우저 서비스 등 스레드가 있는 프로세스에서 fork하지 않음
+                _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            else:
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parse")
+        return _executor
+
+def shutdown():
+    """풀 종료 (다음 호출 시 다시 생성)"""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+atexit.register(shutdown)
+
+async def run(fn, content):
+    """fn(content)를 풀에서 실행 (풀이 없거나 깨졌으면 현재 스레드에서 실행)"""
+    executor = get_executor()
+    if executor is None:
+        return fn(content)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, fn, content)
+    except BrokenProcessPool:
+        # 작업자가 죽은 경우 (메모리 부족 등) 풀을 버리고 이번 요청은 직접 처리
+        print("[parse_pool] Worker pool broken. Recreating on next use.")
+        shutdown()
+        return fn(content)
+
+async def parse_newspaper_index(content):
+    """news_parser.parse_newspaper_index를 풀에서 실행"""
+    return await run(news_parser.parse_newspaper_index, content)
+
+async def is_no_edition_page(content):
+    """news_parser.is_no_edition_page를 풀에서 실행"""
+    return await run(news_parser.is_no_edition_page, content)
+
+async def extract_subtitle(content):
+    """subtitle_extractor.extract_subtitle을 풀에서 실행"""
+    return await run(subtitle_extractor.extract_subtitle, content)
@@ -0,0 +1,163 @@
+"""
+아침 사전 수집(prefetch) 워커
+- 설정된 시각마다 오늘 자 지면을 settings.json의 모든 언론사에 대해 스크래핑
+- 오전 중 여러 번 다시 확인 (지면 수정 반영, 새 기사 / 바뀐 기사만 가져옴)
+- 결과는 storage.save_news_cache로 저장 → 앱은 항상 캐시에서 로드
+- 실행 상태(마지막 실행, 소요 시간, 언론사별 실패)를 prefetch_status.json에 기록
+- 단계별 소요 시간은 prefetch_metrics.prom (Prometheus) / prefetch_report.json으로 내보냄
+- 수집 후 캐시 보관 정책(cache_manager, 설정한 경우만) 적용 → 디스크 예산 / 보관 기간 초과분 삭제
+  (이번 실행에서 수집한 지면은 삭제하지 않음)
+
+사용법:
+    python prefetch_worker.py              # 스케줄에 따라 계속 실행
+    python prefetch_worker.py --once       # 지금 한 번만 실행
+    python prefetch_worker.py --status     # 마지막 실행 상태 출력
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+import cache_manager
+import scrape_metrics
+import storage
+
+STATUS_FILE = "prefetch_status.json"
+METRICS_FILE = "prefetch_metrics.prom"
+REPORT_FILE = "prefetch_report.json"
+
+# 수집 시각 (settings.json의 "prefetch_times"로 변경 가능)
+DEFAULT_PREFETCH_TIMES = ["05:30", "06:30", "07:30", "09:00"]
+
+def get_prefetch_times():
+    settings = storage.load_settings()
+    times = settings.get("prefetch_times") or DEFAULT_PREFETCH_TIMES
+    return sorted(times)
+
+def next_run_time(now, times):
+    """now 이후의 가장 가까운 수집 시각 (일요일은 신문 미발행이므로 건너뜀)"""
+    day = now.replace(second=0, microsecond=0)
+    for offset in range(8):
+        candidate_day = day + timedelta(days=offset)
+        if candidate_day.weekday() == 6:
+            continue
+        for t in times:
+            hour, minute = map(int, t.split(":"))
+            candidate = candidate_day.replace(hour=hour, minute=minute)
+            if candidate > now:
+                return candidate
+    return None
+
+def load_status():
+    return storage.load_json(STATUS_FILE, {"last_run": None, "next_run": None, "media": {}})
+
+def save_status(status):
+    storage.save_json(STATUS_FILE, status)
+
+def run_prefetch(engine="playwright", trigger="schedule"):
+    """오늘 자 지면을 모든 언론사에 대해 수집하고 상태 파일을 갱신합니다."""
+    import scraper_optimized
+
+    media_list = storage.load_settings().get("media_list", [])
+    date_str = datetime.now().strftime("%Y%m%d")
+    started_at = datetime.now()
+
+    print(f"[prefetch] {started_at.strftime('%H:%M:%S')} {date_str} 수집 시작 ({len(media_list)}개 언론사)")
+    # 이번 실행분만 기록 (리포트 / Prometheus 파일은 실행마다 새로 씀)
+    scrape_metrics.reset()
+    start = time.time()
+    # 캐시가 있으면 새 기사 / 바뀐 기사만 가져옴 (증분 새로고침)
+    results = asyncio.run(scraper_optimized.scrape_multiple_media(media_list, date_str, force_refresh=True, engine=engine))
+    duration = time.time() - start
+
+    status = load_status()
+    failures = 0
+    for media in media_list:
+        oid = media['oid']
+        result = results[oid]
+        data = result['data']
+        entry = status["media"].get(oid, {})
+        entry.update({
+            "name": media.get('name', oid),
+            "last_attempt": started_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "date": date_str,
+            "elapsed": round(result['elapsed'], 2),
+            "articles": sum(len(page['articles']) for page in data) if data else 0,
+            "failed_subtitles": result['subtitles']['failed'],
+            "error": result['error']
+        })
+        if result['error']:
+            failures += 1
+        else:
+            entry["last_success"] = entry["last_attempt"]
+        status["media"][oid] = entry
+
+    status["last_run"] = {
+        "started_at": started_at.strftime("%Y-%m-%d %H:%M:%S"),
+        "duration": round(duration, 2),
+        "date": date_str,
+        "trigger": trigger,
+        "engine": engine,
+        "failures": failures
+    }
+
+    # 보관 정책 적용 (오래 읽지 않은 지면부터 삭제, 방금 수집한 지면은 제외)
+    cleanup = cache_manager.enforce(protect={(date_str, media['oid']) for media in media_list})
+    status["cache"] = {
+        "bytes": cleanup["usage"]["bytes"],
+        "entries": cleanup["usage"]["entries"],
+        "evicted": len(cleanup["evicted"]),
+        "freed": cleanup["freed"]
+    }
+    if cleanup["evicted"]:
+        print(f"[prefetch] 캐시 정리: {len(cleanup['evicted'])}개 삭제, {cache_manager.format_bytes(cleanup['freed'])} 확보")
+    save_status(status)
+    scrape_metrics.write_prometheus(METRICS_FILE)
+    scrape_metrics.write_report(REPORT_FILE)
+
+    print(f"[prefetch] 완료: {duration:.2f}초, 실패 {failures}개")
+    return status
+
+def run_forever(engine="playwright"):
+    """스케줄에 따라 계속 실행 (설정은 매 실행 전에 다시 읽음)"""
+    while True:
+        times = get_prefetch_times()
+        target = next_run_time(datetime.now(), times)
+
+        status = load_status()
+        status["next_run"] = target.strftime("%Y-%m-%d %H:%M:%S")
+        save_status(status)
+        print(f"[prefetch] 다음 수집: {status['next_run']}")
+
+        time.sleep(max(0, (target - datetime.now()).total_seconds()))
+        try:
+            run_prefetch(engine)
+        except Exception as e:
+            # 한 번의 실패로 워커가 멈추지 않도록 기록만 하고 다음 스케줄 대기
+            print(f"[prefetch] Error: {e}")
+            status = load_status()
+            status["last_run"] = {
+                "started_at": target.strftime("%Y-%m-%d %H:%M:%S"),
+                "trigger": "schedule",
+                "engine": engine,
+                "error": str(e)
+            }
+            save_status(status)
+
+def main():
+    parser = argparse.ArgumentParser(description="아침 지면 사전 수집 워커")
+    parser.add_argument("--once", action="store_true", help="지금 한 번만 실행")
+    parser.add_argument("--status", action="store_true", help="마지막 실행 상태 출력")
+    parser.add_argument("--engine", choices=["playwright", "httpx"], default="playwright")
+    args = parser.parse_args()
+
+    if args.status:
+        print(json.dumps(load_status(), ensure_ascii=False, indent=4))
+    elif args.once:
+        run_prefetch(args.engine, trigger="manual")
+    else:
+        run_forever(args.engine)
+
+if __name__ == "__main__":
+    main()
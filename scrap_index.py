@@ -0,0 +1,235 @@
+"""
+스크랩 URL 인덱스 (json 저장 방식용, 프로세스 전역)
+- scraps.json을 한 번 읽어 메모리에 보관하고 url → {date: 위치} 인덱스를 만듦
+- 파일 크기 / mtime / inode가 바뀌었을 때만 다시 읽음 (다른 프로세스나 직접 편집한 경우)
+- storage의 스크랩 변경 함수는 mutation() 안에서 같은 데이터를 고치고 저장 → 인덱스도 함께 갱신
+  mutation()은 scraps.json 파일 잠금을 잡고 최신 내용을 확인한 뒤 고침 (다른 프로세스의 변경을 덮어쓰지 않음)
+- 화면에서 기사 수백 건의 스크랩 여부는 filter_scrapped(urls)로 한 번에 확인
+- 정렬된 날짜 목록(기간 조회), 날짜별 집계, 폴더 / 태그 인덱스(scrap_stats)도 변경할 때마다 함께 갱신
+
+사용법:
+    with scrap_index.mutation() as index:
+        if index.find(date_str, url) is not None:
+            index.update(date_str, url, read=True)
+            storage.save_json(storage.SCRAPS_FILE, index.scraps)
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+import scrap_stats
+import storage
+
+_lock = threading.RLock()
+_index = None
+
+def _signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    # 원자적 저장(os.replace)은 매번 새 inode
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+class ScrapIndex:
+    """scraps.json 내용 + url 인덱스 + 정렬된 날짜 목록 + 날짜별 집계 + 폴더 / 태그 인덱스"""
+
+    def __init__(self, path):
+        self.path = path
+        # 읽기 전에 기록 (읽는 도중 파일이 바뀌면 다음 호출에서 다시 읽음)
+        self.signature = _signature(path)
+        self.scraps = storage.load_json(path, {})
+        self.positions = {}
+        for date_str in self.scraps:
+            self._reindex(date_str)
+        self.dates = sorted(self.scraps)
+        self.daily = scrap_stats.build(self.scraps)
+        self.groups = scrap_stats.build_groups(self.scraps)
+
+    def _reindex(self, date_str, start=0):
+        """date_str의 start번째 이후 스크랩 위치 갱신 (같은 날짜에 같은 URL이 있으면 앞의 것)"""
+        for idx, s in enumerate(self.scraps.get(date_str, [])[start:], start):
+            dates = self.positions.setdefault(s['url'], {})
+            if dates.get(date_str, idx) >= idx:
+                dates[date_str] = idx
+
+    def find(self, date_str, url):
+        """해당 날짜에서 url 스크랩의 위치 (없으면 None)"""
+        return self.positions.get(url, {}).get(date_str)
+
+    def get_entries(self, url):
+        """url의 스크랩 목록: [{"date", "position", "folder", "tags", "read"}]"""
+        entries = []
+        for date_str, idx in self.positions.get(url, {}).items():
+            s = self.scraps[date_str][idx]
+            entries.append({
+                "date": date_str,
+                "position": idx,
+                "folder": s.get('folder', '기본'),
+                "tags": s.get('tags', []),
+                "read": s.get('read', False)
+            })
+        return entries
+
+    def add(self, date_str, item):
+        if 'tags' in item:
+            # 호출한 쪽의 태그 목록을 나중에 고쳐도 폴더 / 태그 묶음이 바뀌지 않도록 복사해서 보관
+            item = dict(item, tags=list(item['tags']))
+        items = self.scraps.setdefault(date_str, [])
+        items.append(item)
+        self._reindex(date_str, len(items) - 1)
+        scrap_stats.add_date(self.dates, date_str)
+        scrap_stats.count(self.daily, date_str, item)
+        scrap_stats.group(self.groups, date_str, item)
+
+    def remove(self, date_str, url):
+        """스크랩 삭제 → 삭제 여부 (뒤쪽 스크랩 위치는 한 칸씩 당김)"""
+        idx = self.find(date_str, url)
+        if idx is None:
+            return False
+        items = self.scraps[date_str]
+        removed = items.pop(idx)
+        scrap_stats.count(self.daily, date_str, removed, -1)
+        scrap_stats.group(self.groups, date_str, removed, -1)
+        dates = self.positions[url]
+        del dates[date_str]
+        if not dates:
+            del self.positions[url]
+        if items:
+            for s in items[idx:]:
+                self.positions.get(s['url'], {}).pop(date_str, None)
+            self._reindex(date_str, idx)
+        else:
+            del self.scraps[date_str]
+            scrap_stats.remove_date(self.dates, date_str)
+        # 같은 날짜에 같은 URL이 또 있으면(직접 편집한 파일) 남은 것을 다시 인덱스에
+        remaining = self.find(date_str, url)
+        if remaining is not None:
+            scrap_stats.group(self.groups, date_str, items[remaining])
+        return True
+
+    def update(self, date_str, url, **fields):
+        """스크랩 항목 변경 (folder / tags / read 등) → 변경 여부"""
+        idx = self.find(date_str, url)
+        if idx is None:
+            return False
+        if 'tags' in fields:
+            fields['tags'] = list(fields['tags'])
+        item = self.scraps[date_str][idx]
+        scrap_stats.count(self.daily, date_str, item, -1)
+        scrap_stats.group(self.groups, date_str, item, -1)
+        item.update(fields)
+        scrap_stats.count(self.daily, date_str, item)
+        scrap_stats.group(self.groups, date_str, item)
+        return True
+
+    def get_between(self, start=None, end=None):
+        """start ~ end 날짜(포함)의 스크랩 복사본 목록 (날짜순, 각 항목에 'date' 추가)"""
+        return [
+            _copy(s, date=date_str)
+            for date_str in scrap_stats.dates_between(self.dates, start, end)
+            for s in self.scraps[date_str]
+        ]
+
+    def query(self, folder=None, tags=None, match="any"):
+        """
+        폴더 / 태그 조건에 맞는 스크랩 복사본: {date: [스크랩, ...]} (날짜순, 같은 날짜는 추가된 순서)
+        인덱스로 고른 항목만 복사 (전체 스크랩을 훑지 않음)
+        """
+        keys = scrap_stats.select(self.groups, folder, tags, match)
+        if keys is None:
+            return {date_str: [_copy(s) for s in self.scraps[date_str]] for date_str in self.dates}
+        result = {}
+        for date_str, position in sorted((date_str, self.find(date_str, url)) for date_str, url in keys):
+            result.setdefault(date_str, []).append(_copy(self.scraps[date_str][position]))
+        return result
+
+    def count(self, folder=None, tags=None, match="any"):
+        """폴더 / 태그 조건에 맞는 스크랩 수 (항목을 만들지 않음)"""
+        keys = scrap_stats.select(self.groups, folder, tags, match)
+        if keys is None:
+            return sum(len(items) for items in self.scraps.values())
+        return len(keys)
+
+    def tag_counts(self):
+        return {tag: len(keys) for tag, keys in self.groups["tags"].items()}
+
+    def get_daily_stats(self, start=None, end=None):
+        """start ~ end 날짜(포함)의 날짜별 집계 복사본: {date: 집계}"""
+        return {
+            date_str: scrap_stats.copy(self.daily[date_str])
+            for date_str in scrap_stats.dates_between(self.dates, start, end)
+        }
+
+def _copy(s, **fields):
+    """스크랩 항목 복사 (태그 목록까지, 호출한 쪽이 고쳐도 인덱스는 그대로)"""
+    item = dict(s, **fields)
+    if 'tags' in s:
+        item['tags'] = list(s['tags'])
+    return item
+
+def get_index():
+    """현재 인덱스 (처음이거나 파일이 바뀌었으면 다시 읽음)"""
+    global _index
+    with _lock:
+        path = storage.SCRAPS_FILE
+        if _index is None or _index.path != path or _index.signature != _signature(path):
+            _index = ScrapIndex(path)
+        return _index
+
+def invalidate():
+    global _index
+    with _lock:
+        _index = None
+
+@contextmanager
+def mutation():
+    """
+    인덱스를 고치고 저장하는 동안 다른 스레드 / 프로세스의 변경을 막음
+    블록이 끝나면 저장된 파일의 크기 / mtime을 기록 (실패하면 인덱스를 버리고 다음에 다시 읽음)
+    """
+    with _lock, storage.file_lock(storage.SCRAPS_FILE):
+        index = get_index()
+        try:
+            yield index
+        except BaseException:
+            invalidate()
+            raise
+        index.signature = _signature(index.path)
+
+def load_scraps():
+    """storage.load_scraps()와 같은 형식의 복사본 (호출한 쪽이 고쳐도 인덱스는 그대로)"""
+    with _lock:
+        scraps = get_index().scraps
+        return {date_str: [_copy(s) for s in items] for date_str, items in scraps.items()}
+
+def contains(url):
+    return url in get_index().positions
+
+def filter_scrapped(urls):
+    """urls 중 스크랩된 URL 집합"""
+    positions = get_index().positions
+    return {url for url in urls if url in positions}
+
+def get_scrapped_urls():
+    return set(get_index().positions)
+
+def get_scraps_between(start=None, end=None):
+    with _lock:
+        return get_index().get_between(start, end)
+
+def get_daily_stats(start=None, end=None):
+    with _lock:
+        return get_index().get_daily_stats(start, end)
+
+def query_scraps(folder=None, tags=None, match="any"):
+    with _lock:
+        return get_index().query(folder, tags, match)
+
+def count_scraps(folder=None, tags=None, match="any"):
+    with _lock:
+        return get_index().count(folder, tags, match)
+
+def get_tag_counts():
+    with _lock:
+        return get_index().tag_counts()
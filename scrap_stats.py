@@ -0,0 +1,129 @@
+"""
+스크랩 날짜별 집계 + 폴더 / 태그 인덱스 (json / journal 저장 방식 공용, sqlite는 DB 트리거 / 인덱스 사용)
+- 날짜마다 {"total", "read", "media": {이름: 수}, "folder": {폴더: 수}, "tags": {태그: 수}}
+- 스크랩을 추가 / 삭제 / 변경할 때마다 해당 날짜 집계만 고침 (전체 스크랩을 다시 훑지 않음)
+- 날짜 목록은 정렬된 상태로 유지 → 기간 조회는 이진 탐색
+- 폴더 / 태그 → {(date, url)} 집합: 폴더 AND 태그, 태그 중 하나 / 모두 조회와 개수 세기를 집합 연산으로
+
+사용법:
+    daily = scrap_stats.build(scraps)
+    scrap_stats.count(daily, date_str, item, -1)   # 변경 전 내용 빼기
+    scrap_stats.count(daily, date_str, changed)     # 변경 후 내용 더하기
+    groups = scrap_stats.build_groups(scraps)
+    keys = scrap_stats.select(groups, folder="경제", tags=["반도체", "AI"], match="any")
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+def empty():
+    return {"total": 0, "read": 0, "media": {}, "folder": {}, "tags": {}}
+
+def _bump(counts, key, sign):
+    value = counts.get(key, 0) + sign
+    if value > 0:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
+
+def count(daily, date_str, item, sign=1):
+    """스크랩 1건을 date_str 집계에 더함 (sign=-1이면 뺌, 0건이 된 날짜는 삭제)"""
+    stats = daily.get(date_str)
+    if stats is None:
+        stats = daily[date_str] = empty()
+    stats["total"] += sign
+    if item.get('read', False):
+        stats["read"] += sign
+    _bump(stats["media"], item.get('media') or "", sign)
+    _bump(stats["folder"], item.get('folder', '기본'), sign)
+    for tag in set(item.get('tags', [])):
+        _bump(stats["tags"], tag, sign)
+    if stats["total"] <= 0:
+        del daily[date_str]
+
+def build(scraps):
+    """{date: [스크랩, ...]} → {date: 집계}"""
+    daily = {}
+    for date_str, items in scraps.items():
+        for item in items:
+            count(daily, date_str, item)
+    return daily
+
+def copy(stats):
+    return dict(stats, media=dict(stats["media"]), folder=dict(stats["folder"]), tags=dict(stats["tags"]))
+
+def merge(daily_stats):
+    """여러 날짜의 집계를 합침 → 기간 요약 (+ "unread", "days")"""
+    summary = empty()
+    for stats in daily_stats:
+        summary["total"] += stats["total"]
+        summary["read"] += stats["read"]
+        for key in ("media", "folder", "tags"):
+            for name, value in stats[key].items():
+                summary[key][name] = summary[key].get(name, 0) + value
+    summary["unread"] = summary["total"] - summary["read"]
+    return summary
+
+# --- 정렬된 날짜 목록 ---
+
+def add_date(dates, date_str):
+    idx = bisect_left(dates, date_str)
+    if idx == len(dates) or dates[idx] != date_str:
+        insort(dates, date_str)
+
+def remove_date(dates, date_str):
+    idx = bisect_left(dates, date_str)
+    if idx < len(dates) and dates[idx] == date_str:
+        dates.pop(idx)
+
+def dates_between(dates, start=None, end=None):
+    """정렬된 dates 중 start ~ end (포함, None이면 끝까지)"""
+    lo = bisect_left(dates, start) if start is not None else 0
+    hi = bisect_right(dates, end) if end is not None else len(dates)
+    return dates[lo:hi]
+
+# --- 폴더 / 태그 인덱스 ---
+
+def empty_groups():
+    return {"folder": {}, "tags": {}}
+
+def _member(index, name, key, sign):
+    keys = index.setdefault(name, set())
+    if sign > 0:
+        keys.add(key)
+    else:
+        keys.discard(key)
+        if not keys:
+            del index[name]
+
+def group(groups, date_str, item, sign=1):
+    """스크랩 1건을 폴더 / 태그 인덱스에 추가 (sign=-1이면 제거), 키는 (date, url)"""
+    key = (date_str, item['url'])
+    _member(groups["folder"], item.get('folder', '기본'), key, sign)
+    for tag in set(item.get('tags', [])):
+        _member(groups["tags"], tag, key, sign)
+
+def build_groups(scraps):
+    groups = empty_groups()
+    for date_str, items in scraps.items():
+        for item in items:
+            group(groups, date_str, item)
+    return groups
+
+def select(groups, folder=None, tags=None, match="any"):
+    """
+    조건에 맞는 (date, url) 집합 (조건이 없으면 None = 전체)
+    folder: 폴더 이름, tags: 태그 목록, match: "any"(하나라도) / "all"(모두)
+    """
+    selected = None
+    if folder is not None:
+        selected = groups["folder"].get(folder, set())
+    if tags:
+        tag_sets = [groups["tags"].get(tag, set()) for tag in tags]
+        if match == "all":
+            # 작은 집합부터 교집합
+            tag_sets.sort(key=len)
+            matched = set(tag_sets[0]).intersection(*tag_sets[1:])
+        else:
+            matched = set().union(*tag_sets)
+        selected = matched if selected is None else selected & matched
+    return selected
@@ -0,0 +1,240 @@
+"""
+스크래퍼 단계별 계측
+- 단계(컨텍스트 생성, 지면 목록 이동 / 대기 / 파싱, 부제목 이동 / 파싱, 캐시 저장)마다 소요 시간 기록
+- 언론사(oid)별 히스토그램 (p50 / p95 / p99)
+- Prometheus 텍스트 파일 / JSON 실행 리포트로 내보내기
+- subscribe(callback)으로 측정 이벤트 구독
+
+사용법:
+    with scrape_metrics.timer(scrape_metrics.STAGE_INDEX_PARSE, oid):
+        newspaper_data = news_parser.parse_newspaper_index(content)
+
+    unsubscribe = scrape_metrics.subscribe(lambda event: print(event))
+    scrape_metrics.write_prometheus("scrape_metrics.prom")
+"""
+
+import bisect
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+# 단계 이름
+STAGE_CONTEXT = "context_create"
+STAGE_INDEX_GOTO = "index_goto"
+STAGE_INDEX_WAIT = "index_wait"
+STAGE_INDEX_FETCH = "index_fetch"          # httpx: 지면 목록 요청
+STAGE_INDEX_PARSE = "index_parse"
+STAGE_SUBTITLE_NAV = "subtitle_navigation"
+STAGE_SUBTITLE_PARSE = "subtitle_parse"
+STAGE_SUBTITLE_FETCH = "subtitle_fetch"    # httpx: 스트림 수신 + 파싱 (한 번에 진행되어 나눌 수 없음)
+STAGE_CACHE_WRITE = "cache_write"
+
+# oid와 무관한 측정 (브라우저 서비스의 컨텍스트 미리 생성 등)
+NO_OID = "-"
+
+# Prometheus 히스토그램 버킷 (초)
+BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+# 분위수 계산용으로 보관하는 최근 측정값 수 (단계 × oid별)
+MAX_SAMPLES = 5000
+
+METRIC_NAME = "newsroom_scrape_stage_seconds"
+ERROR_METRIC_NAME = "newsroom_scrape_stage_errors_total"
+
+def quantile(ordered, q):
+    """정렬된 값 목록의 분위수 (선형 보간)"""
+    if not ordered:
+        return None
+    pos = (len(ordered) - 1) * q
+    lower = int(pos)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower)
+
+class Histogram:
+    """누적 버킷 + 최근 측정값 (분위수용)"""
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+        self.samples = deque(maxlen=MAX_SAMPLES)
+
+    def observe(self, seconds, ok=True):
+        self.bucket_counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.samples.append(seconds)
+        if not ok:
+            self.errors += 1
+
+    def summary(self):
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else None,
+            "p50": quantile(ordered, 0.50),
+            "p95": quantile(ordered, 0.95),
+            "p99": quantile(ordered, 0.99),
+            "max": ordered[-1] if ordered else None
+        }
+
+class MetricsRegistry:
+    """(단계, oid)별 히스토그램 + 구독자 (여러 스레드에서 기록 가능)"""
+
+    def __init__(self):
+        self.histograms = {}
+        self.subscribers = []
+        self.started_at = datetime.now()
+        self._lock = threading.Lock()
+
+    def observe(self, stage, oid, seconds, ok=True, **fields):
+        oid = oid or NO_OID
+        with self._lock:
+            histogram = self.histograms.get((stage, oid))
+            if histogram is None:
+                histogram = self.histograms[(stage, oid)] = Histogram()
+            histogram.observe(seconds, ok)
+            subscribers = list(self.subscribers)
+
+        if subscribers:
+            event = {"stage": stage, "oid": oid, "seconds": seconds, "ok": ok, "time": time.time(), **fields}
+            for callback in subscribers:
+                try:
+                    callback(event)
+                except Exception as e:
+                    # 구독자 오류가 스크래핑을 멈추지 않도록 함
+                    print(f"[scrape_metrics] Subscriber error: {e}")
+
+    @contextmanager
+    def timer(self, stage, oid, **fields):
+        """with 블록의 소요 시간 기록 (예외가 나면 ok=False로 기록하고 다시 던짐)"""
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.observe(stage, oid, time.perf_counter() - start, ok, **fields)
+
+    def subscribe(self, callback):
+        """callback(event) 등록 → 해제 함수 반환"""
+        with self._lock:
+            self.subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self.subscribers:
+                    self.subscribers.remove(callback)
+        return unsubscribe
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+            self.started_at = datetime.now()
+
+    def report(self):
+        """
+        JSON 실행 리포트
+        {"started_at", "generated_at", "stages": {단계: {"all": 요약, "by_oid": {oid: 요약}}}}
+        """
+        with self._lock:
+            items = [(key, histogram) for key, histogram in self.histograms.items()]
+            started_at = self.started_at
+
+        stages = {}
+        for (stage, oid), histogram in sorted(items):
+            stages.setdefault(stage, {"by_oid": {}})["by_oid"][oid] = histogram.summary()
+
+        # 단계 전체 (oid 합산)
+        for stage, entry in stages.items():
+            merged = Histogram()
+            for (s, _), histogram in items:
+                if s != stage:
+                    continue
+                merged.count += histogram.count
+                merged.total += histogram.total
+                merged.errors += histogram.errors
+                merged.samples.extend(histogram.samples)
+            entry["all"] = merged.summary()
+
+        return {
+            "started_at": started_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "stages": stages
+        }
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 형식 (node_exporter textfile collector 등)"""
+        with self._lock:
+            items = sorted((key, histogram) for key, histogram in self.histograms.items())
+
+        lines = [
+            f"# HELP {METRIC_NAME} Scraper stage duration in seconds.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        for (stage, oid), histogram in items:
+            labels = f'stage="{stage}",oid="{oid}"'
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ["+Inf"], histogram.bucket_counts):
+                cumulative += count
+                lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{METRIC_NAME}_sum{{{labels}}} {histogram.total:.6f}")
+            lines.append(f"{METRIC_NAME}_count{{{labels}}} {histogram.count}")
+
+        lines.append(f"# HELP {ERROR_METRIC_NAME} Scraper stage failures.")
+        lines.append(f"# TYPE {ERROR_METRIC_NAME} counter")
+        for (stage, oid), histogram in items:
+            lines.append(f'{ERROR_METRIC_NAME}{{stage="{stage}",oid="{oid}"}} {histogram.errors}')
+        return "\n".join(lines) + "\n"
+
+# --- 프로세스 전역 레지스트리 ---
+
+_registry = MetricsRegistry()
+
+def get_registry():
+    return _registry
+
+def observe(stage, oid, seconds, ok=True, **fields):
+    _registry.observe(stage, oid, seconds, ok, **fields)
+
+def timer(stage, oid, **fields):
+    return _registry.timer(stage, oid, **fields)
+
+def subscribe(callback):
+    return _registry.subscribe(callback)
+
+def reset():
+    _registry.reset()
+
+def report():
+    return _registry.report()
+
+def write_report(path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report(), f, ensure_ascii=False, indent=4)
+
+def write_prometheus(path):
+    # 수집기가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(_registry.to_prometheus())
+    os.replace(temp_path, path)
+
+def format_summary(stage_report=None):
+    """단계별 p50 / p95 / p99 표 (콘솔 출력용)"""
+    stage_report = stage_report or report()
+    # 한글은 두 칸 너비이므로 제목 줄은 글자 수만큼 덜 채움
+    lines = [f"{'단계':<20}{'횟수':>6}{'p50':>10}{'p95':>10}{'p99':>10}{'오류':>4}"]
+    for stage, entry in stage_report["stages"].items():
+        s = entry["all"]
+        lines.append(
+            f"{stage:<22}{s['count']:>8}{s['p50'] * 1000:>8.1f}ms{s['p95'] * 1000:>8.1f}ms{s['p99'] * 1000:>8.1f}ms{s['errors']:>6}"
+        )
+    return "\n".join(lines)
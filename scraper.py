@@ -1,7 +1,8 @@
 import asyncio
 from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
 import re
+import news_parser
+import parse_pool
 import storage # 캐싱 모듈 임포트
 
 # 동시 실행 제한을 위한 세마포어 (한 번에 10개의 탭만 열기 - 속도 최적화)
@@ -16,7 +17,7 @@ async def fetch_article_subtitle(context, url, sem):
             await page.route("**/*", lambda route: route.abort() if route.request.resource_type in ["image", "media", "font", "stylesheet", "script"] else route.continue_())
             
             # 타임아웃 3초로 복구 (세마포어로 부하가 줄었으므로)
-            await page.goto(url, wait_until="domcontentloaded", timeout=3000)
+            await page.goto(news_parser.resolve_article_url(url), wait_until="domcontentloaded", timeout=3000)
             
             try:
                await page.wait_for_selector('div.media_end_head_subheadline, strong.media_end_summary', timeout=500)
@@ -24,33 +25,8 @@ async def fetch_article_subtitle(context, url, sem):
                pass
     
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # ... (이하 동일) ...
-            
-            subtitle = ""
-            # 1. Standard Subtitle
-            sub_elem = soup.select_one('div.media_end_head_subheadline')
-            if sub_elem:
-                subtitle = sub_elem.get_text(strip=True)
-                
-            # 2. Summary
-            if not subtitle:
-                summary_elem = soup.select_one('strong.media_end_summary')
-                if summary_elem:
-                    subtitle = summary_elem.get_text(strip=True)
-                
-                # Div Fallback
-                if not subtitle:
-                    summary_div = soup.select_one('div.media_end_summary')
-                    if summary_div:
-                         subtitle = summary_div.get_text(strip=True)
-                    
-            # 3. Old style / Guide
-            if not subtitle:
-                guide_elem = soup.select_one('div.media_end_head_guide')
-                if guide_elem:
-                    subtitle = guide_elem.get_text(strip=True)
+            # 파싱은 작업자 풀에서 (다른 탭의 요청이 멈추지 않도록)
+            subtitle = await parse_pool.extract_subtitle(content)
     
             # 라우팅 해제 및 페이지 닫기 (오류 방지)
             await page.unroute_all(behavior='ignoreErrors')
@@ -70,7 +46,7 @@ async def get_newspaper_data(oid, date, force_refresh=False):
             return cached_data
 
     print(f"[{oid}] Scraping started...")
-    url = f"https://media.naver.com/press/{oid}/newspaper?date={date}"
+    url = news_parser.build_index_url(oid, date)
     
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
@@ -94,57 +70,16 @@ async def get_newspaper_data(oid, date, force_refresh=False):
         # 페이지가 완전히 로딩되도록 잠시 대기
         await asyncio.sleep(1)
         
-        # 지면 데이터 파싱
+        # 지면 데이터 파싱 (작업자 풀에서, 면 / 기사 구조는 news_parser 참고)
         content = await page.content()
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # 면(Page) 섹션 찾기
-        page_sections = soup.select('div.newspaper_inner')
+        newspaper_data = await parse_pool.parse_newspaper_index(content)
         
-        newspaper_data = []
-        
-        # 모든 기사 상세 페이지 방문을 위한 태스크 리스트
-        subtitle_tasks = []
-        article_infos = []
-
         # 동시 실행 제어용 세마포어 생성
         sem = asyncio.Semaphore(SEM_LIMIT)
 
-        for section in page_sections:
-            page_name_elem = section.select_one('span.page_notation')
-            if not page_name_elem:
-                continue
-            
-            page_name = page_name_elem.get_text(strip=True)
-            
-            articles = []
-            article_elems = section.select('ul.newspaper_article_lst > li > a')
-            
-            for a in article_elems:
-                title_elem = a.select_one('strong')
-                if not title_elem:
-                    continue
-                
-                title = title_elem.get_text(strip=True)
-                article_url = a['href']
-                
-                # 비동기로 부제목 가져오기 예약
-                article_info = {
-                    "page": page_name,
-                    "title": title,
-                    "url": article_url,
-                    "subtitle": ""
-                }
-                articles.append(article_info)
-                article_infos.append(article_info)
-                # 세마포어 전달
-                subtitle_tasks.append(fetch_article_subtitle(context, article_url, sem))
-            
-            if articles:
-                newspaper_data.append({
-                    "page": page_name,
-                    "articles": articles
-                })
+        # 모든 기사 상세 페이지 방문 (세마포어 전달)
+        article_infos = list(news_parser.iter_articles(newspaper_data))
+        subtitle_tasks = [fetch_article_subtitle(context, info['url'], sem) for info in article_infos]
 
         # 부제목들을 한꺼번에 가져옴 (병렬 처리)
         subtitles = await asyncio.gather(*subtitle_tasks)
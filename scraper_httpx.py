@@ -0,0 +1,168 @@
+"""
+httpx 기반 스크래퍼 (브라우저 없음)
+- 커넥션 풀 + keep-alive 재사용
+- HTTP/2 사용 (h2 패키지가 설치된 경우)
+- fetch_control로 동시 요청 수 조절 및 재시도
+scraper_optimized.get_newspaper_data_optimized와 같은 결과 구조를 반환합니다.
+"""
+
+import asyncio
+import httpx
+import fetch_control
+import news_parser
+import parse_pool
+import scrape_metrics
+import storage
+import subtitle_extractor
+
+# 동시 요청 초기값 (브라우저 탭이 아니므로 더 높게 설정, fetch_control이 조절)
+SEM_LIMIT = 20
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# 타임아웃 (초) - 기사 요청은 fetch_control이 관측 지연 시간으로 조절
+INDEX_TIMEOUT = 10.0
+ARTICLE_TIMEOUT = fetch_control.TIMEOUT_MIN
+
+def http2_available():
+    """h2 패키지가 있으면 HTTP/2 사용"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def create_client(limit=SEM_LIMIT):
+    """커넥션 풀을 공유하는 AsyncClient 생성 (여러 언론사에 재사용 가능)"""
+    return httpx.AsyncClient(
+        http2=http2_available(),
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+        timeout=httpx.Timeout(ARTICLE_TIMEOUT),
+        follow_redirects=True,
+    )
+
+def conditional_headers(fingerprint):
+    """이전 응답의 ETag / Last-Modified로 조건부 요청 헤더 생성 (서버가 지원하면 304)"""
+    headers = {}
+    if fingerprint.get("etag"):
+        headers["If-None-Match"] = fingerprint["etag"]
+    if fingerprint.get("last_modified"):
+        headers["If-Modified-Since"] = fingerprint["last_modified"]
+    return headers
+
+async def load_article_subtitle_httpx(client, url, timeout, oid=None):
+    """
+    기사 상세 페이지를 스트림으로 받아 부제목을 추출합니다. (실패 시 예외)
+    부제목이 결정되면 나머지 본문은 받지 않습니다.
+    (받는 대로 조금씩 파싱하므로 parse_pool로 넘기지 않고 이벤트 루프에서 처리)
+    """
+    with scrape_metrics.timer(scrape_metrics.STAGE_SUBTITLE_FETCH, oid):
+        async with client.stream("GET", news_parser.resolve_article_url(url), timeout=timeout) as response:
+            response.raise_for_status()
+            return await subtitle_extractor.extract_subtitle_from_stream(response.aiter_text())
+
+async def fetch_article_subtitle_httpx(client, url, controller, oid=None):
+    """부제목을 가져옵니다. (적응형 동시성 + 재시도) Returns: (subtitle, status)"""
+    return await controller.fetch(lambda u, timeout: load_article_subtitle_httpx(client, u, timeout, oid), url)
+
+async def get_newspaper_data_httpx(client, oid, date, force_refresh=False, controller=None, incremental=True):
+    """
+    브라우저 없이 스크래핑 (클라이언트 재사용)
+    controller: 여러 언론사가 공유하는 요청 제어기 (없으면 SEM_LIMIT로 새로 생성)
+    incremental: 기사 기록과 비교해 새 기사 / 제목이 바뀐 기사의 부제목만 가져옴
+                 지면 목록이 바뀌지 않았으면(304 또는 지문 일치) 캐시를 그대로 반환
+    지면이 없으면(발행 없음 안내 확인) news_parser.NoEdition(빈 리스트), 지면 목록을 불러오지 못하거나 면이 없는데 안내도 없으면 예외를 던집니다.
+    """
+
+    # 1. 캐시 확인
+    if not force_refresh:
+        cached_data = storage.load_news_cache(date, oid)
+        if cached_data:
+            print(f"[{oid}] Cache Hit!")
+            return cached_data
+
+    print(f"[{oid}] httpx Scraping started...")
+    url = news_parser.build_index_url(oid, date)
+
+    if controller is None:
+        controller = fetch_control.FetchController(SEM_LIMIT)
+
+    # 캐시가 있으면 조건부 요청 (변경 없으면 본문 없이 304)
+    fingerprint = storage.load_index_fingerprint(date, oid) if incremental else {}
+    headers = conditional_headers(fingerprint) if storage.has_news_cache(date, oid) else {}
+
+    async with controller:
+        with scrape_metrics.timer(scrape_metrics.STAGE_INDEX_FETCH, oid):
+            response = await client.get(url, timeout=INDEX_TIMEOUT, headers=headers)
+
+    newspaper_data = None
+    refetched = False
+    if response.status_code == 304:
+        print(f"[{oid}] Index not modified (304)")
+        newspaper_data = storage.load_news_cache(date, oid)
+        if not newspaper_data:
+            # 304인데 로컬 캐시를 읽을 수 없으면 조건 없이 다시 요청
+            print(f"[{oid}] Cache missing after 304, refetching")
+            async with controller:
+                with scrape_metrics.timer(scrape_metrics.STAGE_INDEX_FETCH, oid):
+                    response = await client.get(url, timeout=INDEX_TIMEOUT)
+            newspaper_data = None
+            refetched = True
+    if newspaper_data is None:
+        response.raise_for_status()
+        with scrape_metrics.timer(scrape_metrics.STAGE_INDEX_PARSE, oid):
+            newspaper_data = await parse_pool.parse_newspaper_index(response.text)
+            # 면이 하나도 없으면 발행 없음 안내가 보일 때만 빈 지면 (차단 / 로그인 페이지, 구조 변경은 실패)
+            no_edition = not newspaper_data and await parse_pool.is_no_edition_page(response.text)
+        if no_edition:
+            print(f"[{oid}] No edition")
+            return news_parser.NoEdition()
+        if not newspaper_data:
+            raise RuntimeError("Index has no sections and no no-edition notice")
+    etag = response.headers.get("etag", fingerprint.get("etag"))
+    last_modified = response.headers.get("last-modified", fingerprint.get("last_modified"))
+
+    # 기사 기록과 비교 (변경 없는 기사는 기록된 부제목 재사용)
+    records = storage.load_article_records(date, oid) if incremental else {}
+
+    # 지면 지문이 같으면 부제목 요청 / 캐시 저장 생략
+    index_pages = news_parser.fingerprint_newspaper_index(newspaper_data)
+    # (캐시를 읽지 못해 다시 받은 경우는 캐시를 새로 저장해야 하므로 제외)
+    if incremental and not refetched and storage.is_index_unchanged(date, oid, fingerprint, index_pages, records):
+        print(f"[{oid}] Index unchanged, using cache")
+        storage.save_index_fingerprint(date, oid, index_pages, etag, last_modified)
+        return storage.load_news_cache(date, oid)
+    if incremental and fingerprint:
+        print(f"[{oid}] Changed pages: {', '.join(storage.get_changed_pages(fingerprint, index_pages)) or '-'}")
+
+    article_infos = storage.apply_article_records(newspaper_data, records)
+    print(f"[{oid}] Fetching {len(article_infos)} new/changed articles")
+
+    # 부제목 병렬 처리 (전역 한도 공유)
+    subtitle_tasks = [fetch_article_subtitle_httpx(client, info['url'], controller, oid) for info in article_infos]
+    results = await asyncio.gather(*subtitle_tasks)
+    for info, (subtitle, _) in zip(article_infos, results):
+        info["subtitle"] = subtitle
+    statuses = [status for _, status in results]
+    if statuses.count(fetch_control.STATUS_FAILED):
+        print(f"[{oid}] {statuses.count(fetch_control.STATUS_FAILED)} subtitles failed")
+
+    # 캐시 + 기사 기록 저장
+    if newspaper_data:
+        with scrape_metrics.timer(scrape_metrics.STAGE_CACHE_WRITE, oid):
+            storage.update_article_records(records, article_infos, statuses)
+            storage.save_news_cache(date, oid, newspaper_data)
+            storage.save_article_records(date, oid, storage.prune_article_records(records, newspaper_data))
+            storage.save_index_fingerprint(date, oid, index_pages, etag, last_modified)
+
+    return newspaper_data
+
+async def get_newspaper_data(oid, date, force_refresh=False):
+    """단일 언론사 스크래핑 (클라이언트를 직접 생성, 실패 시 빈 리스트)"""
+    async with create_client() as client:
+        try:
+            return await get_newspaper_data_httpx(client, oid, date, force_refresh)
+        except Exception as e:
+            print(f"[{oid}] Error: {e}")
+            return []
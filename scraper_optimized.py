@@ -6,195 +6,224 @@
 """
 
 import asyncio
-from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
+import time
+import fetch_control
+import news_parser
+import page_pool
+import parse_pool
+import scrape_metrics
+import single_flight
 import storage
 
-# 동시 실행 제한 (증가)
+# 동시 실행 초기값 (fetch_control이 지연 시간 / 오류율에 따라 조절)
 SEM_LIMIT = 15
 
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
 # 차단할 리소스 타입 (모든 불필요 리소스)
 BLOCKED_RESOURCES = [
     "image", "media", "font", "stylesheet", "script",
     "fetch", "xhr", "websocket", "manifest", "other"
 ]
 
-async def fetch_article_subtitle_fast(page, url, sem):
-    """부제목을 빠르게 가져옵니다. (페이지 재사용)"""
-    async with sem:
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=3000)
-            
-            content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            subtitle = ""
-            # 1. Standard Subtitle
-            sub_elem = soup.select_one('div.media_end_head_subheadline')
-            if sub_elem:
-                subtitle = sub_elem.get_text(strip=True)
-                
-            # 2. Summary
-            if not subtitle:
-                summary_elem = soup.select_one('strong.media_end_summary')
-                if summary_elem:
-                    subtitle = summary_elem.get_text(strip=True)
-                    
-                if not subtitle:
-                    summary_div = soup.select_one('div.media_end_summary')
-                    if summary_div:
-                        subtitle = summary_div.get_text(strip=True)
-                    
-            # 3. Guide
-            if not subtitle:
-                guide_elem = soup.select_one('div.media_end_head_guide')
-                if guide_elem:
-                    subtitle = guide_elem.get_text(strip=True)
-            
-            return subtitle
-        except Exception:
-            return ""
-
-async def get_newspaper_data_optimized(browser, oid, date, force_refresh=False):
-    """최적화된 스크래핑 (브라우저 재사용)"""
+async def load_article_subtitle(page, url, timeout, oid=None):
+    """풀에서 빌린 페이지로 기사를 열어 부제목 추출 (실패 시 예외, 페이지는 lease가 초기화 후 반납)"""
+    with scrape_metrics.timer(scrape_metrics.STAGE_SUBTITLE_NAV, oid):
+        response = await page.goto(news_parser.resolve_article_url(url), wait_until="domcontentloaded", timeout=timeout * 1000)
+        if response is not None and response.status >= 400:
+            raise RuntimeError(f"HTTP {response.status}")
     
-    # 1. 캐시 확인
-    if not force_refresh:
-        cached_data = storage.load_news_cache(date, oid)
-        if cached_data:
-            print(f"[{oid}] Cache Hit!")
-            return cached_data
+    with scrape_metrics.timer(scrape_metrics.STAGE_SUBTITLE_PARSE, oid):
+        content = await page.content()
+        return await parse_pool.extract_subtitle(content)
 
-    print(f"[{oid}] Optimized Scraping started...")
-    url = f"https://media.naver.com/press/{oid}/newspaper?date={date}"
+async def fetch_article_subtitle_fast(pages, url, controller, oid=None):
+    """
+    부제목을 가져옵니다. (적응형 동시성 + 재시도, 요청마다 페이지 독점 사용)
+    페이지를 먼저 빌린 뒤 요청 슬롯을 잡으므로 페이지 대기 시간은 지연 시간(AIMD)에 포함되지 않습니다.
+    Returns: (subtitle, status)
+    """
+    return await controller.fetch(lambda u, timeout, page: load_article_subtitle(page, u, timeout, oid), url, lease=pages.lease)
+
+def block_resources(route):
+    """불필요한 리소스 요청 차단 (이미지, 폰트, 스타일시트 등)"""
+    if route.request.resource_type in BLOCKED_RESOURCES:
+        return route.abort()
+    return route.continue_()
+
+async def create_context(browser):
+    """리소스 차단이 적용된 컨텍스트 생성 (컨텍스트의 모든 페이지에 적용)"""
+    context = await browser.new_context(user_agent=USER_AGENT)
+    await context.route("**/*", block_resources)
+    return context
+
+async def scrape_with_context(context, oid, date, controller=None, incremental=True, pages=None):
+    """
+    주어진 컨텍스트로 지면 + 부제목을 스크래핑하고 캐시에 저장합니다.
+    컨텍스트는 닫지 않습니다. (호출자가 재사용 가능)
+    controller: 여러 언론사가 공유하는 요청 제어기 (없으면 SEM_LIMIT로 새로 생성)
+    incremental: 기사 기록과 비교해 새 기사 / 제목이 바뀐 기사의 부제목만 가져옴
+                 지면 지문이 같으면 캐시를 그대로 반환
+    pages: 컨텍스트의 페이지 풀 (없으면 동시 요청 한도 크기로 만들고 끝나면 닫음)
+    지면이 없으면(발행 없음 안내 확인) news_parser.NoEdition(빈 리스트), 지면 목록을 불러오지 못하면 예외를 던집니다.
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     
-    # 컨텍스트 생성 (리소스 차단)
-    context = await browser.new_context(
-        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-    )
+    url = news_parser.build_index_url(oid, date)
     
-    page = await context.new_page()
+    if controller is None:
+        controller = fetch_control.FetchController(SEM_LIMIT)
     
-    # 리소스 차단 (이미지, 폰트, 스타일시트 등)
-    await page.route("**/*", lambda route: 
-        route.abort() if route.request.resource_type in BLOCKED_RESOURCES 
-        else route.continue_()
-    )
+    own_pages = pages is None
+    if own_pages:
+        pages = page_pool.PagePool(context, controller.max_limit)
     
     try:
-        await page.goto(url, wait_until="domcontentloaded", timeout=10000)
-        
-        # 지면 데이터 대기 (짧은 타임아웃)
-        try:
-            await page.wait_for_selector('div.newspaper_inner', timeout=5000)
-        except:
-            await context.close()
-            return []
-        
-        content = await page.content()
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        page_sections = soup.select('div.newspaper_inner')
-        
-        newspaper_data = []
-        subtitle_tasks = []
-        article_infos = []
-        
-        sem = asyncio.Semaphore(SEM_LIMIT)
-        
-        # 부제목용 페이지들 미리 생성
-        subtitle_pages = []
-        for _ in range(min(SEM_LIMIT, 10)):
-            p = await context.new_page()
-            await p.route("**/*", lambda route: 
-                route.abort() if route.request.resource_type in BLOCKED_RESOURCES 
-                else route.continue_()
-            )
-            subtitle_pages.append(p)
-        
-        page_idx = 0
-        
-        for section in page_sections:
-            page_name_elem = section.select_one('span.page_notation')
-            if not page_name_elem:
-                continue
-            
-            page_name = page_name_elem.get_text(strip=True)
-            
-            articles = []
-            article_elems = section.select('ul.newspaper_article_lst > li > a')
-            
-            for a in article_elems:
-                title_elem = a.select_one('strong')
-                if not title_elem:
-                    continue
-                
-                title = title_elem.get_text(strip=True)
-                article_url = a['href']
+        # 페이지를 먼저 빌림 (페이지를 기다리는 동안 요청 슬롯을 잡고 있지 않도록)
+        async with pages.lease() as page:
+            async with controller:
+                with scrape_metrics.timer(scrape_metrics.STAGE_INDEX_GOTO, oid):
+                    await page.goto(url, wait_until="domcontentloaded", timeout=10000)
                 
-                article_info = {
-                    "page": page_name,
-                    "title": title,
-                    "url": article_url,
-                    "subtitle": ""
-                }
-                articles.append(article_info)
-                article_infos.append(article_info)
+                # 지면 데이터 대기 (짧은 타임아웃)
+                try:
+                    with scrape_metrics.timer(scrape_metrics.STAGE_INDEX_WAIT, oid):
+                        await page.wait_for_selector('div.newspaper_inner', timeout=5000)
+                except PlaywrightTimeoutError:
+                    # 발행 없음 안내가 보일 때만 빈 지면, 그 밖의 시간 초과는 실패로 전파 (backfill 등에서 재시도)
+                    if news_parser.is_no_edition_page(await page.content()):
+                        print(f"[{oid}] No edition")
+                        return news_parser.NoEdition()
+                    raise
                 
-                # 라운드 로빈으로 페이지 할당
-                assigned_page = subtitle_pages[page_idx % len(subtitle_pages)]
-                page_idx += 1
-                subtitle_tasks.append(fetch_article_subtitle_fast(assigned_page, article_url, sem))
-            
-            if articles:
-                newspaper_data.append({
-                    "page": page_name,
-                    "articles": articles
-                })
+                content = await page.content()
         
-        # 부제목 병렬 처리
-        if subtitle_tasks:
-            subtitles = await asyncio.gather(*subtitle_tasks)
-            for info, subtitle in zip(article_infos, subtitles):
-                info["subtitle"] = subtitle
+        with scrape_metrics.timer(scrape_metrics.STAGE_INDEX_PARSE, oid):
+            newspaper_data = await parse_pool.parse_newspaper_index(content)
+        # 기사 기록과 비교 (변경 없는 기사는 기록된 부제목 재사용)
+        records = storage.load_article_records(date, oid) if incremental else {}
         
-        # 정리
-        for p in subtitle_pages:
-            await p.close()
-        await context.close()
+        # 지면 지문이 같으면 부제목 요청 / 캐시 저장 생략
+        fingerprint = storage.load_index_fingerprint(date, oid) if incremental else {}
+        index_pages = news_parser.fingerprint_newspaper_index(newspaper_data)
+        if incremental and storage.is_index_unchanged(date, oid, fingerprint, index_pages, records):
+            print(f"[{oid}] Index unchanged, using cache")
+            storage.save_index_fingerprint(date, oid, index_pages)
+            return storage.load_news_cache(date, oid)
+        if incremental and fingerprint:
+            print(f"[{oid}] Changed pages: {', '.join(storage.get_changed_pages(fingerprint, index_pages)) or '-'}")
+        
+        article_infos = storage.apply_article_records(newspaper_data, records)
+        print(f"[{oid}] Fetching {len(article_infos)} new/changed articles")
+        
+        # 부제목 병렬 처리 (전역 한도 공유)
+        subtitle_tasks = [fetch_article_subtitle_fast(pages, info['url'], controller, oid) for info in article_infos]
+        results = await asyncio.gather(*subtitle_tasks)
+        for info, (subtitle, _) in zip(article_infos, results):
+            info["subtitle"] = subtitle
+        statuses = [status for _, status in results]
+        if statuses.count(fetch_control.STATUS_FAILED):
+            print(f"[{oid}] {statuses.count(fetch_control.STATUS_FAILED)} subtitles failed")
         
-        # 캐시 저장
+        # 캐시 + 기사 기록 저장
         if newspaper_data:
-            storage.save_news_cache(date, oid, newspaper_data)
+            with scrape_metrics.timer(scrape_metrics.STAGE_CACHE_WRITE, oid):
+                storage.update_article_records(records, article_infos, statuses)
+                storage.save_news_cache(date, oid, newspaper_data)
+                storage.save_article_records(date, oid, storage.prune_article_records(records, newspaper_data))
+                storage.save_index_fingerprint(date, oid, index_pages)
         
         return newspaper_data
         
+    finally:
+        if own_pages:
+            await pages.close()
+
+async def get_newspaper_data_optimized(browser, oid, date, force_refresh=False, incremental=True):
+    """최적화된 스크래핑 (브라우저 재사용, 새로고침 시 새 기사만 가져옴)"""
+    
+    # 1. 캐시 확인
+    if not force_refresh:
+        cached_data = storage.load_news_cache(date, oid)
+        if cached_data:
+            print(f"[{oid}] Cache Hit!")
+            return cached_data
+
+    print(f"[{oid}] Optimized Scraping started...")
+    
+    with scrape_metrics.timer(scrape_metrics.STAGE_CONTEXT, oid):
+        context = await create_context(browser)
+    try:
+        return await scrape_with_context(context, oid, date, incremental=incremental)
     except Exception as e:
         print(f"[{oid}] Error: {e}")
-        await context.close()
         return []
+    finally:
+        await context.close()
+
+async def scrape_media_timed(oid, scrape):
+    """언론사 1개 스크래핑 + 소요 시간 측정 (예외는 결과에 기록하고 전파하지 않음)"""
+    start = time.perf_counter()
+    try:
+        data = await scrape(oid)
+        error = None
+    except Exception as e:
+        print(f"[{oid}] Error: {e}")
+        data = []
+        error = str(e)
+    
+    return {
+        "data": data,
+        "elapsed": time.perf_counter() - start,
+        "error": error
+    }
 
-async def scrape_multiple_media(media_list, date, force_refresh=False):
-    """여러 언론사를 한 번에 스크래핑 (브라우저 1개 재사용)"""
-    async with async_playwright() as p:
-        # 브라우저 한 번만 실행
-        browser = await p.chromium.launch(headless=True)
+async def scrape_multiple_media(media_list, date, force_refresh=False, engine="playwright", incremental=True):
+    """
+    여러 언론사를 동시에 스크래핑 (전역 동시 요청 한도 공유)
+    engine: "playwright" (browser_service의 상시 Chromium) 또는 "httpx" (브라우저 없이 HTTP 요청)
+    incremental: 새로고침 시 새 기사 / 바뀐 기사의 부제목만 가져옴
+    한 언론사의 실패가 다른 언론사를 취소하지 않습니다.
+    Returns: {oid: {"data": 지면 데이터, "elapsed": 소요 시간(초), "error": None 또는 오류 메시지,
+                    "subtitles": {"ok": n, "empty": n, "failed": n}}}
+    """
+    if engine == "httpx":
+        import scraper_httpx
         
-        results = {}
-        for media in media_list:
-            data = await get_newspaper_data_optimized(browser, media['oid'], date, force_refresh)
-            results[media['oid']] = data
+        async with scraper_httpx.create_client() as client:
+            controller = fetch_control.FetchController(scraper_httpx.SEM_LIMIT)
+            
+            async def scrape(oid):
+                # 다른 프로세스(앱, 사전 수집 등)가 같은 지면을 스크래핑 중이면 합류
+                return await single_flight.run(oid, date, lambda: scraper_httpx.get_newspaper_data_httpx(
+                    client, oid, date, force_refresh, controller, incremental))
+            
+            outcomes = await asyncio.gather(*[scrape_media_timed(m['oid'], scrape) for m in media_list])
+    else:
+        # 상시 실행 브라우저 서비스 사용 (브라우저/컨텍스트/전역 한도 공유)
+        import browser_service
+        service = browser_service.get_service()
         
-        await browser.close()
-        return results
+        async def scrape(oid):
+            return await asyncio.wrap_future(service.submit_scrape(oid, date, force_refresh, incremental))
+        
+        outcomes = await asyncio.gather(*[scrape_media_timed(m['oid'], scrape) for m in media_list])
+    
+    # 부제목 상태 (ok / empty / failed) 집계
+    for media, outcome in zip(media_list, outcomes):
+        outcome["subtitles"] = storage.get_subtitle_status_counts(date, media['oid'])
+    
+    return {media['oid']: outcome for media, outcome in zip(media_list, outcomes)}
 
 if __name__ == "__main__":
-    import time
-    from datetime import datetime, timedelta
+    import sys
     
     # 테스트 날짜 (캐시가 있는 날짜 사용)
     test_date = "20260130"
     
+    # 엔진 선택: python scraper_optimized.py [playwright|httpx]
+    engine = sys.argv[1] if len(sys.argv) > 1 else "playwright"
+    
     TEST_MEDIA = [
         {"name": "조선일보", "oid": "023"},
         {"name": "중앙일보", "oid": "025"},
@@ -204,12 +233,13 @@ if __name__ == "__main__":
     ]
     
     print("="*60)
-    print("🚀 최적화된 Playwright 스크래퍼 테스트")
+    print("🚀 최적화 스크래퍼 테스트")
     print(f"📅 날짜: {test_date}")
+    print(f"⚙️ 엔진: {engine}")
     print("="*60)
     
     start = time.time()
-    results = asyncio.run(scrape_multiple_media(TEST_MEDIA, test_date, force_refresh=True))
+    results = asyncio.run(scrape_multiple_media(TEST_MEDIA, test_date, force_refresh=True, engine=engine))
     elapsed = time.time() - start
     
     print("\n" + "="*60)
@@ -217,12 +247,19 @@ if __name__ == "__main__":
     print("="*60)
     
     total_articles = 0
-    for oid, data in results.items():
+    for oid, result in results.items():
         name = next(m['name'] for m in TEST_MEDIA if m['oid'] == oid)
+        data = result['data']
         article_count = sum(len(page['articles']) for page in data) if data else 0
         total_articles += article_count
-        print(f"  {name}: {article_count}개 기사")
+        status = f" ❌ {result['error']}" if result['error'] else ""
+        failed = result['subtitles']['failed']
+        failed_str = f", 부제목 실패 {failed}개" if failed else ""
+        print(f"  {name}: {article_count}개 기사 ({result['elapsed']:.2f}초{failed_str}){status}")
     
     print(f"\n⏱️ 총 소요 시간: {elapsed:.2f}초")
     print(f"📰 총 기사 수: {total_articles}개")
     print(f"⚡ 기사당 평균: {elapsed/total_articles*1000:.1f}ms" if total_articles > 0 else "")
+    
+    # 단계별 소요 시간 (Naver 응답 / Chromium / 파싱 중 어디가 느린지 확인)
+    print("\n" + scrape_metrics.format_summary())
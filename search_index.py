@@ -0,0 +1,319 @@
+"""
+보관 지면 전체 검색 색인 (제목 + 부제목, SQLite)
+- 한글에 맞춘 글자 2-gram 색인: "반도체" → 반도, 도체 (띄어쓰기 / 조사와 관계없이 부분 일치)
+  한 글자 단어는 1-gram으로 색인
+- 후보는 색인으로 찾고, 실제로 검색어가 들어 있는지 다시 확인한 뒤 점수순 정렬
+  점수: (제목 등장 수 × 3 + 부제목 등장 수) × log(1 + 전체 기사 수 / 검색어 포함 기사 수)
+- storage.save_news_cache가 지면을 저장할 때마다 그 지면만 다시 색인
+- 색인 전의 캐시는 처음 검색할 때 자동으로 색인 (파일 크기 / mtime이 바뀐 지면만)
+- 지면 캐시를 지우면(storage.clear_news_cache, cache_manager.enforce) 색인에서도 뺌
+- 한 글자 단어만으로 된 검색어("한", "전 세")는 2-gram으로 후보를 좁힐 수 없어
+  날짜 / 언론사 필터에 맞는 기사 전체를 확인함 (기사 수에 비례해 느려지므로 필터와 함께 쓰는 것이 좋음)
+
+색인 파일: scraped_data/search_index.db
+사용법:
+    results = search_index.search("반도체", start="20260101", end="20260131", oids=["023"])
+    python search_index.py sync | rebuild | search 반도체 [--start --end --oid]
+"""
+
+import math
+import os
+import re
+import sqlite3
+import threading
+import storage
+
+INDEX_FILE_NAME = "search_index.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS editions (
+    date TEXT NOT NULL,
+    oid TEXT NOT NULL,
+    signature TEXT,
+    PRIMARY KEY (date, oid)
+);
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    oid TEXT NOT NULL,
+    page TEXT,
+    title TEXT NOT NULL,
+    subtitle TEXT,
+    url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_edition ON articles (date, oid);
+CREATE TABLE IF NOT EXISTS postings (
+    gram TEXT NOT NULL,
+    article_id INTEGER NOT NULL,
+    PRIMARY KEY (gram, article_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_article ON postings (article_id);
+"""
+
+# 제목에 나온 검색어의 가중치 (부제목 대비)
+TITLE_WEIGHT = 3
+
+DEFAULT_LIMIT = 100
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+_local = threading.local()
+_synced_paths = set()
+_sync_lock = threading.Lock()
+
+def get_index_path():
+    return os.path.join(storage.CACHE_DIR, INDEX_FILE_NAME)
+
+def get_connection():
+    """스레드별 연결 (캐시 경로가 바뀌면 새로 연결)"""
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    path = get_index_path()
+    conn = connections.get(path)
+    if conn is None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = sqlite3.connect(path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        connections[path] = conn
+    return conn
+
+def close_connections():
+    for conn in getattr(_local, "connections", {}).values():
+        conn.close()
+    _local.connections = {}
+
+# --- 토큰화 ---
+
+def tokenize(text):
+    """소문자로 바꾼 단어 목록 (글자 / 숫자 묶음)"""
+    return TOKEN_PATTERN.findall((text or "").lower())
+
+def token_grams(token):
+    """단어 → 2-gram 집합 (한 글자면 그 글자)"""
+    if len(token) < 2:
+        return {token}
+    return {token[i:i + 2] for i in range(len(token) - 1)}
+
+def text_grams(text):
+    grams = set()
+    for token in tokenize(text):
+        grams |= token_grams(token)
+    return grams
+
+# --- 색인 ---
+
+def _edition_signature(date, oid):
+    path = storage.find_cache_path(date, oid)
+    if path is None:
+        return None
+    st = os.stat(path)
+    return f"{os.path.basename(path)}:{st.st_size}:{st.st_mtime_ns}"
+
+def _replace_edition(conn, date, oid, newspaper_data, signature):
+    """(date, oid) 지면의 기사를 새 내용으로 교체 (트랜잭션 안에서 호출)"""
+    conn.execute(
+        "DELETE FROM postings WHERE article_id IN (SELECT id FROM articles WHERE date = ? AND oid = ?)",
+        (date, oid)
+    )
+    conn.execute("DELETE FROM articles WHERE date = ? AND oid = ?", (date, oid))
+    for page in newspaper_data or []:
+        for article in page['articles']:
+            cursor = conn.execute(
+                "INSERT INTO articles (date, oid, page, title, subtitle, url) VALUES (?, ?, ?, ?, ?, ?)",
+                (date, oid, article.get('page', page['page']), article['title'], article.get('subtitle') or "", article['url'])
+            )
+            grams = text_grams(article['title']) | text_grams(article.get('subtitle'))
+            conn.executemany(
+                "INSERT OR IGNORE INTO postings (gram, article_id) VALUES (?, ?)",
+                [(gram, cursor.lastrowid) for gram in grams]
+            )
+    conn.execute(
+        "INSERT OR REPLACE INTO editions (date, oid, signature) VALUES (?, ?, ?)",
+        (date, oid, signature)
+    )
+
+def index_edition(date, oid, newspaper_data):
+    """저장된 지면 하나를 색인 (storage.save_news_cache에서 호출)"""
+    conn = get_connection()
+    with conn:
+        _replace_edition(conn, date, oid, newspaper_data, _edition_signature(date, oid))
+
+def remove_edition(date, oid):
+    """지면 하나를 색인에서 뺌 (지면 캐시를 지울 때 호출)"""
+    conn = get_connection()
+    with conn:
+        conn.execute(
+            "DELETE FROM postings WHERE article_id IN (SELECT id FROM articles WHERE date = ? AND oid = ?)",
+            (date, oid)
+        )
+        conn.execute("DELETE FROM articles WHERE date = ? AND oid = ?", (date, oid))
+        conn.execute("DELETE FROM editions WHERE date = ? AND oid = ?", (date, oid))
+
+def sync(verbose=False):
+    """
+    scraped_data의 캐시 중 색인에 없거나 바뀐 지면만 색인 → 새로 색인한 지면 수
+    색인에는 있지만 캐시가 없어진 지면(다른 프로세스가 지움 등)은 색인에서 뺌
+    """
+    conn = get_connection()
+    known = {(row["date"], row["oid"]): row["signature"] for row in conn.execute("SELECT date, oid, signature FROM editions")}
+    updated = 0
+    cached = set()
+    for date in storage.list_cache_dates():
+        for oid in storage.list_cached_media(date):
+            cached.add((date, oid))
+            signature = _edition_signature(date, oid)
+            if signature is None or known.get((date, oid)) == signature:
+                continue
+            newspaper_data = storage.load_news_cache(date, oid)
+            with conn:
+                _replace_edition(conn, date, oid, newspaper_data, signature)
+            updated += 1
+            if verbose:
+                print(f"  색인: {date}/{oid}")
+    for date, oid in set(known) - cached:
+        remove_edition(date, oid)
+        if verbose:
+            print(f"  색인에서 뺌: {date}/{oid}")
+    return updated
+
+def ensure_synced():
+    """프로세스에서 처음 검색할 때 한 번 sync (이후에는 저장할 때마다 색인됨)"""
+    path = get_index_path()
+    if path in _synced_paths:
+        return
+    with _sync_lock:
+        if path not in _synced_paths:
+            sync()
+            _synced_paths.add(path)
+
+def rebuild():
+    """색인을 비우고 처음부터 다시 만듦"""
+    conn = get_connection()
+    with conn:
+        conn.execute("DELETE FROM postings")
+        conn.execute("DELETE FROM articles")
+        conn.execute("DELETE FROM editions")
+    return sync()
+
+# --- 검색 ---
+
+def _filters(start, end, oids):
+    clauses, params = [], []
+    if start:
+        clauses.append("a.date >= ?")
+        params.append(start)
+    if end:
+        clauses.append("a.date <= ?")
+        params.append(end)
+    if oids:
+        clauses.append(f"a.oid IN ({','.join('?' * len(oids))})")
+        params.extend(oids)
+    return clauses, params
+
+def _candidates(conn, grams, start, end, oids):
+    """grams를 모두 가진 기사 행 (날짜 / 언론사 필터 적용, grams가 없으면 필터만)"""
+    clauses, params = _filters(start, end, oids)
+    where = " AND ".join(clauses)
+    if not grams:
+        return conn.execute("SELECT a.* FROM articles a" + (f" WHERE {where}" if where else ""), params).fetchall()
+    placeholders = ",".join("?" * len(grams))
+    sql = (
+        "SELECT a.* FROM articles a JOIN ("
+        f"  SELECT article_id FROM postings WHERE gram IN ({placeholders})"
+        "   GROUP BY article_id HAVING COUNT(*) = ?"
+        ") p ON p.article_id = a.id"
+        + (f" WHERE {where}" if where else "")
+    )
+    return conn.execute(sql, list(grams) + [len(grams)] + params).fetchall()
+
+def search(query, start=None, end=None, oids=None, limit=DEFAULT_LIMIT):
+    """
+    제목 / 부제목에 검색어(띄어쓰기로 나눈 모든 단어)가 들어 있는 기사 (점수 높은 순, 같으면 최신 날짜 순)
+    start / end: YYYYMMDD (포함), oids: 언론사 oid 목록
+    Returns: [{"date", "oid", "page", "title", "subtitle", "url", "score"}]
+    """
+    terms = tokenize(query)
+    if not terms:
+        return []
+    ensure_synced()
+    conn = get_connection()
+
+    # 한 글자 검색어는 더 긴 단어 안에도 있을 수 있으므로 색인 대신 아래 포함 확인으로 거름
+    # (한 글자 검색어만 있으면 필터에 맞는 기사 전체가 후보)
+    grams = set()
+    for term in terms:
+        if len(term) >= 2:
+            grams |= token_grams(term)
+    rows = _candidates(conn, grams, start, end, oids)
+
+    total = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0] or 1
+    matched = []
+    for row in rows:
+        title = row["title"].lower()
+        subtitle = (row["subtitle"] or "").lower()
+        counts = [(title.count(term), subtitle.count(term)) for term in terms]
+        # 2-gram이 모두 있어도 순서가 다를 수 있으므로 실제 포함 여부 확인
+        if all(in_title or in_subtitle for in_title, in_subtitle in counts):
+            matched.append((row, counts))
+
+    # 검색어별 포함 기사 수 (필터 적용 후 후보 기준)
+    document_counts = [sum(1 for _, counts in matched if counts[i] != (0, 0)) for i in range(len(terms))]
+    results = []
+    for row, counts in matched:
+        score = sum(
+            (in_title * TITLE_WEIGHT + in_subtitle) * math.log(1 + total / document_counts[i])
+            for i, (in_title, in_subtitle) in enumerate(counts)
+        )
+        results.append({
+            "date": row["date"],
+            "oid": row["oid"],
+            "page": row["page"],
+            "title": row["title"],
+            "subtitle": row["subtitle"],
+            "url": row["url"],
+            "score": round(score, 3)
+        })
+    results.sort(key=lambda item: (item["score"], item["date"]), reverse=True)
+    return results[:limit]
+
+def get_stats():
+    conn = get_connection()
+    return {
+        "editions": conn.execute("SELECT COUNT(*) FROM editions").fetchone()[0],
+        "articles": conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0],
+        "postings": conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+    }
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="보관 지면 전체 검색 색인")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("sync", help="새로 저장 / 변경된 지면만 색인")
+    sub.add_parser("rebuild", help="색인을 처음부터 다시 만듦")
+    search_parser = sub.add_parser("search", help="검색")
+    search_parser.add_argument("query")
+    search_parser.add_argument("--start", help="시작 날짜 (YYYYMMDD)")
+    search_parser.add_argument("--end", help="끝 날짜 (YYYYMMDD)")
+    search_parser.add_argument("--oid", action="append", help="언론사 oid (여러 번 지정 가능)")
+    search_parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.command == "search":
+        started = time.perf_counter()
+        results = search(args.query, args.start, args.end, args.oid, args.limit)
+        elapsed = (time.perf_counter() - started) * 1000
+        for item in results:
+            print(f"{item['score']:>7.2f}  {item['date']} [{item['oid']}] {item['page']}  {item['title']}")
+        print(f"🔎 {len(results)}건 ({elapsed:.1f}ms)")
+    else:
+        started = time.perf_counter()
+        count = rebuild() if args.command == "rebuild" else sync(verbose=True)
+        stats = get_stats()
+        print(f"✅ {count}개 지면 색인 ({time.perf_counter() - started:.2f}초) - 전체 {stats['editions']}개 지면 / 기사 {stats['articles']}개")
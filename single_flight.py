@@ -0,0 +1,101 @@
+"""
+같은 언론사 / 날짜 스크래핑 합치기 (single-flight)
+- 같은 이벤트 루프 안: (oid, date)당 작업 하나만 실행하고 기다리는 쪽은 그 결과를 함께 받음
+- 다른 스레드의 루프 / 다른 프로세스: scraped_data/.locks/{date}_{oid}.lock 파일 잠금(fcntl)으로 한 곳만 실행,
+  기다린 쪽은 잠금이 풀린 뒤 캐시가 새로 저장됐으면 그 캐시를 사용
+- 강제 새로고침도 진행 중인 스크래핑에 합류 (방금 가져온 결과이므로)
+
+사용법:
+    data = await single_flight.run(oid, date, lambda: scrape(oid, date))
+"""
+
+import asyncio
+import os
+import storage
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: 프로세스 간 잠금 없이 같은 루프 안에서만 합침
+    fcntl = None
+
+# 다른 프로세스의 잠금 확인 주기 (초)
+LOCK_POLL_INTERVAL = 0.1
+
+# 이 시간(초) 동안 잠금을 얻지 못하면 기다리지 않고 직접 실행
+LOCK_TIMEOUT = 300
+
+# 잠금 파일 폴더 (날짜 폴더 밖 - 캐시 정리로 지운 날짜 폴더를 잠금 때문에 다시 만들지 않도록)
+LOCK_DIR_NAME = ".locks"
+
+# 진행 중인 작업: {(루프, oid, date): Task}
+_inflight = {}
+
+def get_lock_path(date, oid):
+    return os.path.join(storage.CACHE_DIR, LOCK_DIR_NAME, f"{date}_{oid}.lock")
+
+def _cache_mtime(date, oid):
+    path = storage.find_cache_path(date, oid)
+    try:
+        return os.stat(path).st_mtime_ns if path else None
+    except FileNotFoundError:
+        return None
+
+async def _acquire_file_lock(path, timeout=LOCK_TIMEOUT):
+    """
+    파일 잠금 획득 (이벤트 루프를 막지 않도록 비차단 시도 + 대기 반복)
+    Returns: (fd, 기다렸는지 여부) - 시간 초과 시 fd는 None
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    waited = False
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return fd, waited
+        except BlockingIOError:
+            if loop.time() >= deadline:
+                os.close(fd)
+                return None, waited
+            waited = True
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+async def _run_exclusive(oid, date, scrape):
+    """프로세스 간 잠금을 잡고 실행 (다른 곳에서 먼저 끝냈으면 그 캐시 반환)"""
+    if fcntl is None:
+        return await scrape()
+
+    before = _cache_mtime(date, oid)
+    fd, waited = await _acquire_file_lock(get_lock_path(date, oid))
+    if fd is None:
+        print(f"[{oid}] Lock wait timed out. Scraping anyway...")
+        return await scrape()
+
+    try:
+        if waited and _cache_mtime(date, oid) != before:
+            cached_data = storage.load_news_cache(date, oid)
+            if cached_data:
+                print(f"[{oid}] Using result of a concurrent scrape")
+                return cached_data
+        return await scrape()
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+async def run(oid, date, scrape):
+    """
+    scrape()(코루틴 함수)를 (oid, date)당 하나만 실행하고 결과를 공유합니다.
+    기다리는 쪽이 취소되어도 진행 중인 스크래핑은 취소되지 않습니다.
+    """
+    loop = asyncio.get_running_loop()
+    key = (loop, oid, date)
+    task = _inflight.get(key)
+    if task is None:
+        task = loop.create_task(_run_exclusive(oid, date, scrape))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        print(f"[{oid}] Joining in-flight scrape")
+    return await asyncio.shield(task)
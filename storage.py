@@ -1,8 +1,20 @@
 import json
 import os
-from datetime import datetime
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: 프로세스 간 잠금 없이 프로세스 안에서만 보호
+    fcntl = None
 
 SCRAPS_FILE = "scraps.json"
+SCRAPS_DB_FILE = "scraps.db"
+SCRAPS_JOURNAL_FILE = "scraps.journal"
 SETTINGS_FILE = "settings.json"
 FOLDERS_FILE = "folders.json"
 CACHE_DIR = "scraped_data"
@@ -25,12 +37,97 @@ def load_json(filename, default):
             try:
                 return json.load(f)
             except json.JSONDecodeError:
+                # 기본값으로 덮어쓰기 전에 원본을 남겨 둠 (스크랩 유실 방지)
+                backup = f"{filename}.corrupt"
+                print(f"[storage] {filename} is not valid JSON. Kept a copy at {backup}")
+                with open(backup, "wb") as out, open(filename, "rb") as src:
+                    out.write(src.read())
                 return default
     return default
 
+# --- 파일 쓰기 / 잠금 ---
+# 쓰기: 같은 폴더의 임시 파일에 쓰고 fsync 후 os.replace로 교체
+#       → 읽는 쪽은 항상 이전 파일 또는 새 파일 전체를 봄 (쓰다 만 파일 없음)
+# 잠금: 읽기-수정-쓰기는 file_lock(path)로 감쌈 ({path}.lock, 권고 잠금)
+#       → 여러 앱 작업자 / 백필 / 사전 수집이 같은 데이터 폴더를 함께 사용
+
+_held_locks = threading.local()
+_fallback_lock = threading.RLock()
+
+def _fsync_dir(path):
+    if os.name != "posix":
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def write_atomic(filename, content):
+    """content(str 또는 bytes)를 filename에 원자적으로 저장 (폴더가 없으면 만듦)"""
+    directory = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(filename)}.", suffix=".tmp", dir=directory)
+    try:
+        # mkstemp는 0600으로 만들므로 기존 파일 권한 유지
+        try:
+            os.chmod(temp_path, os.stat(filename).st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(temp_path, 0o644)
+        mode, encoding = ("wb", None) if isinstance(content, bytes) else ("w", "utf-8")
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, filename)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    _fsync_dir(filename)
+
+@contextmanager
+def file_lock(path, exclusive=True):
+    """
+    path에 대한 독점 잠금 (다른 프로세스 / 스레드는 풀릴 때까지 대기)
+    exclusive=False면 읽기 공유 잠금 (공유끼리는 동시에, 독점과는 배타)
+    같은 스레드에서 다시 잡으면 그대로 통과 (공유 → 독점 승격은 하지 않음)
+    """
+    held = getattr(_held_locks, "paths", None)
+    if held is None:
+        held = _held_locks.paths = {}
+    key = os.path.abspath(path)
+    if key in held:
+        held[key] += 1
+        try:
+            yield
+        finally:
+            held[key] -= 1
+        return
+
+    if fcntl is None:
+        with _fallback_lock:
+            held[key] = 1
+            try:
+                yield
+            finally:
+                del held[key]
+        return
+
+    fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        held[key] = 1
+        try:
+            yield
+        finally:
+            del held[key]
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
 def save_json(filename, data):
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+    write_atomic(filename, json.dumps(data, ensure_ascii=False, indent=4))
 
 def load_settings():
     return load_json(SETTINGS_FILE, DEFAULT_SETTINGS)
@@ -38,8 +135,40 @@ def load_settings():
 def save_settings(settings):
     save_json(SETTINGS_FILE, settings)
 
+# 스크랩 저장 방식: "json"(기본, scraps.json) / "sqlite"(storage_sqlite, scraps.db)
+#                  / "journal"(storage_journal, scraps.json + scraps.journal)
+SCRAPS_BACKEND_ENV = "NEWSROOM_SCRAPS_BACKEND"
+
+def get_scraps_backend():
+    """json이 아닌 저장 방식이면 해당 모듈 반환 (스크랩 함수가 위임)"""
+    name = os.environ.get(SCRAPS_BACKEND_ENV, "json")
+    if name == "sqlite":
+        import storage_sqlite
+        return storage_sqlite
+    if name == "journal":
+        import storage_journal
+        return storage_journal
+    return None
+
 def load_scraps():
-    return load_json(SCRAPS_FILE, {})
+    backend = get_scraps_backend()
+    if backend:
+        return backend.load_scraps()
+    import scrap_index
+    return scrap_index.load_scraps()
+
+def get_scrapped_urls(urls=None):
+    """
+    스크랩된 URL 집합 (urls를 주면 그중 스크랩된 것만)
+    기사 목록의 스크랩 표시용 - 전체 스크랩을 훑지 않음
+    """
+    backend = get_scraps_backend()
+    if backend:
+        return backend.get_scrapped_urls(urls)
+    import scrap_index
+    if urls is None:
+        return scrap_index.get_scrapped_urls()
+    return scrap_index.filter_scrapped(urls)
 
 def load_folders():
     """폴더 목록 로드"""
@@ -51,11 +180,12 @@ def save_folders(folders_data):
 
 def add_folder(folder_name):
     """새 폴더 추가"""
-    folders_data = load_folders()
-    if folder_name not in folders_data["folders"]:
-        folders_data["folders"].append(folder_name)
-        save_folders(folders_data)
-        return True
+    with file_lock(FOLDERS_FILE):
+        folders_data = load_folders()
+        if folder_name not in folders_data["folders"]:
+            folders_data["folders"].append(folder_name)
+            save_folders(folders_data)
+            return True
     return False
 
 def get_folder_list():
@@ -67,28 +197,20 @@ def toggle_scrap(date_str, media_name, article, folder="기본", tags=None):
     스크랩을 추가하거나 이미 존재하면 제거합니다. (Toggle)
     Returns: True if added, False if removed
     """
+    backend = get_scraps_backend()
+    if backend:
+        return backend.toggle_scrap(date_str, media_name, article, folder, tags)
     if tags is None:
         tags = []
-        
-    scraps = load_scraps()
-    if date_str not in scraps:
-        scraps[date_str] = []
-    
-    # 중복 확인 (URL 기준)
-    existing_index = -1
-    for idx, s in enumerate(scraps[date_str]):
-        if s['url'] == article['url']:
-            existing_index = idx
-            break
-    
-    if existing_index != -1:
-        # 이미 존재하면 삭제 (Unscrap)
-        scraps[date_str].pop(existing_index)
-        if not scraps[date_str]:
-            del scraps[date_str]
-        save_json(SCRAPS_FILE, scraps)
-        return False
-    else:
+
+    import scrap_index
+    with scrap_index.mutation() as index:
+        # 중복 확인 (URL 기준)
+        if index.remove(date_str, article['url']):
+            # 이미 존재하면 삭제 (Unscrap)
+            save_json(SCRAPS_FILE, index.scraps)
+            return False
+
         # 없으면 추가 (Scrap)
         scrap_item = article.copy()
         scrap_item['media'] = media_name
@@ -96,42 +218,65 @@ def toggle_scrap(date_str, media_name, article, folder="기본", tags=None):
         scrap_item['read'] = False
         scrap_item['folder'] = folder  # 폴더 추가
         scrap_item['tags'] = tags  # 태그 추가
-        
-        scraps[date_str].append(scrap_item)
-        save_json(SCRAPS_FILE, scraps)
+
+        index.add(date_str, scrap_item)
+        save_json(SCRAPS_FILE, index.scraps)
         return True
 
+def _update_scrap(date_str, url, **fields):
+    """json 저장 방식: 인덱스로 스크랩을 찾아 항목 변경 후 저장"""
+    import scrap_index
+    with scrap_index.mutation() as index:
+        if index.update(date_str, url, **fields):
+            save_json(SCRAPS_FILE, index.scraps)
+            return True
+    return False
+
 def update_scrap_folder(date_str, url, folder):
     """스크랩의 폴더 변경"""
-    scraps = load_scraps()
-    if date_str in scraps:
-        for s in scraps[date_str]:
-            if s['url'] == url:
-                s['folder'] = folder
-                save_json(SCRAPS_FILE, scraps)
-                return True
-    return False
+    backend = get_scraps_backend()
+    if backend:
+        return backend.update_scrap_folder(date_str, url, folder)
+    return _update_scrap(date_str, url, folder=folder)
 
 def update_scrap_tags(date_str, url, tags):
     """스크랩의 태그 변경"""
-    scraps = load_scraps()
-    if date_str in scraps:
-        for s in scraps[date_str]:
-            if s['url'] == url:
-                s['tags'] = tags
-                save_json(SCRAPS_FILE, scraps)
-                return True
-    return False
+    backend = get_scraps_backend()
+    if backend:
+        return backend.update_scrap_tags(date_str, url, tags)
+    return _update_scrap(date_str, url, tags=tags)
 
 def get_scraps_by_folder(folder_name):
     """특정 폴더의 스크랩만 반환"""
-    scraps = load_scraps()
-    result = {}
-    for date_str, items in scraps.items():
-        filtered = [s for s in items if s.get('folder', '기본') == folder_name]
-        if filtered:
-            result[date_str] = filtered
-    return result
+    return query_scraps(folder=folder_name)
+
+def query_scraps(folder=None, tags=None, match="any"):
+    """
+    폴더 / 태그 조건에 맞는 스크랩: {date: [스크랩, ...]} (날짜순)
+    folder: 폴더 이름 (None이면 전체), tags: 태그 목록, match: "any"(하나라도) / "all"(모두)
+    폴더 / 태그 인덱스로 고른 항목만 읽음 (전체 스크랩을 훑지 않음)
+    """
+    backend = get_scraps_backend()
+    if backend:
+        return backend.query_scraps(folder, tags, match)
+    import scrap_index
+    return scrap_index.query_scraps(folder, tags, match)
+
+def count_scraps(folder=None, tags=None, match="any"):
+    """query_scraps와 같은 조건의 스크랩 수 (항목을 만들지 않음)"""
+    backend = get_scraps_backend()
+    if backend:
+        return backend.count_scraps(folder, tags, match)
+    import scrap_index
+    return scrap_index.count_scraps(folder, tags, match)
+
+def get_tag_counts():
+    """태그별 스크랩 수: {태그: 수}"""
+    backend = get_scraps_backend()
+    if backend:
+        return backend.get_tag_counts()
+    import scrap_index
+    return scrap_index.get_tag_counts()
 
 def export_scraps_to_markdown(scraps_data, filename="export.md"):
     """스크랩을 마크다운 파일로 내보내기"""
@@ -161,94 +306,349 @@ def export_scraps_to_markdown(scraps_data, filename="export.md"):
 
 def remove_scrap(date_str, url):
     """특정 스크랩 삭제 (명시적)"""
-    scraps = load_scraps()
-    if date_str in scraps:
-        original_len = len(scraps[date_str])
-        scraps[date_str] = [s for s in scraps[date_str] if s['url'] != url]
-        
-        if len(scraps[date_str]) != original_len:
-            if not scraps[date_str]:
-                del scraps[date_str]
-            save_json(SCRAPS_FILE, scraps)
+    backend = get_scraps_backend()
+    if backend:
+        return backend.remove_scrap(date_str, url)
+    import scrap_index
+    with scrap_index.mutation() as index:
+        if index.remove(date_str, url):
+            save_json(SCRAPS_FILE, index.scraps)
             return True
     return False
 
 def mark_as_read(date_str, url, status=True):
     """읽음 상태 업데이트"""
-    scraps = load_scraps()
-    if date_str in scraps:
-        for s in scraps[date_str]:
-            if s['url'] == url:
-                s['read'] = status
-                save_json(SCRAPS_FILE, scraps)
-                return True
-    return False
+    backend = get_scraps_backend()
+    if backend:
+        return backend.mark_as_read(date_str, url, status)
+    return _update_scrap(date_str, url, read=status)
 
-def get_weekly_scraps():
+def _scrap_date(value):
+    """날짜 / datetime / "YYYY-MM-DD" → 스크랩 날짜 키 (None은 그대로)"""
+    if value is None or isinstance(value, str):
+        return value
+    return value.strftime("%Y-%m-%d")
+
+def get_scraps_between(start=None, end=None):
+    """
+    start ~ end 날짜(포함)의 스크랩 목록 (날짜순, 각 항목에 'date' 추가)
+    start / end: date / datetime / "YYYY-MM-DD" (None이면 처음 / 끝까지)
+    날짜 인덱스로 해당 기간만 읽음 (전체 스크랩을 복사하지 않음)
+    """
+    start, end = _scrap_date(start), _scrap_date(end)
+    backend = get_scraps_backend()
+    if backend:
+        return backend.get_scraps_between(start, end)
+    import scrap_index
+    return scrap_index.get_scraps_between(start, end)
+
+def get_daily_scrap_stats(start=None, end=None):
     """
-    이번 주 월요일 ~ 현재까지의 스크랩 데이터를 모두 가져옵니다.
-    1. 오늘이 일요일(6)이면: 지난 월(0) ~ 토(5) 데이터 수집
-    2. 그 외 요일이면: 이번 주 월(0) ~ 오늘까지 데이터 수집
+    start ~ end 날짜(포함)의 날짜별 집계: {date: {"total", "read", "media", "folder", "tags"}}
+    스크랩할 때마다 갱신되는 집계를 읽음 (스크랩 항목을 읽지 않음)
     """
-    scraps = load_scraps()
-    today = datetime.now()
+    start, end = _scrap_date(start), _scrap_date(end)
+    backend = get_scraps_backend()
+    if backend:
+        return backend.get_daily_stats(start, end)
+    import scrap_index
+    return scrap_index.get_daily_stats(start, end)
+
+def get_scrap_summary(start=None, end=None):
+    """기간 요약: {"total", "read", "unread", "media", "folder", "tags", "days"}"""
+    import scrap_stats
+    daily = get_daily_scrap_stats(start, end)
+    summary = scrap_stats.merge(daily.values())
+    summary["days"] = len(daily)
+    return summary
+
+def get_week_range(today=None):
+    """
+    주간 리포트 기간 (시작, 끝) - "YYYY-MM-DD"
+    1. 오늘이 일요일(6)이면: 지난 월(0) ~ 토(5)
+    2. 그 외 요일이면: 이번 주 월(0) ~ 오늘
+    """
+    today = today or datetime.now()
     weekday = today.weekday() # 월=0, 일=6
-    
-    target_dates = []
-    
-    # 리포트 기준일 설정
-    # 만약 일요일(6)이라면 '지난주 월~토'를 대상으로 함 (요청사항 반영)
     if weekday == 6:
-        days_from_mon = 6 # 일(6) - 월(0) = 6일 전부터
         start_date = today - timedelta(days=6)
         end_date = today - timedelta(days=1) # 어제(토)까지
     else:
-        # 월~토요일인 경우: 이번주 월요일 ~ 오늘
         start_date = today - timedelta(days=weekday)
         end_date = today
+    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+
+def get_weekly_scraps():
+    """
+    이번 주 월요일 ~ 현재까지의 스크랩 데이터를 모두 가져옵니다. (기간은 get_week_range)
+    리포트용 포맷으로 변환 없이 원본에 'date'만 추가해 반환
+    """
+    return get_scraps_between(*get_week_range())
+
+# 지면 캐시 저장 형식: "json"(기본) / "nrc"(cache_format 압축 형식, 보관용)
+# nrc: 디스크 json의 약 29% (벤치마크 storage.save_news_cache.month.nrc), 한 면 / 면 목록만 읽기 빠름 (전체 로드는 압축 해제로 json보다 약간 느림)
+# 읽을 때는 형식과 관계없이 있는 파일을 읽음 (nrc 우선)
+CACHE_FORMAT_ENV = "NEWSROOM_CACHE_FORMAT"
+CACHE_EXTENSIONS = {"nrc": ".nrc", "json": ".json"}
+
+def get_cache_format():
+    name = os.environ.get(CACHE_FORMAT_ENV, "json")
+    return name if name in CACHE_EXTENSIONS else "json"
 
-    # 날짜 리스트 생성
-    curr = start_date
-    while curr <= end_date:
-        d_str = curr.strftime("%Y-%m-%d")
-        if d_str in scraps:
-           for item in scraps[d_str]:
-               # 리포트용 포맷으로 변환 없이 원본 반환
-               # 필요한 경우 날짜 정보도 포함하여 리스트로 만듦
-               item_with_date = item.copy()
-               item_with_date['date'] = d_str
-               target_dates.append(item_with_date)
-        curr += timedelta(days=1)
-        
-    return target_dates
-
-def get_cache_path(date, oid):
-    # 폴더 구조: scraped_data/{date}/{oid}.json
+def get_cache_path(date, oid, cache_format=None):
+    # 폴더 구조: scraped_data/{date}/{oid}.json (또는 .nrc)
+    # 날짜 폴더는 저장할 때 만듦 (조회만 한 날짜에 빈 폴더를 남기지 않음)
+    return os.path.join(CACHE_DIR, date, f"{oid}{CACHE_EXTENSIONS[cache_format or get_cache_format()]}")
+
+def find_cache_path(date, oid):
+    """있는 캐시 파일 경로 (없으면 None)"""
+    for cache_format in CACHE_EXTENSIONS:
+        path = os.path.join(CACHE_DIR, date, f"{oid}{CACHE_EXTENSIONS[cache_format]}")
+        if os.path.exists(path):
+            return path
+    return None
+
+def list_cache_dates():
+    """캐시가 있는 날짜 폴더 목록 (잠금 폴더 등 '.'으로 시작하는 폴더 제외)"""
+    if not os.path.isdir(CACHE_DIR):
+        return []
+    return sorted(
+        name for name in os.listdir(CACHE_DIR)
+        if not name.startswith(".") and os.path.isdir(os.path.join(CACHE_DIR, name))
+    )
+
+def list_cached_media(date):
+    """해당 날짜에 캐시가 있는 언론사 oid 목록 (기사 기록 / 지문 등 부속 파일 제외)"""
     date_dir = os.path.join(CACHE_DIR, date)
-    if not os.path.exists(date_dir):
-        os.makedirs(date_dir)
-    return os.path.join(date_dir, f"{oid}.json")
+    if not os.path.isdir(date_dir):
+        return []
+    oids = set()
+    for name in os.listdir(date_dir):
+        oid, ext = os.path.splitext(name)
+        if ext in CACHE_EXTENSIONS.values() and "." not in oid:
+            oids.add(oid)
+    return sorted(oids)
+
+def save_news_cache(date, oid, data, cache_format=None):
+    """스크랩 결과(지면 데이터)를 파일로 캐싱 (다른 형식의 이전 캐시는 삭제)"""
+    cache_format = cache_format or get_cache_format()
+    path = get_cache_path(date, oid, cache_format)
+    if cache_format == "nrc":
+        import cache_format as nrc
+        write_atomic(path, nrc.encode(data))
+    else:
+        save_json(path, data)
+    import memory_cache
+    memory_cache.put_edition(date, oid, memory_cache.file_signature(path), data)
+    for other in CACHE_EXTENSIONS:
+        if other != cache_format:
+            other_path = get_cache_path(date, oid, other)
+            if os.path.exists(other_path):
+                os.remove(other_path)
+    # 전체 검색 색인 갱신 (색인 실패가 지면 저장을 막지 않도록)
+    import search_index
+    try:
+        search_index.index_edition(date, oid, data)
+    except Exception as e:
+        print(f"[storage] search index update failed for {date}/{oid}: {e}")
 
-def save_news_cache(date, oid, data):
-    """스크랩 결과(지면 데이터)를 파일로 캐싱"""
-    path = get_cache_path(date, oid)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+def has_news_cache(date, oid):
+    """캐시 파일 존재 여부 (내용을 읽지 않음)"""
+    return find_cache_path(date, oid) is not None
 
 def load_news_cache(date, oid):
     """캐시된 데이터가 있으면 반환, 없으면 None"""
-    path = get_cache_path(date, oid)
-    if os.path.exists(path):
+    import cache_manager
+    import memory_cache
+    path = find_cache_path(date, oid)
+    if path is None:
+        memory_cache.discard_edition(date, oid)
+        cache_manager.record_miss()
+        return None
+
+    # 프로세스 메모리 캐시 (파일이 그대로면 읽기 / 파싱 생략)
+    signature = memory_cache.file_signature(path)
+    data = memory_cache.get_edition(date, oid, signature)
+    if data is None:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except:
+            if path.endswith(CACHE_EXTENSIONS["nrc"]):
+                import cache_format as nrc
+                data = nrc.load(path)
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+        except Exception:
             return None
+        memory_cache.put_edition(date, oid, signature, data)
+    # 보관 정책(LRU)용 읽은 시각 / 적중 기록
+    cache_manager.record_hit(path)
+    return data
+
+def load_news_cache_page(date, oid, page_name):
+    """한 면({"page", "articles"})만 로드 (nrc는 해당 면만 풀고, 없으면 None)"""
+    path = find_cache_path(date, oid)
+    if path is None:
+        return None
+    try:
+        if path.endswith(CACHE_EXTENSIONS["nrc"]):
+            import cache_format as nrc
+            import cache_manager
+            page = nrc.load_page(path, page_name)
+            cache_manager.record_hit(path)
+            return page
+    except Exception:
+        return None
+    for page in load_news_cache(date, oid) or []:
+        if page['page'] == page_name:
+            return page
     return None
 
+def load_news_cache_index(date, oid):
+    """면 목록과 기사 수: [{"page", "count"}] (nrc는 기사를 풀지 않음, 없으면 None)"""
+    path = find_cache_path(date, oid)
+    if path is None:
+        return None
+    try:
+        if path.endswith(CACHE_EXTENSIONS["nrc"]):
+            import cache_format as nrc
+            return nrc.load_index(path)
+    except Exception:
+        return None
+    cached_data = load_news_cache(date, oid)
+    if cached_data is None:
+        return None
+    return [{"page": page['page'], "count": len(page['articles'])} for page in cached_data]
+
+def convert_news_cache(date, oid, cache_format="nrc"):
+    """캐시를 다른 형식으로 다시 저장 → 변환 여부"""
+    data = load_news_cache(date, oid)
+    if data is None:
+        return False
+    save_news_cache(date, oid, data, cache_format)
+    return True
+
 def clear_news_cache(date, oid):
-    """특정 캐시 삭제 (강제 새로고침용)"""
-    path = get_cache_path(date, oid)
-    if os.path.exists(path):
-        os.remove(path)
+    """특정 캐시 삭제 (강제 새로고침용, 모든 형식 / 기사 기록 / 지면 지문 / 메모리 캐시 / 검색 색인 포함)"""
+    import memory_cache
+    memory_cache.discard_edition(date, oid)
+    paths = [get_cache_path(date, oid, cache_format) for cache_format in CACHE_EXTENSIONS]
+    for path in paths + [get_article_records_path(date, oid), get_index_fingerprint_path(date, oid)]:
+        if os.path.exists(path):
+            os.remove(path)
+    # 전체 검색 색인에서도 뺌 (색인 실패가 캐시 삭제를 막지 않도록)
+    import search_index
+    try:
+        search_index.remove_edition(date, oid)
+    except Exception as e:
+        print(f"[storage] search index removal failed for {date}/{oid}: {e}")
+
+# --- 기사 단위 기록 (증분 새로고침용) ---
+# scraped_data/{date}/{oid}.articles.json
+# {aid: {"page", "title", "url", "subtitle", "status", "fetched_at"}}
+# status: "ok"(부제목 있음) / "empty"(부제목 없음) / "failed"(가져오기 실패, 다음 새로고침에서 재시도)
+
+ARTICLE_ID_PATTERN = re.compile(r'/article/(?:newspaper/)?\d+/(\d+)')
+
+def get_article_id(url):
+    """기사 URL(/article/newspaper/{oid}/{aid})에서 aid 추출"""
+    match = ARTICLE_ID_PATTERN.search(url)
+    return match.group(1) if match else url
+
+def get_article_records_path(date, oid):
+    return os.path.join(CACHE_DIR, date, f"{oid}.articles.json")
+
+def load_article_records(date, oid):
+    """
+    기사 기록 로드. 기록 파일이 없으면 기존 지면 캐시에서 만듭니다.
+    (기록 도입 이전의 캐시도 증분 새로고침 가능)
+    """
+    records = load_json(get_article_records_path(date, oid), None)
+    if records is not None:
+        return records
+
+    records = {}
+    cached_data = load_news_cache(date, oid)
+    if cached_data:
+        articles = [art for page in cached_data for art in page['articles']]
+        update_article_records(records, articles)
+    return records
+
+def save_article_records(date, oid, records):
+    save_json(get_article_records_path(date, oid), records)
+
+def apply_article_records(newspaper_data, records):
+    """
+    새로 읽은 지면 목록을 기록과 비교합니다.
+    - 제목이 같은 기존 기사: 기록된 부제목을 채움
+    - 새 기사 / 제목이 바뀐 기사 / 이전에 실패한 기사: 반환 목록에 포함 (부제목을 새로 가져와야 함)
+    """
+    pending = []
+    for page in newspaper_data:
+        for article in page['articles']:
+            record = records.get(get_article_id(article['url']))
+            if record and record.get('title') == article['title'] and record.get('status') != "failed":
+                article['subtitle'] = record.get('subtitle', "")
+            else:
+                pending.append(article)
+    return pending
+
+def update_article_records(records, articles, statuses=None):
+    """가져온 기사들을 기록에 반영 (statuses가 없으면 부제목 유무로 판단)"""
+    fetched_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if statuses is None:
+        statuses = ["ok" if article.get('subtitle') else "empty" for article in articles]
+    for article, status in zip(articles, statuses):
+        records[get_article_id(article['url'])] = {
+            "page": article['page'],
+            "title": article['title'],
+            "url": article['url'],
+            "subtitle": article.get('subtitle', ""),
+            "status": status,
+            "fetched_at": fetched_at
+        }
+    return records
+
+def get_subtitle_status_counts(date, oid):
+    """부제목 상태별 기사 수 (ok / empty / failed)"""
+    counts = {"ok": 0, "empty": 0, "failed": 0}
+    for record in load_article_records(date, oid).values():
+        status = record.get('status') or ("ok" if record.get('subtitle') else "empty")
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+def prune_article_records(records, newspaper_data):
+    """현재 지면에 없는 기사 기록 제거"""
+    current_ids = {get_article_id(art['url']) for page in newspaper_data for art in page['articles']}
+    return {aid: record for aid, record in records.items() if aid in current_ids}
+
+
+# --- 지면 목록 지문 (변경 감지용) ---
+# scraped_data/{date}/{oid}.fingerprint.json
+# {"pages": {면 이름: 해시}, "etag", "last_modified", "checked_at"}
+
+def get_index_fingerprint_path(date, oid):
+    return os.path.join(CACHE_DIR, date, f"{oid}.fingerprint.json")
+
+def load_index_fingerprint(date, oid):
+    return load_json(get_index_fingerprint_path(date, oid), {})
+
+def save_index_fingerprint(date, oid, pages, etag=None, last_modified=None):
+    save_json(get_index_fingerprint_path(date, oid), {
+        "pages": pages,
+        "etag": etag,
+        "last_modified": last_modified,
+        "checked_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    })
+
+def get_changed_pages(fingerprint, pages):
+    """이전 지문과 비교해 바뀐(새로 생긴) 면 이름 목록"""
+    previous = fingerprint.get("pages") or {}
+    return [name for name, digest in pages.items() if previous.get(name) != digest]
 
+def is_index_unchanged(date, oid, fingerprint, pages, records):
+    """지문이 같고, 캐시가 있고, 다시 시도할 실패 기사가 없으면 True (새로고침 생략 가능)"""
+    return (
+        fingerprint.get("pages") == pages
+        and has_news_cache(date, oid)
+        and not any(record.get('status') == "failed" for record in records.values())
+    )
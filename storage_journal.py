@@ -0,0 +1,430 @@
+"""
+스냅샷 + 변경 기록(journal) 스크랩 저장소 (일반 파일 유지, 클릭마다 scraps.json 전체 재작성 없음)
+- 스냅샷: scraps.json (기존 형식 그대로)
+- 변경 기록: scraps.journal (JSON 한 줄 = 변경 1건, 추가 후 fsync)
+  {"op": "add" | "remove" | "folder" | "tags" | "read", "date": ..., ...}
+- 첫 줄은 어떤 스냅샷 위의 기록인지 표시: {"op": "snapshot", "id": [크기, mtime_ns]}
+  스냅샷이 바뀌었는데 기록이 그대로면 이미 반영된 기록으로 보고 무시
+- 합치기는 스냅샷을 바꾸기 전에 이전 기록 끝에 {"op": "compacted", "id": 새 스냅샷 id, "pos": 합친 위치} 추가
+  → 스냅샷만 바뀌고 멈춰도 이전 기록의 pos 이후(합치는 동안 늘어난 기록)만 새 스냅샷 위에 다시 적용
+- 시작(첫 호출) 시 스냅샷 + 기록을 재생해 메모리에 보관, 이후에는 늘어난 기록만 읽음
+- 기록이 COMPACT_BYTES를 넘으면 백그라운드 스레드가 새 스냅샷으로 합침 (python storage_journal.py compact)
+- 프로세스 간: scraps.journal.lock 파일 잠금 (storage.file_lock, 읽기 공유 / 쓰기 독점)
+- 메모리 상태에 정렬된 날짜 목록, 날짜별 집계, 폴더 / 태그 인덱스(scrap_stats)를 함께 두고 변경을 적용할 때 갱신
+
+사용: 환경 변수 NEWSROOM_SCRAPS_BACKEND=journal 이면 storage.py가 이 모듈로 위임합니다.
+json 방식으로 되돌릴 때는 먼저 compact로 기록을 스냅샷에 합쳐야 합니다.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+import scrap_stats
+import storage
+
+# 이 크기(바이트)를 넘으면 스냅샷으로 합침
+COMPACT_BYTES = 1024 * 1024
+
+_lock = threading.RLock()
+_compacting = threading.Event()
+
+# 메모리 상태: {"paths", "snapshot_id", "journal_ino", "stale", "pos", "ops", "scraps", "dates", "daily", "groups"}
+_state = None
+
+def get_journal_path():
+    return storage.SCRAPS_JOURNAL_FILE
+
+@contextmanager
+def _locked(exclusive=True):
+    # 메모리 상태는 읽기에서도 갱신되므로 프로세스 안에서는 항상 독점
+    with _lock, storage.file_lock(get_journal_path(), exclusive):
+        yield
+
+def _snapshot_id(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+def _encode(entry):
+    return (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+# --- 변경 적용 (재생 / 클릭 공용) ---
+
+def _find(items, url):
+    for idx, s in enumerate(items):
+        if s['url'] == url:
+            return idx
+    return None
+
+def _apply(state, entry):
+    """변경 1건을 메모리 상태(스크랩 / 날짜 목록 / 집계 / 폴더·태그 인덱스)에 적용 → 바뀌었는지 여부"""
+    scraps, daily, groups = state["scraps"], state["daily"], state["groups"]
+    op = entry["op"]
+    date_str = entry["date"]
+    if op == "add":
+        scraps.setdefault(date_str, []).append(entry["item"])
+        scrap_stats.add_date(state["dates"], date_str)
+        scrap_stats.count(daily, date_str, entry["item"])
+        scrap_stats.group(groups, date_str, entry["item"])
+        return True
+
+    items = scraps.get(date_str, [])
+    idx = _find(items, entry["url"])
+    if idx is None:
+        return False
+    scrap_stats.count(daily, date_str, items[idx], -1)
+    scrap_stats.group(groups, date_str, items[idx], -1)
+    if op == "remove":
+        items.pop(idx)
+        if not items:
+            del scraps[date_str]
+            scrap_stats.remove_date(state["dates"], date_str)
+        # 같은 날짜에 같은 URL이 또 있으면 남은 것을 다시 인덱스에
+        remaining = _find(items, entry["url"])
+        if remaining is not None:
+            scrap_stats.group(groups, date_str, items[remaining])
+        return True
+    if op == "folder":
+        items[idx]['folder'] = entry["folder"]
+    elif op == "tags":
+        items[idx]['tags'] = entry["tags"]
+    elif op == "read":
+        items[idx]['read'] = entry["status"]
+    scrap_stats.count(daily, date_str, items[idx])
+    scrap_stats.group(groups, date_str, items[idx])
+    return True
+
+def _replay(f, state):
+    """
+    열린 기록 파일의 현재 위치부터 끝까지 적용
+    마지막 줄이 끝나지 않았으면(쓰는 도중 중단) 그 줄은 건너뜀
+    Returns: (다음에 읽을 위치, 적용한 줄 수, 스냅샷 표시 줄이 있으면 그 id)
+    """
+    pos = f.tell()
+    ops = 0
+    header = None
+    for line in f:
+        if not line.endswith(b"\n"):
+            break
+        pos += len(line)
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if entry.get("op") == "snapshot":
+            header = entry.get("id")
+            continue
+        if entry.get("op") == "compacted":
+            continue
+        _apply(state, entry)
+        ops += 1
+    return pos, ops, header
+
+def _find_compacted(f, snapshot_id):
+    """기록에서 snapshot_id로 합쳤다는 표시를 찾아 합친 위치를 돌려줌 (없으면 None, 파일 위치는 끝으로 이동)"""
+    compacted_pos = None
+    for line in f:
+        if not line.endswith(b"\n") or b'"compacted"' not in line:
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if entry.get("op") == "compacted" and entry.get("id") == snapshot_id:
+            compacted_pos = entry["pos"]
+    return compacted_pos
+
+def _load_full(paths):
+    snapshot_path, journal_path = paths
+    snapshot_id = _snapshot_id(snapshot_path)
+    scraps = storage.load_json(snapshot_path, {})
+    state = {
+        "paths": paths, "snapshot_id": snapshot_id, "journal_ino": None, "stale": False, "pos": 0, "ops": 0,
+        "scraps": scraps, "dates": sorted(scraps), "daily": scrap_stats.build(scraps),
+        "groups": scrap_stats.build_groups(scraps)
+    }
+    if not os.path.exists(journal_path):
+        return state
+
+    with open(journal_path, "rb") as f:
+        state["journal_ino"] = os.fstat(f.fileno()).st_ino
+        first = f.readline()
+        try:
+            header = json.loads(first).get("id") if first.endswith(b"\n") else None
+        except json.JSONDecodeError:
+            header = None
+        if header != snapshot_id:
+            compacted_pos = _find_compacted(f, snapshot_id)
+            if compacted_pos is None:
+                # 이미 스냅샷에 합쳐진 기록 (다음 쓰기 때 새로 시작)
+                state["stale"] = True
+                state["pos"] = os.fstat(f.fileno()).st_size
+                return state
+            # 스냅샷 교체 후 기록 교체 전에 멈춤 → 합친 위치 이후만 적용
+            f.seek(compacted_pos)
+        state["pos"], state["ops"], _ = _replay(f, state)
+    return state
+
+def _refresh():
+    """메모리 상태를 파일과 맞춤 (잠금 안에서 호출)"""
+    global _state
+    paths = (storage.SCRAPS_FILE, get_journal_path())
+    if (
+        _state is None
+        or _state["paths"] != paths
+        or _state["snapshot_id"] != _snapshot_id(paths[0])
+    ):
+        _state = _load_full(paths)
+        return _state
+
+    try:
+        f = open(paths[1], "rb")
+    except FileNotFoundError:
+        if _state["journal_ino"] is not None:
+            _state = _load_full(paths)
+        return _state
+
+    with f:
+        st = os.fstat(f.fileno())
+        if st.st_ino != _state["journal_ino"] or st.st_size < _state["pos"]:
+            # 다른 프로세스가 합쳤거나 새로 시작한 기록
+            _state = _load_full(paths)
+        elif st.st_size > _state["pos"]:
+            f.seek(_state["pos"])
+            _state["pos"], ops, _ = _replay(f, _state)
+            _state["ops"] += ops
+    return _state
+
+def _start_journal(state):
+    """현재 스냅샷을 가리키는 빈 기록 파일 생성 (잠금 안에서 호출)"""
+    journal_path = state["paths"][1]
+    header = _encode({"op": "snapshot", "id": state["snapshot_id"]})
+    storage.write_atomic(journal_path, header)
+    state["journal_ino"] = os.stat(journal_path).st_ino
+    state["stale"] = False
+    state["pos"] = len(header)
+    state["ops"] = 0
+
+def _write_line(state, entry):
+    """기록 파일 끝(state["pos"])에 한 줄 추가 후 fsync (잠금 안에서 호출)"""
+    line = _encode(entry)
+    with open(state["paths"][1], "r+b") as f:
+        # 쓰다 만 마지막 줄이 있으면 잘라내고 이어 씀
+        f.truncate(state["pos"])
+        f.seek(state["pos"])
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+    state["pos"] += len(line)
+
+def _append(state, entry):
+    """변경 1건을 기록에 추가(fsync)하고 메모리에 적용 (잠금 안에서 호출)"""
+    if state["journal_ino"] is None or state["stale"]:
+        _start_journal(state)
+    _write_line(state, entry)
+    state["ops"] += 1
+    _apply(state, entry)
+
+    if state["pos"] > COMPACT_BYTES and not _compacting.is_set():
+        _compacting.set()
+        # daemon이 아니므로 프로세스 종료 시 합치기가 끝날 때까지 기다림
+        threading.Thread(target=_compact_in_background, name="scraps-compactor").start()
+
+def _copy_scraps(scraps):
+    """호출한 쪽이 고쳐도 메모리 상태가 바뀌지 않도록 복사"""
+    return {
+        date_str: [dict(s, tags=list(s['tags'])) if 'tags' in s else dict(s) for s in items]
+        for date_str, items in scraps.items()
+    }
+
+# --- 합치기 ---
+
+def _write_snapshot(snapshot_path, scraps):
+    """새 스냅샷을 임시 파일에 씀 (교체 전에 스냅샷 id를 기록해야 하므로 write_atomic 대신) → 임시 파일 경로"""
+    # 다른 프로세스가 동시에 합쳐도 임시 파일이 겹치지 않도록
+    tmp_path = f"{snapshot_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(scraps, f, ensure_ascii=False, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    return tmp_path
+
+def compact():
+    """
+    기록을 새 스냅샷(scraps.json)으로 합침 → 합쳤는지 여부
+    스냅샷을 쓰는 동안에는 잠금을 풀어 두고, 그 사이 늘어난 기록은 새 기록 파일로 옮김
+    """
+    with _locked():
+        state = _refresh()
+        if state["ops"] == 0:
+            return False
+        snapshot_path, journal_path = state["paths"]
+        scraps = _copy_scraps(state["scraps"])
+        journal_ino, pos = state["journal_ino"], state["pos"]
+
+    tmp_path = _write_snapshot(snapshot_path, scraps)
+
+    with _locked():
+        state = _refresh()
+        if state["paths"] != (snapshot_path, journal_path) or state["journal_ino"] != journal_ino:
+            # 다른 프로세스가 먼저 합침
+            os.remove(tmp_path)
+            return False
+
+        with open(journal_path, "rb") as f:
+            f.seek(pos)
+            tail = f.read(state["pos"] - pos)
+        snapshot_id = _snapshot_id(tmp_path)
+        # 1. 이전 기록에 합치기 표시 → 2. 스냅샷 교체 → 3. 기록 교체
+        #    (2와 3 사이에 멈추면 다음 재생이 표시를 보고 pos 이후 기록만 새 스냅샷에 적용)
+        _write_line(state, {"op": "compacted", "id": snapshot_id, "pos": pos})
+        os.replace(tmp_path, snapshot_path)
+        storage._fsync_dir(snapshot_path)
+        header = _encode({"op": "snapshot", "id": snapshot_id})
+        storage.write_atomic(journal_path, header + tail)
+
+        state["snapshot_id"] = snapshot_id
+        state["journal_ino"] = os.stat(journal_path).st_ino
+        state["pos"] = len(header) + len(tail)
+        state["ops"] = tail.count(b"\n")
+    return True
+
+def _compact_in_background():
+    try:
+        compact()
+    except Exception as e:
+        print(f"[storage_journal] Compaction failed: {e}")
+    finally:
+        _compacting.clear()
+
+# --- storage.py와 같은 함수 ---
+
+def load_scraps():
+    with _locked(exclusive=False):
+        return _copy_scraps(_refresh()["scraps"])
+
+def get_scrapped_urls(urls=None):
+    """스크랩된 URL 집합 (urls를 주면 그중 스크랩된 것만)"""
+    with _locked(exclusive=False):
+        state = _refresh()
+        # 기록이 늘어나지 않았으면 이전에 만든 집합 재사용
+        version = (state["snapshot_id"], state["journal_ino"], state["pos"])
+        if state.get("urls_version") != version:
+            state["urls"] = {s['url'] for items in state["scraps"].values() for s in items}
+            state["urls_version"] = version
+        scrapped = state["urls"]
+    return set(scrapped) if urls is None else scrapped.intersection(urls)
+
+def toggle_scrap(date_str, media_name, article, folder="기본", tags=None):
+    """
+    스크랩을 추가하거나 이미 존재하면 제거합니다. (Toggle)
+    Returns: True if added, False if removed
+    """
+    with _locked():
+        state = _refresh()
+        if _find(state["scraps"].get(date_str, []), article['url']) is not None:
+            _append(state, {"op": "remove", "date": date_str, "url": article['url']})
+            return False
+
+        scrap_item = article.copy()
+        scrap_item['media'] = media_name
+        scrap_item['scrapped_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        scrap_item['read'] = False
+        scrap_item['folder'] = folder
+        scrap_item['tags'] = list(tags) if tags is not None else []
+        _append(state, {"op": "add", "date": date_str, "item": scrap_item})
+        return True
+
+def _update(date_str, url, entry):
+    """해당 스크랩이 있으면 변경 기록 → 있었는지 여부"""
+    with _locked():
+        state = _refresh()
+        if _find(state["scraps"].get(date_str, []), url) is None:
+            return False
+        _append(state, dict(entry, date=date_str, url=url))
+        return True
+
+def update_scrap_folder(date_str, url, folder):
+    """스크랩의 폴더 변경"""
+    return _update(date_str, url, {"op": "folder", "folder": folder})
+
+def update_scrap_tags(date_str, url, tags):
+    """스크랩의 태그 변경"""
+    return _update(date_str, url, {"op": "tags", "tags": list(tags)})
+
+def get_scraps_between(start=None, end=None):
+    """start ~ end 날짜(포함)의 스크랩 목록 (날짜순, 각 항목에 'date' 추가)"""
+    with _locked(exclusive=False):
+        state = _refresh()
+        return [
+            dict(s, date=date_str, tags=list(s['tags'])) if 'tags' in s else dict(s, date=date_str)
+            for date_str in scrap_stats.dates_between(state["dates"], start, end)
+            for s in state["scraps"][date_str]
+        ]
+
+def get_daily_stats(start=None, end=None):
+    """start ~ end 날짜(포함)의 날짜별 집계: {date: 집계}"""
+    with _locked(exclusive=False):
+        state = _refresh()
+        return {
+            date_str: scrap_stats.copy(state["daily"][date_str])
+            for date_str in scrap_stats.dates_between(state["dates"], start, end)
+        }
+
+def query_scraps(folder=None, tags=None, match="any"):
+    """폴더 / 태그 조건에 맞는 스크랩: {date: [스크랩, ...]} (인덱스로 고른 항목만 복사)"""
+    with _locked(exclusive=False):
+        state = _refresh()
+        keys = scrap_stats.select(state["groups"], folder, tags, match)
+        if keys is None:
+            return _copy_scraps({date_str: state["scraps"][date_str] for date_str in state["dates"]})
+        selected = {}
+        for date_str, url in keys:
+            items = state["scraps"][date_str]
+            idx = _find(items, url)
+            selected.setdefault(date_str, []).append((idx, items[idx]))
+        return _copy_scraps({
+            date_str: [item for _, item in sorted(selected[date_str], key=lambda pair: pair[0])]
+            for date_str in sorted(selected)
+        })
+
+def count_scraps(folder=None, tags=None, match="any"):
+    """폴더 / 태그 조건에 맞는 스크랩 수"""
+    with _locked(exclusive=False):
+        state = _refresh()
+        keys = scrap_stats.select(state["groups"], folder, tags, match)
+        if keys is None:
+            return sum(len(items) for items in state["scraps"].values())
+        return len(keys)
+
+def get_tag_counts():
+    """{태그: 스크랩 수}"""
+    with _locked(exclusive=False):
+        return {tag: len(keys) for tag, keys in _refresh()["groups"]["tags"].items()}
+
+def get_scraps_by_folder(folder_name):
+    """특정 폴더의 스크랩만 반환"""
+    return query_scraps(folder=folder_name)
+
+def remove_scrap(date_str, url):
+    """특정 스크랩 삭제 (명시적)"""
+    return _update(date_str, url, {"op": "remove"})
+
+def mark_as_read(date_str, url, status=True):
+    """읽음 상태 업데이트"""
+    return _update(date_str, url, {"op": "read", "status": status})
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "compact":
+        if compact():
+            print(f"✅ {get_journal_path()}의 변경 기록을 {storage.SCRAPS_FILE}로 합쳤습니다.")
+        else:
+            print("합칠 변경 기록이 없습니다.")
+    else:
+        print("사용법: python storage_journal.py compact")
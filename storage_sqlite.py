@@ -0,0 +1,397 @@
+"""
+SQLite 스크랩 저장소 (scraps.json 전체 재작성 대신 행 단위 갱신)
+- storage.py의 스크랩 함수와 같은 이름 / 같은 반환 형식
+- url, 날짜, 폴더, 태그, 읽음 상태 인덱스 → 스크랩 수가 늘어도 클릭당 지연 시간 일정
+- WAL 모드 (쓰는 동안에도 다른 세션 / 프로세스가 읽기 가능)
+- 날짜별 집계(scrap_stats 테이블)는 트리거로 유지 → 기간 요약에 스크랩 행을 읽지 않음
+- DB를 처음 만들 때 기존 scraps.json을 자동으로 가져옴 (수동: python storage_sqlite.py migrate)
+
+사용: 환경 변수 NEWSROOM_SCRAPS_BACKEND=sqlite 이면 storage.py가 이 모듈로 위임합니다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+import scrap_stats
+import storage
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scraps (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    url TEXT NOT NULL,
+    page TEXT,
+    title TEXT,
+    subtitle TEXT,
+    media TEXT,
+    scrapped_at TEXT,
+    read INTEGER NOT NULL DEFAULT 0,
+    folder TEXT NOT NULL DEFAULT '기본',
+    extra TEXT,
+    UNIQUE (date, url)
+);
+CREATE INDEX IF NOT EXISTS idx_scraps_url ON scraps (url);
+CREATE INDEX IF NOT EXISTS idx_scraps_folder ON scraps (folder);
+CREATE INDEX IF NOT EXISTS idx_scraps_read ON scraps (read);
+CREATE TABLE IF NOT EXISTS scrap_tags (
+    scrap_id INTEGER NOT NULL REFERENCES scraps (id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (scrap_id, tag)
+);
+-- 태그 → 스크랩 id (조회 / 개수 세기에서 테이블을 읽지 않도록 scrap_id까지 포함, 이전 태그 인덱스 대체)
+DROP INDEX IF EXISTS idx_scrap_tags_tag;
+CREATE INDEX IF NOT EXISTS idx_scrap_tags_tag_scrap ON scrap_tags (tag, scrap_id);
+
+-- 날짜별 집계: kind = total / read (key '') / media / folder / tag
+CREATE TABLE IF NOT EXISTS scrap_stats (
+    date TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (date, kind, key)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS scrap_stats_prune AFTER UPDATE OF count ON scrap_stats WHEN new.count <= 0
+BEGIN
+    DELETE FROM scrap_stats WHERE date = new.date AND kind = new.kind AND key = new.key;
+END;
+CREATE TRIGGER IF NOT EXISTS scraps_stats_insert AFTER INSERT ON scraps
+BEGIN
+    INSERT INTO scrap_stats VALUES (new.date, 'total', '', 1) ON CONFLICT DO UPDATE SET count = count + 1;
+    INSERT INTO scrap_stats SELECT new.date, 'read', '', 1 WHERE new.read ON CONFLICT DO UPDATE SET count = count + 1;
+    INSERT INTO scrap_stats VALUES (new.date, 'media', coalesce(new.media, ''), 1) ON CONFLICT DO UPDATE SET count = count + 1;
+    INSERT INTO scrap_stats VALUES (new.date, 'folder', new.folder, 1) ON CONFLICT DO UPDATE SET count = count + 1;
+END;
+-- 태그 행은 ON DELETE CASCADE로 스크랩 행이 지워진 뒤 삭제되므로 스크랩을 지우기 전에 태그 집계를 뺌
+CREATE TRIGGER IF NOT EXISTS scraps_stats_delete_tags BEFORE DELETE ON scraps
+BEGIN
+    UPDATE scrap_stats SET count = count - 1
+    WHERE date = old.date AND kind = 'tag' AND key IN (SELECT tag FROM scrap_tags WHERE scrap_id = old.id);
+END;
+CREATE TRIGGER IF NOT EXISTS scraps_stats_delete AFTER DELETE ON scraps
+BEGIN
+    UPDATE scrap_stats SET count = count - 1 WHERE date = old.date AND kind = 'total';
+    UPDATE scrap_stats SET count = count - 1 WHERE date = old.date AND kind = 'read' AND old.read;
+    UPDATE scrap_stats SET count = count - 1 WHERE date = old.date AND kind = 'media' AND key = coalesce(old.media, '');
+    UPDATE scrap_stats SET count = count - 1 WHERE date = old.date AND kind = 'folder' AND key = old.folder;
+END;
+CREATE TRIGGER IF NOT EXISTS scraps_stats_folder AFTER UPDATE OF folder ON scraps WHEN old.folder IS NOT new.folder
+BEGIN
+    UPDATE scrap_stats SET count = count - 1 WHERE date = old.date AND kind = 'folder' AND key = old.folder;
+    INSERT INTO scrap_stats VALUES (new.date, 'folder', new.folder, 1) ON CONFLICT DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS scraps_stats_read AFTER UPDATE OF read ON scraps WHEN old.read IS NOT new.read
+BEGIN
+    UPDATE scrap_stats SET count = count - 1 WHERE date = old.date AND kind = 'read' AND old.read;
+    INSERT INTO scrap_stats SELECT new.date, 'read', '', 1 WHERE new.read ON CONFLICT DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS scrap_tags_stats_insert AFTER INSERT ON scrap_tags
+BEGIN
+    INSERT INTO scrap_stats SELECT date, 'tag', new.tag, 1 FROM scraps WHERE id = new.scrap_id
+    ON CONFLICT DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS scrap_tags_stats_delete AFTER DELETE ON scrap_tags
+BEGIN
+    UPDATE scrap_stats SET count = count - 1
+    WHERE date = (SELECT date FROM scraps WHERE id = old.scrap_id) AND kind = 'tag' AND key = old.tag;
+END;
+"""
+
+# PRAGMA user_version: 1 = scrap_stats 집계 채움 (이전 DB는 처음 연결할 때 채움)
+SCHEMA_VERSION = 1
+
+# 컬럼으로 저장하는 키 (나머지 키는 extra에 JSON으로 보관)
+ARTICLE_COLUMNS = ["page", "title", "url", "subtitle"]
+SCRAP_COLUMNS = ["media", "scrapped_at", "read", "folder"]
+
+# 잠금 대기 시간 (ms) - 다른 프로세스가 쓰는 중이면 기다림
+BUSY_TIMEOUT = 5000
+
+_local = threading.local()
+
+def get_db_path():
+    return storage.SCRAPS_DB_FILE
+
+def get_connection():
+    """스레드별 연결 (Streamlit 세션마다 스레드가 다름, DB 경로가 바뀌면 새로 연결)"""
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    path = get_db_path()
+    conn = connections.get(path)
+    if conn is None:
+        is_new = not os.path.exists(path)
+        conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT / 1000)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.executescript(SCHEMA)
+        if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            rebuild_stats(conn)
+        connections[path] = conn
+        if is_new and os.path.exists(storage.SCRAPS_FILE):
+            count = migrate_from_json(conn=conn)
+            print(f"[storage_sqlite] Imported {count} scraps from {storage.SCRAPS_FILE}")
+    return conn
+
+def close_connections():
+    """현재 스레드의 연결 닫기"""
+    for conn in getattr(_local, "connections", {}).values():
+        conn.close()
+    _local.connections = {}
+
+# --- 행 <-> 스크랩 dict ---
+
+def _insert_scrap(conn, date_str, item):
+    """스크랩 1건 삽입 (같은 날짜 / URL이 있으면 무시) → 삽입 여부"""
+    extra = {k: v for k, v in item.items() if k not in ARTICLE_COLUMNS + SCRAP_COLUMNS + ["tags"]}
+    cursor = conn.execute(
+        "INSERT OR IGNORE INTO scraps (date, url, page, title, subtitle, media, scrapped_at, read, folder, extra) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            date_str, item['url'], item.get('page'), item.get('title'), item.get('subtitle'),
+            item.get('media'), item.get('scrapped_at'), int(bool(item.get('read', False))),
+            item.get('folder') or '기본', json.dumps(extra, ensure_ascii=False) if extra else None
+        )
+    )
+    if cursor.rowcount == 0:
+        return False
+    _set_tags(conn, cursor.lastrowid, item.get('tags', []))
+    return True
+
+def _set_tags(conn, scrap_id, tags):
+    conn.execute("DELETE FROM scrap_tags WHERE scrap_id = ?", (scrap_id,))
+    conn.executemany(
+        "INSERT OR IGNORE INTO scrap_tags (scrap_id, tag, position) VALUES (?, ?, ?)",
+        [(scrap_id, tag, position) for position, tag in enumerate(tags)]
+    )
+
+def _load_tags(conn, scrap_ids=None):
+    """{scrap_id: [tag, ...]} (저장 순서 유지)"""
+    if scrap_ids is None:
+        queries = [("SELECT scrap_id, tag FROM scrap_tags ORDER BY scrap_id, position", [])]
+    else:
+        # SQLite 변수 개수 제한(999) 이하로 나눠 조회
+        scrap_ids = list(scrap_ids)
+        queries = []
+        for start in range(0, len(scrap_ids), 500):
+            chunk = scrap_ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            queries.append((f"SELECT scrap_id, tag FROM scrap_tags WHERE scrap_id IN ({placeholders}) ORDER BY scrap_id, position", chunk))
+    tags = {}
+    for sql, params in queries:
+        for row in conn.execute(sql, params):
+            tags.setdefault(row["scrap_id"], []).append(row["tag"])
+    return tags
+
+def _row_to_scrap(row, tags):
+    item = {key: row[key] for key in ARTICLE_COLUMNS if row[key] is not None}
+    if row["extra"]:
+        item.update(json.loads(row["extra"]))
+    item['media'] = row["media"]
+    item['scrapped_at'] = row["scrapped_at"]
+    item['read'] = bool(row["read"])
+    item['folder'] = row["folder"]
+    item['tags'] = tags.get(row["id"], [])
+    return item
+
+def _group_by_date(conn, rows, all_rows=False):
+    """행 목록 → {date: [스크랩, ...]} (추가된 순서), all_rows면 태그를 한 번에 전부 읽음"""
+    rows = list(rows)
+    tags = _load_tags(conn) if all_rows else _load_tags(conn, [row["id"] for row in rows])
+    scraps = {}
+    for row in rows:
+        scraps.setdefault(row["date"], []).append(_row_to_scrap(row, tags))
+    return scraps
+
+# --- storage.py와 같은 함수 ---
+
+def load_scraps():
+    conn = get_connection()
+    return _group_by_date(conn, conn.execute("SELECT * FROM scraps ORDER BY id"), all_rows=True)
+
+def get_scrapped_urls(urls=None):
+    """스크랩된 URL 집합 (urls를 주면 그중 스크랩된 것만, url 인덱스 사용)"""
+    conn = get_connection()
+    if urls is None:
+        return {row["url"] for row in conn.execute("SELECT DISTINCT url FROM scraps")}
+    urls = list(urls)
+    found = set()
+    # SQLite 변수 개수 제한(999) 이하로 나눠 조회
+    for start in range(0, len(urls), 500):
+        chunk = urls[start:start + 500]
+        placeholders = ",".join("?" * len(chunk))
+        found.update(row["url"] for row in conn.execute(f"SELECT url FROM scraps WHERE url IN ({placeholders})", chunk))
+    return found
+
+def toggle_scrap(date_str, media_name, article, folder="기본", tags=None):
+    """
+    스크랩을 추가하거나 이미 존재하면 제거합니다. (Toggle)
+    Returns: True if added, False if removed
+    """
+    conn = get_connection()
+    with conn:
+        cursor = conn.execute("DELETE FROM scraps WHERE date = ? AND url = ?", (date_str, article['url']))
+        if cursor.rowcount:
+            return False
+
+        scrap_item = article.copy()
+        scrap_item['media'] = media_name
+        scrap_item['scrapped_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        scrap_item['read'] = False
+        scrap_item['folder'] = folder
+        scrap_item['tags'] = tags if tags is not None else []
+        _insert_scrap(conn, date_str, scrap_item)
+        return True
+
+def update_scrap_folder(date_str, url, folder):
+    """스크랩의 폴더 변경"""
+    conn = get_connection()
+    with conn:
+        cursor = conn.execute("UPDATE scraps SET folder = ? WHERE date = ? AND url = ?", (folder, date_str, url))
+    return cursor.rowcount > 0
+
+def update_scrap_tags(date_str, url, tags):
+    """스크랩의 태그 변경"""
+    conn = get_connection()
+    with conn:
+        row = conn.execute("SELECT id FROM scraps WHERE date = ? AND url = ?", (date_str, url)).fetchone()
+        if row is None:
+            return False
+        _set_tags(conn, row["id"], tags)
+    return True
+
+def _date_range(start, end):
+    """날짜 범위 조건 (start / end가 None이면 제한 없음) → (WHERE 절, 인자)"""
+    clauses, params = [], []
+    if start is not None:
+        clauses.append("date >= ?")
+        params.append(start)
+    if end is not None:
+        clauses.append("date <= ?")
+        params.append(end)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+def get_scraps_between(start=None, end=None):
+    """start ~ end 날짜(포함)의 스크랩 목록 (날짜순, 각 항목에 'date' 추가, (date, url) 인덱스 사용)"""
+    conn = get_connection()
+    where, params = _date_range(start, end)
+    rows = conn.execute(f"SELECT * FROM scraps{where} ORDER BY date, id", params).fetchall()
+    # 기간 안의 스크랩 태그만 (date 인덱스로 조인)
+    tags = {}
+    tag_rows = conn.execute(
+        f"SELECT t.scrap_id, t.tag FROM scraps JOIN scrap_tags t ON t.scrap_id = scraps.id{where} "
+        "ORDER BY t.scrap_id, t.position",
+        params
+    )
+    for row in tag_rows:
+        tags.setdefault(row["scrap_id"], []).append(row["tag"])
+    return [dict(_row_to_scrap(row, tags), date=row["date"]) for row in rows]
+
+def get_daily_stats(start=None, end=None):
+    """start ~ end 날짜(포함)의 날짜별 집계: {date: 집계} (scrap_stats 테이블만 읽음)"""
+    conn = get_connection()
+    daily = {}
+    where, params = _date_range(start, end)
+    for row in conn.execute(f"SELECT date, kind, key, count FROM scrap_stats{where} ORDER BY date", params):
+        stats = daily.setdefault(row["date"], scrap_stats.empty())
+        if row["kind"] in ("total", "read"):
+            stats[row["kind"]] = row["count"]
+        else:
+            stats["tags" if row["kind"] == "tag" else row["kind"]][row["key"]] = row["count"]
+    return {date_str: stats for date_str, stats in daily.items() if stats["total"]}
+
+def rebuild_stats(conn=None):
+    """scrap_stats 집계를 스크랩 행에서 다시 계산"""
+    conn = conn or get_connection()
+    with conn:
+        conn.execute("DELETE FROM scrap_stats")
+        conn.execute("INSERT INTO scrap_stats SELECT date, 'total', '', COUNT(*) FROM scraps GROUP BY date")
+        conn.execute("INSERT INTO scrap_stats SELECT date, 'read', '', COUNT(*) FROM scraps WHERE read GROUP BY date")
+        conn.execute("INSERT INTO scrap_stats SELECT date, 'media', coalesce(media, ''), COUNT(*) FROM scraps GROUP BY date, coalesce(media, '')")
+        conn.execute("INSERT INTO scrap_stats SELECT date, 'folder', folder, COUNT(*) FROM scraps GROUP BY date, folder")
+        conn.execute(
+            "INSERT INTO scrap_stats SELECT s.date, 'tag', t.tag, COUNT(*) "
+            "FROM scrap_tags t JOIN scraps s ON s.id = t.scrap_id GROUP BY s.date, t.tag"
+        )
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+def _group_filter(folder, tags, match):
+    """폴더 / 태그 조건 (folder / tag 인덱스 사용) → (WHERE 절, 인자)"""
+    clauses, params = [], []
+    if folder is not None:
+        clauses.append("folder = ?")
+        params.append(folder)
+    if tags:
+        tags = list(dict.fromkeys(tags))
+        placeholders = ",".join("?" * len(tags))
+        if match == "all":
+            clauses.append(f"id IN (SELECT scrap_id FROM scrap_tags WHERE tag IN ({placeholders}) GROUP BY scrap_id HAVING COUNT(*) = ?)")
+            params.extend(tags + [len(tags)])
+        else:
+            clauses.append(f"id IN (SELECT scrap_id FROM scrap_tags WHERE tag IN ({placeholders}))")
+            params.extend(tags)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+def query_scraps(folder=None, tags=None, match="any"):
+    """폴더 / 태그 조건에 맞는 스크랩: {date: [스크랩, ...]} (날짜순, 같은 날짜는 추가된 순서)"""
+    conn = get_connection()
+    where, params = _group_filter(folder, tags, match)
+    return _group_by_date(conn, conn.execute(f"SELECT * FROM scraps{where} ORDER BY date, id", params))
+
+def count_scraps(folder=None, tags=None, match="any"):
+    """폴더 / 태그 조건에 맞는 스크랩 수 (행을 읽지 않고 COUNT)"""
+    conn = get_connection()
+    where, params = _group_filter(folder, tags, match)
+    return conn.execute(f"SELECT COUNT(*) FROM scraps{where}", params).fetchone()[0]
+
+def get_tag_counts():
+    """{태그: 스크랩 수}"""
+    conn = get_connection()
+    return {row["tag"]: row["count"] for row in conn.execute("SELECT tag, COUNT(*) AS count FROM scrap_tags GROUP BY tag")}
+
+def get_scraps_by_folder(folder_name):
+    """특정 폴더의 스크랩만 반환"""
+    return query_scraps(folder=folder_name)
+
+def remove_scrap(date_str, url):
+    """특정 스크랩 삭제 (명시적)"""
+    conn = get_connection()
+    with conn:
+        cursor = conn.execute("DELETE FROM scraps WHERE date = ? AND url = ?", (date_str, url))
+    return cursor.rowcount > 0
+
+def mark_as_read(date_str, url, status=True):
+    """읽음 상태 업데이트"""
+    conn = get_connection()
+    with conn:
+        cursor = conn.execute("UPDATE scraps SET read = ? WHERE date = ? AND url = ?", (int(bool(status)), date_str, url))
+    return cursor.rowcount > 0
+
+# --- 마이그레이션 ---
+
+def migrate_from_json(json_path=None, conn=None):
+    """scraps.json의 스크랩을 DB로 가져옴 (이미 있는 날짜 / URL은 건너뜀) → 가져온 수"""
+    conn = conn or get_connection()
+    scraps = storage.load_json(json_path or storage.SCRAPS_FILE, {})
+    imported = 0
+    with conn:
+        for date_str, items in scraps.items():
+            for item in items:
+                if _insert_scrap(conn, date_str, item):
+                    imported += 1
+    return imported
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "migrate":
+        json_path = sys.argv[2] if len(sys.argv) > 2 else storage.SCRAPS_FILE
+        print(f"✅ {migrate_from_json(json_path)}개 스크랩을 {get_db_path()}로 가져왔습니다.")
+        print("   NEWSROOM_SCRAPS_BACKEND=sqlite 로 실행하면 DB를 사용합니다.")
+    else:
+        print("사용법: python storage_sqlite.py migrate [scraps.json 경로]")
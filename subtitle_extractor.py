@@ -0,0 +1,185 @@
+"""
+부제목 전용 추출기 (단일 패스, 조기 종료)
+- 문서를 한 번만 훑으며 필요한 4개 요소만 추적
+- 우선순위가 가장 높은 요소가 닫히는 즉시 종료
+- 스트림(청크) 입력 지원: 나머지 본문은 읽지 않음
+우선순위와 공백 제거 규칙은 news_parser.parse_article_subtitle(BeautifulSoup)과 동일합니다.
+"""
+
+from html.parser import HTMLParser
+
+# (태그, 클래스) 우선순위 순서
+SUBTITLE_CANDIDATES = [
+    ("div", "media_end_head_subheadline"),   # 1. Standard Subtitle
+    ("strong", "media_end_summary"),         # 2. Summary
+    ("div", "media_end_summary"),            #    Div Fallback
+    ("div", "media_end_head_guide"),         # 3. Guide
+]
+
+# 닫는 태그가 없는 요소 (BeautifulSoup html.parser 빌더와 동일)
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen",
+    "link", "menuitem", "meta", "param", "source", "track", "wbr",
+    "basefont", "bgsound", "command", "frame", "image", "isindex", "nextid", "spacer",
+}
+
+# get_text()에 포함되지 않는 문자열을 가진 요소
+SKIP_TEXT_ELEMENTS = {"script", "style", "template"}
+
+# 문자열 입력을 나눠 넣는 크기 (청크 사이마다 종료 여부 확인)
+FEED_CHUNK_SIZE = 8192
+
+
+class SubtitleExtractor(HTMLParser):
+    """
+    feed()로 HTML을 나눠 넣을 수 있는 부제목 추출기.
+    done이 True가 되면 더 읽을 필요가 없습니다.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []
+        self.skip_depth = 0
+        self.text_buffer = []
+        # </br> 처럼 이미 닫힌 빈 요소의 닫는 태그는 무시 (BeautifulSoup과 동일)
+        self.closed_void_elements = []
+        # 후보별 상태: None(미발견) / list(수집 중인 문자열) / str(닫힘, 최종 텍스트)
+        self.states = [None] * len(SUBTITLE_CANDIDATES)
+        self.capture_depths = {}
+        self.done = False
+        self.result = None
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag in VOID_ELEMENTS:
+            self.closed_void_elements.append(tag)
+            return
+
+        self.stack.append(tag)
+        if tag in SKIP_TEXT_ELEMENTS:
+            self.skip_depth += 1
+
+        classes = None
+        for idx, (cand_tag, cand_class) in enumerate(SUBTITLE_CANDIDATES):
+            if self.states[idx] is not None or cand_tag != tag:
+                continue
+            if classes is None:
+                classes = (dict(attrs).get("class") or "").split()
+            if cand_class in classes:
+                # select_one과 같이 문서 순서상 첫 요소만 사용
+                self.states[idx] = []
+                self.capture_depths[idx] = len(self.stack)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag in VOID_ELEMENTS:
+            self.closed_void_elements.remove(tag)
+        else:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self.closed_void_elements:
+            self.closed_void_elements.remove(tag)
+            return
+
+        self._flush_text()
+        if tag not in self.stack:
+            return
+
+        # 닫히지 않은 하위 요소까지 함께 닫음 (BeautifulSoup _popToTag와 동일)
+        while self.stack:
+            popped = self.stack.pop()
+            if popped in SKIP_TEXT_ELEMENTS:
+                self.skip_depth -= 1
+            self._close_captures(len(self.stack))
+            if popped == tag:
+                break
+        self._resolve()
+
+    def handle_data(self, data):
+        if self.skip_depth == 0 and self.capture_depths:
+            self.text_buffer.append(data)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    def handle_decl(self, decl):
+        self._flush_text()
+
+    def handle_pi(self, data):
+        self._flush_text()
+
+    def unknown_decl(self, data):
+        self._flush_text()
+        # CDATA는 별도 문자열로 get_text()에 포함됨
+        if data.upper().startswith("CDATA[") and self.skip_depth == 0 and self.capture_depths:
+            self.text_buffer.append(data[len("CDATA["):])
+            self._flush_text()
+
+    def close(self):
+        super().close()
+        self._flush_text()
+        # 문서 끝까지 닫히지 않은 요소도 그때까지의 텍스트를 사용
+        self._close_captures(0)
+        self._resolve(final=True)
+
+    def _flush_text(self):
+        if not self.text_buffer:
+            return
+        text = "".join(self.text_buffer).strip()
+        self.text_buffer = []
+        if not text:
+            return
+        for idx in self.capture_depths:
+            self.states[idx].append(text)
+
+    def _close_captures(self, depth):
+        for idx, capture_depth in list(self.capture_depths.items()):
+            if capture_depth > depth:
+                self.states[idx] = "".join(self.states[idx])
+                del self.capture_depths[idx]
+
+    def _resolve(self, final=False):
+        if self.done:
+            return
+        for state in self.states:
+            if isinstance(state, str):
+                if state:
+                    self.result = state
+                    self.done = True
+                    return
+                continue
+            # 상위 후보가 아직 없거나 열려 있으면 문서 끝까지 결정할 수 없음
+            if not final:
+                return
+        # 모든 후보가 비어 있음
+        self.result = ""
+        self.done = True
+
+    def get_subtitle(self):
+        return self.result or ""
+
+
+def extract_subtitle(content):
+    """기사 HTML 문자열에서 부제목 추출 (우선순위 요소가 닫히면 즉시 종료)"""
+    extractor = SubtitleExtractor()
+    for start in range(0, len(content), FEED_CHUNK_SIZE):
+        extractor.feed(content[start:start + FEED_CHUNK_SIZE])
+        if extractor.done:
+            return extractor.get_subtitle()
+    extractor.close()
+    return extractor.get_subtitle()
+
+
+async def extract_subtitle_from_stream(chunks):
+    """
+    비동기 텍스트 청크(예: httpx response.aiter_text())에서 부제목 추출.
+    결과가 결정되면 나머지 청크는 읽지 않습니다.
+    """
+    extractor = SubtitleExtractor()
+    async for chunk in chunks:
+        extractor.feed(chunk)
+        if extractor.done:
+            return extractor.get_subtitle()
+    extractor.close()
+    return extractor.get_subtitle()
@@ -0,0 +1,47 @@
+"""기사 단위 기록(증분 새로고침) 테스트"""
+
+import storage
+
+def article(aid, title, subtitle=""):
+    return {"page": "A1면", "title": title, "url": f"https://n.news.naver.com/article/newspaper/023/{aid}?date=20260130", "subtitle": subtitle}
+
+def edition(*articles):
+    return [{"page": "A1면", "articles": list(articles)}]
+
+def test_article_id_from_url():
+    assert storage.get_article_id(article("0003956103", "t")['url']) == "0003956103"
+    assert storage.get_article_id("https://n.news.naver.com/article/023/0003956103") == "0003956103"
+    assert storage.get_article_id("https://example.com/other") == "https://example.com/other"
+
+def test_only_new_changed_or_failed_articles_are_pending():
+    records = storage.update_article_records({}, [
+        article("1", "그대로", "부제 1"),
+        article("2", "바뀔 제목", "부제 2"),
+        article("3", "실패했던 기사"),
+        article("4", "사라질 기사", "부제 4"),
+    ], ["ok", "ok", "failed", "ok"])
+
+    data = edition(article("1", "그대로"), article("2", "바뀐 제목"), article("3", "실패했던 기사"), article("5", "새 기사"))
+    pending = storage.apply_article_records(data, records)
+    assert [a['title'] for a in pending] == ["바뀐 제목", "실패했던 기사", "새 기사"]
+    # 바뀌지 않은 기사는 기록된 부제목을 채움
+    assert data[0]['articles'][0]['subtitle'] == "부제 1"
+
+    for a, subtitle in zip(pending, ["새 부제 2", "", "부제 5"]):
+        a['subtitle'] = subtitle
+    storage.update_article_records(records, pending, ["ok", "empty", "ok"])
+    records = storage.prune_article_records(records, data)
+    assert sorted(records) == ["1", "2", "3", "5"]
+    assert records["2"]["title"] == "바뀐 제목"
+    assert records["3"]["status"] == "empty"
+    assert storage.apply_article_records(data, records) == []
+
+def test_records_from_legacy_cache_and_status_counts(temp_storage):
+    storage.save_news_cache("20260130", "023", edition(article("1", "a", "부제"), article("2", "b")))
+    # 기록 파일이 없으면 캐시에서 만듦 (부제목 유무로 상태 판단)
+    records = storage.load_article_records("20260130", "023")
+    assert {aid: r["status"] for aid, r in records.items()} == {"1": "ok", "2": "empty"}
+
+    records["2"]["status"] = "failed"
+    storage.save_article_records("20260130", "023", records)
+    assert storage.get_subtitle_status_counts("20260130", "023") == {"ok": 1, "empty": 0, "failed": 1}
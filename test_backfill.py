@@ -0,0 +1,40 @@
+"""날짜 범위 백필(backfill) 체크포인트 테스트 (httpx 엔진, 네트워크 불필요)"""
+
+import httpx
+
+import backfill
+import fixture_server
+import scraper_httpx
+
+DATE = "20260130"
+
+EDITION = [{"page": "A1면", "articles": [
+    {"page": "A1면", "title": "제목", "url": f"https://n.news.naver.com/article/newspaper/023/1?date={DATE}", "subtitle": ""}
+]}]
+
+def handler(request):
+    path = request.url.path
+    if "/article/" in path:
+        return httpx.Response(200, text=fixture_server.render_article_html({"title": "제목", "subtitle": "부제"}, size=0))
+    if "/023/" in path:
+        return httpx.Response(200, text=fixture_server.render_index_html(EDITION))
+    if "/025/" in path:
+        # 발행 없음 안내
+        return httpx.Response(200, text=fixture_server.render_index_html([]))
+    # 면도 안내도 없는 페이지 (차단 / 로그인)
+    return httpx.Response(200, text="<html><body><p>로그인이 필요합니다</p></body></html>")
+
+def test_only_confirmed_no_edition_is_marked_empty(temp_storage, monkeypatch):
+    monkeypatch.setattr(scraper_httpx, "create_client", lambda limit=scraper_httpx.SEM_LIMIT: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    summary = backfill.backfill_date(DATE, ["023", "025", "020"], "httpx")
+    assert summary["025"] == {"articles": 0, "error": None, "no_edition": True}
+    assert summary["020"]["error"]
+
+    checkpoint = backfill.load_checkpoint(str(temp_storage / "checkpoint.json"))
+    # 오류 없이 빈 결과라도 발행 없음이 확인되지 않았으면 다시 시도
+    summary["030"] = {"articles": 0, "error": None, "no_edition": False}
+    assert backfill.record_summary(checkpoint, DATE, summary) == 1
+    assert checkpoint["done"] == {DATE: ["023"]}
+    assert checkpoint["empty"] == {DATE: ["025"]}
+    assert sorted(checkpoint["failed"][DATE]) == ["020", "030"]
+    assert backfill.pending_media(checkpoint, DATE, ["023", "025", "020", "030"]) == ["020", "030"]
@@ -0,0 +1,74 @@
+"""압축 지면 캐시 형식(.nrc, cache_format) 테스트"""
+
+import os
+
+import pytest
+
+import cache_format
+import storage
+from benchmarks import fixtures
+
+def sample_editions():
+    editions = fixtures.load_sample_editions()
+    assert editions
+    return editions
+
+def test_round_trip_matches_json():
+    for oid, edition in sample_editions().items():
+        data = cache_format.encode(edition)
+        assert cache_format.decode(data) == edition, oid
+
+def test_round_trip_keeps_unusual_fields():
+    edition = [
+        {"page": "A1면", "section": "종합", "articles": [
+            {"page": "A1면", "title": "제목", "url": "https://example.com/a?x=1", "subtitle": "부제"},
+            {"page": "A2면", "title": "다른 면 표기", "url": "https://example.com/b", "subtitle": "", "author": "기자"},
+            {"page": "A1면", "title": "부제 없음", "url": "https://example.com/c"},
+        ]},
+        {"page": "B1면", "articles": []},
+    ]
+    decoded = cache_format.decode(cache_format.encode(edition))
+    assert decoded[0]["section"] == "종합"
+    assert decoded[0]["articles"][1] == edition[0]["articles"][1]
+    # 부제목이 없던 기사는 ""로 저장
+    assert decoded[0]["articles"][2] == dict(edition[0]["articles"][2], subtitle="")
+    assert decoded[1] == edition[1]
+
+def test_load_page_and_index(tmp_path):
+    oid, edition = next(iter(sample_editions().items()))
+    path = str(tmp_path / f"{oid}.nrc")
+    with open(path, "wb") as f:
+        f.write(cache_format.encode(edition))
+
+    assert cache_format.load(path) == edition
+    assert cache_format.load_index(path) == [{"page": page['page'], "count": len(page['articles'])} for page in edition]
+    last = edition[-1]
+    assert cache_format.load_page(path, last['page']) == last
+    assert cache_format.load_page(path, "없는 면") is None
+
+def test_rejects_other_files():
+    with pytest.raises(cache_format.CacheFormatError):
+        cache_format.decode(b'[{"page": "A1"}]')
+    with pytest.raises(cache_format.CacheFormatError):
+        cache_format.decode(b"NRC")
+    future = bytearray(cache_format.encode([]))
+    future[3] = cache_format.VERSION + 1
+    with pytest.raises(cache_format.CacheFormatError):
+        cache_format.decode(bytes(future))
+
+def test_storage_converts_between_formats(temp_storage):
+    oid, edition = next(iter(sample_editions().items()))
+    storage.save_news_cache("20260130", oid, edition)
+    json_size = os.path.getsize(storage.get_cache_path("20260130", oid, "json"))
+
+    assert storage.convert_news_cache("20260130", oid, "nrc")
+    nrc_path = storage.get_cache_path("20260130", oid, "nrc")
+    assert storage.find_cache_path("20260130", oid) == nrc_path
+    assert os.path.getsize(nrc_path) < json_size
+    assert storage.list_cached_media("20260130") == [oid]
+    assert storage.load_news_cache("20260130", oid) == edition
+    assert storage.load_news_cache_page("20260130", oid, edition[0]['page']) == edition[0]
+
+    assert storage.convert_news_cache("20260130", oid, "json")
+    assert storage.find_cache_path("20260130", oid).endswith(".json")
+    assert storage.load_news_cache("20260130", oid) == edition
@@ -0,0 +1,44 @@
+"""지면 캐시 보관 정책(cache_manager) 테스트"""
+
+import os
+
+import cache_manager
+import search_index
+import storage
+
+EDITION = [{"page": "A1면", "articles": [
+    {"page": "A1면", "title": "반도체 수출 회복", "url": "https://n.news.naver.com/article/newspaper/023/1", "subtitle": "부제"}
+]}]
+
+def test_pending_stats_go_to_the_directory_they_were_counted_in(make_storage):
+    first = make_storage()
+    cache_manager.record_miss()
+    cache_manager.record_miss()
+    second = make_storage()
+    cache_manager.record_miss()
+    assert cache_manager.get_usage()["misses"] == 1
+
+    cache_manager.flush_stats()
+    assert storage.load_json(cache_manager.get_stats_path(str(first / "scraped_data")), {})["misses"] == 2
+    assert storage.load_json(cache_manager.get_stats_path(), {})["misses"] == 1
+    assert cache_manager._pending == {}
+    assert os.path.dirname(cache_manager.get_stats_path()) == str(second / "scraped_data")
+
+def test_search_index_counts_toward_budget(temp_storage):
+    storage.save_news_cache("20260130", "023", EDITION)
+    storage.save_news_cache("20260131", "023", EDITION)
+    search_index.ensure_synced()
+    # 20260130을 더 오래전에 읽은 것으로
+    old = storage.find_cache_path("20260130", "023")
+    os.utime(old, (1, os.stat(old).st_mtime))
+    index_bytes = cache_manager.get_shared_bytes()
+    assert index_bytes > 0
+
+    usage = cache_manager.get_usage()
+    assert usage["index_bytes"] == index_bytes
+    assert usage["bytes"] == sum(entry["bytes"] for entry in cache_manager.scan()) + index_bytes
+
+    # 지면 캐시만으로는 예산 안이지만 색인까지 더하면 넘음 → 오래전에 읽은 지면부터 삭제
+    policy = dict(cache_manager.DEFAULT_POLICY, max_bytes=usage["bytes"] - 1)
+    evict = cache_manager.plan(policy)
+    assert [(entry["date"], reason) for entry, reason in evict] == [("20260130", "budget")]
@@ -0,0 +1,147 @@
+"""요청 동시성 / 재시도 제어(fetch_control) 테스트"""
+
+import asyncio
+import contextlib
+import time
+
+import fetch_control
+
+def test_additive_increase_after_limit_successes():
+    limiter = fetch_control.AdaptiveLimiter(4, max_limit=6)
+    for _ in range(3):
+        limiter.record(0.1, ok=True)
+    assert limiter.limit == 4
+    limiter.record(0.1, ok=True)
+    assert limiter.limit == 5
+    # 다음 증가에는 새 한도만큼의 성공이 필요
+    for _ in range(4):
+        limiter.record(0.1, ok=True)
+    assert limiter.limit == 5
+    for _ in range(20):
+        limiter.record(0.1, ok=True)
+    assert limiter.limit == 6
+
+def test_multiplicative_decrease_with_cooldown(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(fetch_control.time, "monotonic", lambda: now[0])
+    limiter = fetch_control.AdaptiveLimiter(16, min_limit=3)
+
+    limiter.record(0.1, ok=False)
+    assert limiter.limit == 8
+    # 같은 혼잡으로 연달아 실패해도 쿨다운 동안은 한 번만 줄임
+    limiter.record(0.1, ok=False)
+    assert limiter.limit == 8
+
+    now[0] += fetch_control.DECREASE_COOLDOWN
+    # 느린 정상 응답도 과부하 신호
+    limiter.record(fetch_control.LATENCY_THRESHOLD + 1, ok=True)
+    assert limiter.limit == 4
+    now[0] += fetch_control.DECREASE_COOLDOWN
+    limiter.record(0.1, ok=False)
+    assert limiter.limit == 3
+
+def test_timeout_follows_latency():
+    limiter = fetch_control.AdaptiveLimiter(4)
+    assert limiter.timeout() == fetch_control.TIMEOUT_MIN
+    for _ in range(30):
+        limiter.record(1.5, ok=True)
+    assert abs(limiter.timeout() - 6.0) < 0.1
+    for _ in range(30):
+        limiter.record(5.0, ok=False)
+    assert limiter.timeout() == fetch_control.TIMEOUT_MAX
+
+def test_limiter_caps_in_flight_requests():
+    limiter = fetch_control.AdaptiveLimiter(3)
+    peak = [0]
+
+    async def task():
+        async with limiter:
+            peak[0] = max(peak[0], limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*[task() for _ in range(20)])
+
+    asyncio.run(main())
+    assert peak[0] == 3
+    assert limiter.in_flight == 0
+
+def test_token_bucket_allows_burst_then_rate():
+    bucket = fetch_control.TokenBucket(rate=100, burst=5)
+
+    async def acquire(count):
+        start = time.monotonic()
+        for _ in range(count):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(acquire(5)) < 0.02
+    # 순간 허용량을 다 쓴 뒤에는 초당 rate개
+    assert asyncio.run(acquire(10)) >= 0.08
+
+def test_fetch_retries_then_reports_status(monkeypatch):
+    monkeypatch.setattr(fetch_control, "BACKOFF_BASE", 0)
+    controller = fetch_control.FetchController(4, max_retries=2)
+    calls = []
+
+    async def flaky(url, timeout):
+        calls.append(url)
+        if len(calls) < 3:
+            raise RuntimeError("HTTP 503")
+        return "부제목"
+
+    async def broken(url, timeout):
+        raise RuntimeError("HTTP 500")
+
+    async def no_subtitle(url, timeout):
+        return ""
+
+    async def main():
+        return [
+            await controller.fetch(flaky, "https://n.news.naver.com/a"),
+            await controller.fetch(broken, "https://n.news.naver.com/b"),
+            await controller.fetch(no_subtitle, "https://n.news.naver.com/c"),
+        ]
+
+    results = asyncio.run(main())
+    assert results == [("부제목", fetch_control.STATUS_OK), ("", fetch_control.STATUS_FAILED), ("", fetch_control.STATUS_EMPTY)]
+    assert len(calls) == 3
+    assert controller.stats == {"ok": 1, "empty": 1, "failed": 1, "retries": 4}
+
+def test_lease_wait_is_not_latency():
+    controller = fetch_control.FetchController(4, max_retries=1)
+    latencies = []
+    record = controller.limiter.record
+    controller.limiter.record = lambda latency, ok: (latencies.append(latency), record(latency, ok))
+    pages = asyncio.Semaphore(1)
+    released = []
+
+    @contextlib.asynccontextmanager
+    async def lease():
+        async with pages:
+            healthy = False
+            try:
+                yield "page"
+                healthy = True
+            finally:
+                released.append(healthy)
+
+    async def load(url, timeout, page):
+        assert page == "page"
+        await asyncio.sleep(0.05)
+        if url.endswith("fail"):
+            raise RuntimeError("HTTP 503")
+        return "부제목"
+
+    async def main():
+        return await asyncio.gather(*[controller.fetch(load, f"https://n.news.naver.com/{i}", lease=lease) for i in range(4)],
+                                    controller.fetch(load, "https://n.news.naver.com/fail", lease=lease))
+
+    results = asyncio.run(main())
+    assert results[:4] == [("부제목", fetch_control.STATUS_OK)] * 4
+    assert results[4] == ("", fetch_control.STATUS_FAILED)
+    # 페이지 하나를 차례로 기다렸지만 기록된 지연 시간은 요청 하나의 시간
+    assert len(latencies) == 6 and max(latencies) < 0.15
+    # 실패한 시도는 lease에 전달됨 (페이지 초기화)
+    assert released.count(False) == 2
+    assert controller.limiter.in_flight == 0
@@ -0,0 +1,63 @@
+"""지면 메모리 캐시(memory_cache) 테스트"""
+
+import memory_cache
+import storage
+from benchmarks import fixtures
+
+def test_evicts_least_recently_used_within_budget():
+    lru = memory_cache.ByteLRU(300)
+    lru.put("a", 1, "A", 100)
+    lru.put("b", 1, "B", 100)
+    lru.put("c", 1, "C", 100)
+    assert lru.get("a", 1) == "A"
+
+    # 가장 오래전에 쓴 b가 빠짐
+    lru.put("d", 1, "D", 100)
+    assert lru.get("b", 1) is None
+    assert [lru.get(key, 1) for key in "acd"] == ["A", "C", "D"]
+    stats = lru.stats()
+    assert stats["bytes"] == 300
+    assert stats["entries"] == 3
+    assert stats["evictions"] == 1
+
+    # 큰 항목 하나가 여러 개를 밀어냄, 예산보다 큰 항목은 보관하지 않음
+    lru.put("e", 1, "E", 250)
+    assert lru.stats()["entries"] == 1
+    lru.put("f", 1, "F", 301)
+    assert lru.get("f", 1) is None
+    assert lru.get("e", 1) == "E"
+
+def test_signature_mismatch_invalidates():
+    lru = memory_cache.ByteLRU(1000)
+    lru.put("a", ("path", 10), "old", 100)
+    lru.put("a", ("path", 10), "new", 200)
+    assert lru.stats()["bytes"] == 200
+    assert lru.get("a", ("path", 11)) is None
+    assert lru.get("a", ("path", 10)) is None
+    stats = lru.stats()
+    assert stats["invalidations"] == 1
+    assert stats["bytes"] == 0
+
+def test_load_news_cache_uses_memory_and_detects_rewrites(temp_storage):
+    editions = fixtures.load_sample_editions()
+    oid, edition = next(iter(editions.items()))
+    memory_cache.news_cache.clear()
+    storage.save_news_cache("20260130", oid, edition)
+    hits = memory_cache.stats()["hits"]
+
+    data = storage.load_news_cache("20260130", oid)
+    assert data == edition
+    assert memory_cache.stats()["hits"] == hits + 1
+    # 돌려준 복사본을 고쳐도 캐시는 그대로
+    data[0]['articles'][0]['title'] = "수정"
+    data[0]['articles'].clear()
+    assert storage.load_news_cache("20260130", oid) == edition
+
+    # 다른 프로세스가 파일을 새로 씀 → 파일 기준으로 다시 읽음
+    changed = [dict(edition[0], articles=edition[0]['articles'][:1])]
+    storage.save_json(storage.get_cache_path("20260130", oid), changed)
+    assert storage.load_news_cache("20260130", oid) == changed
+
+    storage.clear_news_cache("20260130", oid)
+    assert storage.load_news_cache("20260130", oid) is None
+    memory_cache.news_cache.clear()
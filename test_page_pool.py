@@ -0,0 +1,130 @@
+"""Playwright 페이지 풀(page_pool) 테스트 (가짜 컨텍스트 / 페이지, 브라우저 불필요)"""
+
+import asyncio
+
+import pytest
+
+import page_pool
+
+class FakePage:
+    def __init__(self, number, fail_reset=False):
+        self.number = number
+        self.fail_reset = fail_reset
+        self.closed = False
+        self.visited = []
+
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url, timeout=None):
+        if self.fail_reset:
+            raise RuntimeError("page crashed")
+        self.visited.append(url)
+
+    async def close(self):
+        self.closed = True
+
+class FakeContext:
+    def __init__(self, fail_reset=False):
+        self.pages = []
+        self.fail_reset = fail_reset
+
+    async def new_page(self):
+        await asyncio.sleep(0)
+        page = FakePage(len(self.pages), self.fail_reset)
+        self.pages.append(page)
+        return page
+
+def test_leases_never_exceed_size_and_reuse_pages():
+    context = FakeContext()
+    pool = page_pool.PagePool(context, 3)
+    leased = set()
+    peak = [0]
+
+    async def task():
+        async with pool.lease() as page:
+            # 같은 페이지를 두 요청이 동시에 쓰지 않음
+            assert page not in leased
+            leased.add(page)
+            peak[0] = max(peak[0], len(leased))
+            await asyncio.sleep(0.005)
+            leased.discard(page)
+
+    async def main():
+        await asyncio.gather(*[task() for _ in range(30)])
+        await pool.close()
+
+    asyncio.run(main())
+    assert peak[0] == 3
+    assert len(context.pages) == 3
+    assert all(page.closed for page in context.pages)
+
+def test_failed_lease_resets_page():
+    context = FakeContext()
+    pool = page_pool.PagePool(context, 1)
+
+    async def main():
+        with pytest.raises(ValueError):
+            async with pool.lease():
+                raise ValueError("parse failed")
+        async with pool.lease() as page:
+            return page
+
+    page = asyncio.run(main())
+    assert page.visited == ["about:blank"]
+    assert len(context.pages) == 1
+
+def test_unresettable_or_closed_pages_are_replaced():
+    context = FakeContext(fail_reset=True)
+    pool = page_pool.PagePool(context, 1)
+
+    async def main():
+        with pytest.raises(ValueError):
+            async with pool.lease():
+                raise ValueError("navigation failed")
+        # 초기화에 실패한 페이지는 닫고 새로 만듦
+        async with pool.lease() as page:
+            second = page
+        # 반납 후 닫힌(크래시) 페이지도 대여 시 버림
+        second.closed = True
+        async with pool.lease() as page:
+            return second, page
+
+    second, third = asyncio.run(main())
+    assert context.pages[0].closed
+    assert second is context.pages[1]
+    assert third is context.pages[2]
+    assert pool.created == 1
+
+def test_close_closes_leased_page_on_release():
+    context = FakeContext()
+    pool = page_pool.PagePool(context, 2)
+
+    async def main():
+        async with pool.lease() as page:
+            await pool.close()
+            assert not page.closed
+        return page
+
+    page = asyncio.run(main())
+    assert page.closed
+    assert pool.created == 0
+
+def test_closed_pool_refuses_leases():
+    context = FakeContext()
+    pool = page_pool.PagePool(context, 1)
+
+    async def main():
+        async with pool.lease():
+            waiting = asyncio.ensure_future(pool.acquire())
+            await asyncio.sleep(0)
+            await pool.close()
+        # 기다리던 요청도 새 페이지를 열지 않고 실패
+        with pytest.raises(RuntimeError):
+            await waiting
+        with pytest.raises(RuntimeError):
+            await pool.acquire()
+
+    asyncio.run(main())
+    assert len(context.pages) == 1
+    assert pool.created == 0
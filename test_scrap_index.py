@@ -0,0 +1,70 @@
+"""스크랩 URL 인덱스(scrap_index, json 저장 방식) 테스트"""
+
+import scrap_index
+import storage
+
+def article(i):
+    return {"page": "A1면", "title": f"기사 {i}", "url": f"https://n.news.naver.com/article/001/{i}", "subtitle": ""}
+
+def test_positions_follow_removals(temp_storage):
+    for i in range(5):
+        storage.toggle_scrap("2026-01-30", "조선일보", article(i))
+    storage.remove_scrap("2026-01-30", article(1)['url'])
+
+    index = scrap_index.get_index()
+    items = index.scraps["2026-01-30"]
+    for i in (0, 2, 3, 4):
+        assert items[index.find("2026-01-30", article(i)['url'])]['url'] == article(i)['url']
+    assert index.find("2026-01-30", article(1)['url']) is None
+    urls = [article(i)['url'] for i in range(6)]
+    assert storage.get_scrapped_urls(urls) == {article(i)['url'] for i in (0, 2, 3, 4)}
+
+def test_reloads_after_external_edit(temp_storage):
+    storage.toggle_scrap("2026-01-30", "조선일보", article(1))
+    assert storage.get_scrapped_urls() == {article(1)['url']}
+
+    # 다른 프로세스 / 직접 편집으로 파일이 바뀜
+    scraps = storage.load_json(storage.SCRAPS_FILE, {})
+    scraps["2026-01-31"] = [dict(article(2), media="중앙일보", read=True, folder="경제", tags=[])]
+    storage.save_json(storage.SCRAPS_FILE, scraps)
+
+    assert storage.get_scrapped_urls() == {article(1)['url'], article(2)['url']}
+    assert storage.count_scraps(folder="경제") == 1
+    assert storage.get_daily_scrap_stats()["2026-01-31"]["read"] == 1
+
+def test_returned_copies_do_not_change_index(temp_storage):
+    storage.toggle_scrap("2026-01-30", "조선일보", article(1), tags=["정책"])
+    scraps = storage.load_scraps()
+    scraps["2026-01-30"][0]['tags'].append("시장")
+    scraps["2026-01-30"][0]['read'] = True
+    storage.get_scraps_between()[0]['tags'].append("인물")
+
+    item = storage.load_scraps()["2026-01-30"][0]
+    assert item['tags'] == ["정책"]
+    assert not item['read']
+    assert storage.get_tag_counts() == {"정책": 1}
+
+def test_caller_tag_lists_are_not_shared(temp_storage):
+    tags = ["정책"]
+    storage.toggle_scrap("2026-01-30", "조선일보", article(1), tags=tags)
+    tags.append("시장")
+    new_tags = ["인물"]
+    storage.toggle_scrap("2026-01-30", "조선일보", article(2))
+    storage.update_scrap_tags("2026-01-30", article(2)['url'], new_tags)
+    new_tags.append("칼럼")
+
+    assert storage.get_tag_counts() == {"정책": 1, "인물": 1}
+    assert storage.count_scraps(tags=["시장", "칼럼"]) == 0
+    assert [s['tags'] for s in storage.load_scraps()["2026-01-30"]] == [["정책"], ["인물"]]
+
+def test_duplicate_urls_in_edited_file(temp_storage):
+    duplicate = dict(article(1), media="조선일보", read=False, folder="기본", tags=["a"])
+    storage.save_json(storage.SCRAPS_FILE, {"2026-01-30": [duplicate, dict(duplicate, tags=["b"])]})
+
+    # 앞의 항목부터 지우고, 남은 항목은 계속 스크랩된 상태
+    assert storage.remove_scrap("2026-01-30", article(1)['url'])
+    assert storage.get_scrapped_urls() == {article(1)['url']}
+    assert storage.get_tag_counts() == {"b": 1}
+    assert storage.remove_scrap("2026-01-30", article(1)['url'])
+    assert storage.get_scrapped_urls() == set()
+    assert storage.load_scraps() == {}
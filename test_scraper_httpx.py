@@ -0,0 +1,115 @@
+"""httpx 스크래퍼 증분 새로고침 테스트 (httpx.MockTransport, 네트워크 불필요)"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import fixture_server
+import memory_cache
+import news_parser
+import scraper_httpx
+import storage
+
+DATE = "20260130"
+OID = "023"
+
+def article(aid, title):
+    return {"page": "A1면", "title": title, "url": f"https://n.news.naver.com/article/newspaper/{OID}/{aid}?date={DATE}", "subtitle": ""}
+
+class FakeNaver:
+    """지면 목록(ETag 지원) + 기사 페이지, 받은 요청을 기록"""
+
+    def __init__(self, articles, etag='"v1"'):
+        self.articles = articles
+        self.etag = etag
+        self.requests = []
+        # 지면 목록 대신 돌려줄 HTML (차단 페이지 등)
+        self.index_body = None
+
+    def handler(self, request):
+        self.requests.append(request)
+        if "/newspaper" in request.url.path and "/article/" not in request.url.path:
+            if self.etag and request.headers.get("if-none-match") == self.etag:
+                return httpx.Response(304)
+            body = self.index_body or fixture_server.render_index_html([{"page": "A1면", "articles": self.articles}] if self.articles else [])
+            return httpx.Response(200, text=body, headers={"etag": self.etag} if self.etag else {})
+        aid = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, text=fixture_server.render_article_html({"title": aid, "subtitle": f"부제 {aid}"}, size=0))
+
+    def article_requests(self):
+        return [r.url.path.rsplit("/", 1)[-1] for r in self.requests if "/article/" in r.url.path]
+
+def scrape(server):
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(server.handler)) as client:
+            return await scraper_httpx.get_newspaper_data_httpx(client, OID, DATE, force_refresh=True)
+    return asyncio.run(main())
+
+def test_unchanged_index_skips_subtitles(temp_storage):
+    server = FakeNaver([article("1", "첫 기사"), article("2", "둘째 기사")])
+    data = scrape(server)
+    assert [a['subtitle'] for a in data[0]['articles']] == ["부제 1", "부제 2"]
+    assert sorted(server.article_requests()) == ["1", "2"]
+
+    # 304 → 캐시 그대로
+    server.requests.clear()
+    assert scrape(server) == data
+    assert server.requests[0].headers["if-none-match"] == '"v1"'
+    assert server.article_requests() == []
+
+    # ETag가 없어도 지면 지문이 같으면 부제목 요청 생략
+    server.etag = None
+    server.requests.clear()
+    assert scrape(server) == data
+    assert server.article_requests() == []
+
+def test_only_changed_articles_are_fetched(temp_storage):
+    server = FakeNaver([article("1", "첫 기사"), article("2", "둘째 기사")])
+    scrape(server)
+    server.articles = [article("1", "첫 기사"), article("2", "제목 수정"), article("3", "새 기사")]
+    server.etag = '"v2"'
+    server.requests.clear()
+
+    data = scrape(server)
+    assert sorted(server.article_requests()) == ["2", "3"]
+    assert [a['title'] for a in data[0]['articles']] == ["첫 기사", "제목 수정", "새 기사"]
+    assert storage.load_news_cache(DATE, OID) == data
+
+def test_not_modified_without_usable_cache_refetches(temp_storage):
+    server = FakeNaver([article("1", "첫 기사")])
+    expected = scrape(server)
+    # 캐시 파일이 깨짐 (지문 / 기사 기록은 남아 있음)
+    with open(storage.find_cache_path(DATE, OID), "w", encoding="utf-8") as f:
+        f.write("{")
+    memory_cache.news_cache.clear()
+    server.requests.clear()
+
+    assert scrape(server) == expected
+    index_requests = [r for r in server.requests if "/article/" not in r.url.path]
+    assert len(index_requests) == 2
+    assert "if-none-match" not in index_requests[1].headers
+    assert storage.load_news_cache(DATE, OID) == expected
+
+def test_index_unchanged_requires_cache_and_no_failures(temp_storage):
+    records = storage.update_article_records({}, [dict(article("1", "a"), subtitle="부제")])
+    pages = {"A1면": "digest"}
+    fingerprint = {"pages": pages}
+    assert not storage.is_index_unchanged(DATE, OID, fingerprint, pages, records)
+    storage.save_news_cache(DATE, OID, [{"page": "A1면", "articles": [article("1", "a")]}])
+    assert storage.is_index_unchanged(DATE, OID, fingerprint, pages, records)
+    assert not storage.is_index_unchanged(DATE, OID, fingerprint, {"A1면": "other"}, records)
+    assert storage.get_changed_pages(fingerprint, {"A1면": "other", "A2면": "x"}) == ["A1면", "A2면"]
+    records["1"]["status"] = "failed"
+    assert not storage.is_index_unchanged(DATE, OID, fingerprint, pages, records)
+
+def test_empty_index_requires_no_edition_notice(temp_storage):
+    server = FakeNaver([])
+    # 발행 없음 안내가 있으면 빈 지면 (확인된 발행 없음)
+    data = scrape(server)
+    assert data == [] and isinstance(data, news_parser.NoEdition)
+    # 면도 안내도 없는 페이지 (차단 / 로그인 / 구조 변경)는 실패
+    server.index_body = "<html><body><p>로그인이 필요합니다</p></body></html>"
+    with pytest.raises(RuntimeError):
+        scrape(server)
+    assert not storage.has_news_cache(DATE, OID)
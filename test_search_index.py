@@ -0,0 +1,90 @@
+"""보관 지면 전체 검색(search_index) 테스트"""
+
+import os
+
+import cache_manager
+import search_index
+import storage
+from benchmarks import fixtures
+
+def article(title, subtitle="", aid=1):
+    return {"page": "A1면", "title": title, "url": f"https://n.news.naver.com/article/newspaper/001/{aid}", "subtitle": subtitle}
+
+def edition(*articles):
+    return [{"page": "A1면", "articles": list(articles)}]
+
+def brute_search(editions, query):
+    terms = search_index.tokenize(query)
+    if not terms:
+        return set()
+    return {
+        (date, oid, a['url'])
+        for (date, oid), data in editions.items()
+        for page in data
+        for a in page['articles']
+        if all(term in a['title'].lower() or term in (a.get('subtitle') or "").lower() for term in terms)
+    }
+
+def test_hits_match_substring_search(temp_storage):
+    samples = fixtures.load_sample_editions()
+    editions = {("20260130", oid): data for oid, data in samples.items()}
+    titles = [a['title'] for data in samples.values() for page in data for a in page['articles']]
+    for (date, oid), data in editions.items():
+        storage.save_news_cache(date, oid, data)
+
+    # 실제 제목에서 뽑은 단어 + 한 글자 / 없는 단어
+    queries = [titles[0].split()[0], titles[-1].split()[-1], "정부 발표", "한", "zzzz없는검색어", "   "]
+    for query in queries:
+        results = search_index.search(query, limit=10000)
+        assert {(r['date'], r['oid'], r['url']) for r in results} == brute_search(editions, query), query
+        scores = [(r['score'], r['date']) for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+def test_title_match_ranks_above_subtitle_match(temp_storage):
+    storage.save_news_cache("20260130", "001", edition(
+        article("경제 전망", aid=1),
+        article("오늘의 소식", "반도체 수출 증가", aid=2),
+        article("반도체 공장 증설", aid=3),
+    ))
+    results = search_index.search("반도체")
+    assert [r['url'][-1] for r in results] == ["3", "2"]
+    assert search_index.search("반도체 공장")[0]['title'] == "반도체 공장 증설"
+    # 2-gram은 모두 있지만 순서가 다른 단어는 제외
+    assert search_index.search("체도반") == []
+
+def test_resave_replaces_articles_and_filters_apply(temp_storage):
+    storage.save_news_cache("20260129", "001", edition(article("금리 동결", aid=1)))
+    storage.save_news_cache("20260130", "002", edition(article("금리 인상", aid=2)))
+    assert len(search_index.search("금리")) == 2
+    assert [r['date'] for r in search_index.search("금리", start="20260130")] == ["20260130"]
+    assert [r['oid'] for r in search_index.search("금리", oids=["001"])] == ["001"]
+
+    # 같은 지면을 다시 저장하면 이전 기사는 색인에서 빠짐
+    storage.save_news_cache("20260129", "001", edition(article("환율 급등", aid=3)))
+    assert [r['oid'] for r in search_index.search("금리")] == ["002"]
+    assert search_index.get_stats()["editions"] == 2
+
+def test_sync_indexes_existing_cache_once(temp_storage):
+    # 색인 도입 이전에 저장된 캐시 (색인 없이 파일만 있음)
+    storage.save_json(storage.get_cache_path("20260130", "001"), edition(article("전기차 보조금", aid=1)))
+    assert search_index.sync() == 1
+    assert search_index.sync() == 0
+    assert [r['title'] for r in search_index.search("보조금")] == ["전기차 보조금"]
+
+    assert search_index.rebuild() == 1
+    assert search_index.get_stats()["articles"] == 1
+
+def test_removed_caches_leave_search_results(temp_storage):
+    for date, aid in [("20260128", 1), ("20260129", 2), ("20260130", 3)]:
+        storage.save_news_cache(date, "001", edition(article("금리 동결", aid=aid)))
+    assert len(search_index.search("금리")) == 3
+
+    storage.clear_news_cache("20260128", "001")
+    cache_manager.enforce(dict(cache_manager.DEFAULT_POLICY, max_age_days=0), protect={("20260130", "001")})
+    assert [r['date'] for r in search_index.search("금리")] == ["20260130"]
+
+    # 다른 프로세스가 캐시 파일을 지운 경우는 다음 sync에서 빠짐
+    os.remove(storage.find_cache_path("20260130", "001"))
+    search_index.sync()
+    assert search_index.search("금리") == []
+    assert search_index.get_stats()["editions"] == 0
@@ -0,0 +1,83 @@
+"""같은 언론사 / 날짜 스크래핑 합치기(single_flight) 테스트"""
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+import single_flight
+import storage
+
+EDITION = [{"page": "A1면", "articles": [
+    {"page": "A1면", "title": "제목", "url": "https://n.news.naver.com/article/newspaper/023/1", "subtitle": ""}
+]}]
+
+def test_concurrent_calls_share_one_scrape(temp_storage):
+    calls = []
+
+    async def scrape():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return EDITION
+
+    async def main():
+        results = await asyncio.gather(*[single_flight.run("023", "20260130", scrape) for _ in range(5)])
+        # 끝난 뒤의 요청은 새로 실행
+        again = await single_flight.run("023", "20260130", scrape)
+        return results, again
+
+    results, again = asyncio.run(main())
+    assert results == [EDITION] * 5
+    assert again == EDITION
+    assert len(calls) == 2
+    assert single_flight._inflight == {}
+    # 잠금 파일은 날짜 폴더 밖에 둠
+    assert os.path.exists(single_flight.get_lock_path("20260130", "023"))
+    assert storage.list_cache_dates() == []
+
+def test_cancelled_waiter_does_not_cancel_scrape(temp_storage):
+    finished = []
+
+    async def scrape():
+        await asyncio.sleep(0.05)
+        finished.append(1)
+        return EDITION
+
+    async def main():
+        first = asyncio.ensure_future(single_flight.run("023", "20260130", scrape))
+        second = asyncio.ensure_future(single_flight.run("023", "20260130", scrape))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == EDITION
+    assert finished == [1]
+
+def test_other_loop_waits_and_reuses_saved_cache(temp_storage):
+    if single_flight.fcntl is None:
+        pytest.skip("프로세스 간 잠금은 fcntl이 있는 환경에서만")
+    started = threading.Event()
+    calls = []
+
+    async def slow_scrape():
+        calls.append("first")
+        started.set()
+        await asyncio.sleep(0.3)
+        storage.save_news_cache("20260130", "023", EDITION)
+        return EDITION
+
+    async def second_scrape():
+        calls.append("second")
+        return []
+
+    thread = threading.Thread(target=lambda: asyncio.run(single_flight.run("023", "20260130", slow_scrape)))
+    thread.start()
+    assert started.wait(5)
+    result = asyncio.run(single_flight.run("023", "20260130", second_scrape))
+    thread.join(5)
+
+    assert result == EDITION
+    assert calls == ["first"]
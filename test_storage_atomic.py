@@ -0,0 +1,97 @@
+"""원자적 저장(storage.write_atomic) / 파일 잠금(storage.file_lock) 테스트"""
+
+import os
+import stat
+import threading
+
+import pytest
+
+import storage
+
+def test_write_atomic_replaces_and_keeps_mode(tmp_path):
+    path = str(tmp_path / "data" / "settings.json")
+    storage.write_atomic(path, "first")
+    os.chmod(path, 0o600)
+    storage.write_atomic(path, b"second")
+
+    with open(path, "rb") as f:
+        assert f.read() == b"second"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert os.listdir(tmp_path / "data") == ["settings.json"]
+
+def test_write_atomic_failure_keeps_old_file(tmp_path):
+    path = str(tmp_path / "scraps.json")
+    storage.write_atomic(path, "old")
+    with pytest.raises(TypeError):
+        storage.write_atomic(path, ["not", "text"])
+
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "old"
+    assert os.listdir(tmp_path) == ["scraps.json"]
+
+def test_corrupt_json_is_backed_up(tmp_path):
+    path = str(tmp_path / "scraps.json")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"2026-01-30": [')
+    assert storage.load_json(path, {}) == {}
+    with open(path + ".corrupt", encoding="utf-8") as f:
+        assert f.read() == '{"2026-01-30": ['
+
+def test_file_lock_serializes_read_modify_write(tmp_path):
+    path = str(tmp_path / "counter.json")
+    storage.save_json(path, 0)
+
+    def increment():
+        for _ in range(50):
+            with storage.file_lock(path):
+                value = storage.load_json(path, 0)
+                storage.save_json(path, value + 1)
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert storage.load_json(path, 0) == 200
+
+def test_file_lock_is_reentrant(tmp_path):
+    path = str(tmp_path / "folders.json")
+    with storage.file_lock(path):
+        with storage.file_lock(path):
+            storage.save_json(path, ["기본"])
+        # 안쪽 블록이 끝나도 바깥 잠금은 유지
+        acquired = threading.Event()
+
+        def other():
+            with storage.file_lock(path):
+                acquired.set()
+
+        t = threading.Thread(target=other)
+        t.start()
+        assert not acquired.wait(0.2)
+    t.join(5)
+    assert acquired.is_set()
+
+def test_shared_locks_do_not_block_each_other(tmp_path):
+    if storage.fcntl is None:
+        pytest.skip("공유 잠금은 fcntl이 있는 환경에서만")
+    path = str(tmp_path / "scraps.journal")
+    acquired = threading.Event()
+
+    def reader():
+        with storage.file_lock(path, exclusive=False):
+            acquired.set()
+
+    with storage.file_lock(path, exclusive=False):
+        t = threading.Thread(target=reader)
+        t.start()
+        assert acquired.wait(5)
+    t.join(5)
+
+    acquired.clear()
+    with storage.file_lock(path):
+        t = threading.Thread(target=reader)
+        t.start()
+        assert not acquired.wait(0.2)
+    t.join(5)
+    assert acquired.is_set()
@@ -0,0 +1,132 @@
+"""스크랩 저장 방식(json / sqlite / journal) 동작 일치 테스트"""
+
+import itertools
+import random
+
+import pytest
+
+import scrap_stats
+import storage
+import storage_sqlite
+from benchmarks import fixtures
+
+BACKENDS = ["json", "sqlite", "journal"]
+TAGS = ["a", "b", "c", "d"]
+
+def fill_scraps(count=200, days=30):
+    storage.save_json(storage.SCRAPS_FILE, fixtures.make_scraps(count, days=days))
+
+def apply_changes(seed=1, steps=300):
+    """기존 스크랩에 무작위 추가 / 삭제 / 변경 적용 → 각 호출의 반환값 목록"""
+    rng = random.Random(seed)
+    scraps = storage.load_scraps()
+    urls = [(date_str, s) for date_str in sorted(scraps) for s in scraps[date_str]]
+    returned = []
+    for _ in range(steps):
+        date_str, s = rng.choice(urls)
+        op = rng.random()
+        if op < 0.3:
+            article = {key: s[key] for key in ("page", "title", "url", "subtitle")}
+            returned.append(storage.toggle_scrap(
+                date_str, s['media'], article, folder=rng.choice(["기본", "경제"]), tags=rng.sample(TAGS, rng.randint(0, 2))))
+        elif op < 0.5:
+            returned.append(storage.mark_as_read(date_str, s['url'], rng.random() < 0.5))
+        elif op < 0.7:
+            returned.append(storage.update_scrap_folder(date_str, s['url'], rng.choice(["기본", "정치", "경제"])))
+        elif op < 0.9:
+            returned.append(storage.update_scrap_tags(date_str, s['url'], rng.sample(TAGS, rng.randint(0, 3))))
+        else:
+            returned.append(storage.remove_scrap(date_str, s['url']))
+    return returned
+
+def without_time(scraps):
+    # 다시 추가한 스크랩은 실행 시각이 기록되므로 비교에서 제외
+    return {date_str: [{k: v for k, v in s.items() if k != 'scrapped_at'} for s in items] for date_str, items in scraps.items()}
+
+def brute_query(scraps, folder, tags, match):
+    selected = {}
+    for date_str in sorted(scraps):
+        for s in scraps[date_str]:
+            if folder is not None and s.get('folder', '기본') != folder:
+                continue
+            if tags:
+                scrap_tags = set(s.get('tags', []))
+                if match == "all" and not set(tags) <= scrap_tags:
+                    continue
+                if match == "any" and not scrap_tags & set(tags):
+                    continue
+            selected.setdefault(date_str, []).append(s)
+    return selected
+
+def test_backends_agree(make_storage):
+    results = {}
+    for backend in BACKENDS:
+        make_storage(backend)
+        fill_scraps()
+        returned = apply_changes()
+        scraps = storage.load_scraps()
+        results[backend] = (returned, without_time(scraps), storage.get_scrapped_urls())
+    assert results["sqlite"] == results["json"]
+    assert results["journal"] == results["json"]
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_daily_stats_match_scraps(make_storage, backend):
+    make_storage(backend)
+    fill_scraps()
+    apply_changes(seed=2)
+    scraps = storage.load_scraps()
+    assert storage.get_daily_scrap_stats() == scrap_stats.build(scraps)
+
+    dates = sorted(scraps)
+    start, end = dates[3], dates[10]
+    between = [dict(s, date=date_str) for date_str in dates if start <= date_str <= end for s in scraps[date_str]]
+    assert storage.get_scraps_between(start, end) == between
+    summary = storage.get_scrap_summary(start, end)
+    assert summary["total"] == len(between)
+    assert summary["unread"] == sum(1 for s in between if not s.get('read', False))
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_folder_and_tag_queries(make_storage, backend):
+    make_storage(backend)
+    fill_scraps(count=120)
+    apply_changes(seed=3, steps=200)
+    scraps = storage.load_scraps()
+    for folder in [None, "기본", "경제", "없음"]:
+        for size in range(3):
+            for tags in itertools.combinations(TAGS, size):
+                for match in ["any", "all"]:
+                    expected = brute_query(scraps, folder, list(tags), match)
+                    assert storage.query_scraps(folder, list(tags), match) == expected, (folder, tags, match)
+                    assert storage.count_scraps(folder, list(tags), match) == sum(map(len, expected.values()))
+
+    tag_counts = {}
+    for items in scraps.values():
+        for s in items:
+            for tag in set(s.get('tags', [])):
+                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    assert storage.get_tag_counts() == tag_counts
+
+def test_sqlite_imports_json_and_rebuilds_stats(make_storage):
+    make_storage("sqlite")
+    fill_scraps(count=80)
+    imported = storage.load_scraps()
+    assert without_time(imported) == without_time(storage.load_json(storage.SCRAPS_FILE, {}))
+    expected = storage.get_daily_scrap_stats()
+    assert expected == scrap_stats.build(imported)
+
+    # 집계 테이블이 없던 DB (스키마 버전 0) → 다음 연결에서 다시 계산
+    conn = storage_sqlite.get_connection()
+    conn.execute("DELETE FROM scrap_stats")
+    conn.execute("PRAGMA user_version=0")
+    conn.commit()
+    storage_sqlite.close_connections()
+    assert storage.get_daily_scrap_stats() == expected
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_caller_tag_list_is_copied(make_storage, backend):
+    make_storage(backend)
+    tags = ["a"]
+    storage.toggle_scrap("2026-01-30", "조선일보", {"page": "A1면", "title": "t", "url": "https://n.news.naver.com/article/001/1", "subtitle": ""}, tags=tags)
+    tags.append("b")
+    assert storage.get_tag_counts() == {"a": 1}
+    assert storage.load_scraps()["2026-01-30"][0]['tags'] == ["a"]
@@ -0,0 +1,113 @@
+"""스냅샷 + 변경 기록 스크랩 저장소(storage_journal) 테스트"""
+
+import os
+
+import pytest
+
+import storage
+import storage_journal
+
+def article(i):
+    return {"page": "A1면", "title": f"기사 {i}", "url": f"https://n.news.naver.com/article/001/{i}", "subtitle": ""}
+
+def restart():
+    """다른 프로세스가 처음 읽는 것처럼 메모리 상태를 버림"""
+    storage_journal._state = None
+
+def test_replay_after_restart(make_storage):
+    make_storage("journal")
+    for i in range(5):
+        storage.toggle_scrap("2026-01-30", "조선일보", article(i), tags=["정책"])
+    storage.toggle_scrap("2026-01-30", "조선일보", article(0))
+    storage.mark_as_read("2026-01-30", article(1)['url'])
+    storage.update_scrap_folder("2026-01-30", article(2)['url'], "경제")
+    expected = storage.load_scraps()
+
+    restart()
+    assert storage.load_scraps() == expected
+    assert [s['url'] for s in expected["2026-01-30"]] == [article(i)['url'] for i in range(1, 5)]
+    assert storage.count_scraps(folder="경제") == 1
+    assert storage.get_daily_scrap_stats()["2026-01-30"]["read"] == 1
+
+def test_torn_last_line_is_ignored(make_storage):
+    make_storage("journal")
+    storage.toggle_scrap("2026-01-30", "조선일보", article(1))
+    with open(storage.SCRAPS_JOURNAL_FILE, "ab") as f:
+        f.write(b'{"op": "add", "date": "2026-01-30", "item": {"url"')
+
+    restart()
+    assert sum(len(items) for items in storage.load_scraps().values()) == 1
+    # 다음 쓰기는 쓰다 만 줄을 잘라내고 이어 씀
+    storage.toggle_scrap("2026-01-30", "조선일보", article(2))
+    restart()
+    assert [s['url'] for s in storage.load_scraps()["2026-01-30"]] == [article(1)['url'], article(2)['url']]
+
+def test_compact_merges_into_snapshot(make_storage):
+    make_storage("journal")
+    for i in range(3):
+        storage.toggle_scrap("2026-01-30", "조선일보", article(i))
+    expected = storage.load_scraps()
+
+    assert storage_journal.compact()
+    assert not storage_journal.compact()
+    assert storage.load_json(storage.SCRAPS_FILE, {}) == expected
+    with open(storage.SCRAPS_JOURNAL_FILE, "rb") as f:
+        assert len(f.read().splitlines()) == 1
+
+    restart()
+    assert storage.load_scraps() == expected
+
+def test_crash_between_snapshot_and_journal_replace(monkeypatch, make_storage):
+    make_storage("journal")
+    for i in range(3):
+        storage.toggle_scrap("2026-01-30", "조선일보", article(i))
+    storage.toggle_scrap("2026-01-30", "조선일보", article(0))
+    write_atomic = storage.write_atomic
+    write_snapshot = storage_journal._write_snapshot
+
+    def write_while_compacting(snapshot_path, scraps):
+        # 스냅샷을 쓰는 동안 늘어난 기록 (새 기록 파일로 옮겨야 할 부분)
+        storage.toggle_scrap("2026-01-30", "조선일보", article(5))
+        storage.mark_as_read("2026-01-30", article(1)['url'])
+        return write_snapshot(snapshot_path, scraps)
+
+    def crash(filename, content):
+        if filename == storage.SCRAPS_JOURNAL_FILE:
+            raise OSError("crash before journal replace")
+        write_atomic(filename, content)
+
+    monkeypatch.setattr(storage_journal, "_write_snapshot", write_while_compacting)
+    monkeypatch.setattr(storage, "write_atomic", crash)
+    with pytest.raises(OSError):
+        storage_journal.compact()
+    monkeypatch.setattr(storage, "write_atomic", write_atomic)
+    monkeypatch.setattr(storage_journal, "_write_snapshot", write_snapshot)
+    expected = storage.load_scraps()
+    assert [s['url'] for s in expected["2026-01-30"]] == [article(i)['url'] for i in (1, 2, 5)]
+    assert expected["2026-01-30"][0]['read']
+
+    # 새 스냅샷 + 이전 기록: 합친 변경은 다시 적용하지 않고, 합치는 동안 늘어난 변경만 적용
+    assert len(storage.load_json(storage.SCRAPS_FILE, {})["2026-01-30"]) == 2
+    restart()
+    assert storage.load_scraps() == expected
+
+    # 이전 기록에 이어 쓴 변경도 유지
+    storage.toggle_scrap("2026-01-30", "조선일보", article(3))
+    expected = storage.load_scraps()
+    restart()
+    assert storage.load_scraps() == expected
+    assert storage_journal.compact()
+    restart()
+    assert storage.load_scraps() == expected
+
+def test_stale_journal_is_ignored(make_storage):
+    make_storage("journal")
+    storage.toggle_scrap("2026-01-30", "조선일보", article(1))
+    # json 방식으로 스냅샷을 직접 바꾼 경우 (기록의 스냅샷 id와 다름)
+    storage.save_json(storage.SCRAPS_FILE, {})
+    restart()
+    assert storage.load_scraps() == {}
+    storage.toggle_scrap("2026-01-30", "조선일보", article(2))
+    restart()
+    assert [s['url'] for s in storage.load_scraps()["2026-01-30"]] == [article(2)['url']]
+    assert os.path.exists(storage.SCRAPS_JOURNAL_FILE)
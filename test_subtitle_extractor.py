@@ -0,0 +1,51 @@
+"""
+부제목 추출기 회귀 테스트 (오프라인 코퍼스)
+test_data/subtitle_corpus/*.html 각각에 대해
+BeautifulSoup 기준 구현(news_parser)과 subtitle_extractor 결과가 같은지 확인합니다.
+
+사용법: python -m pytest test_subtitle_extractor.py
+"""
+
+import asyncio
+import glob
+import json
+import os
+
+import news_parser
+import subtitle_extractor
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data", "subtitle_corpus")
+
+def load_corpus():
+    with open(os.path.join(CORPUS_DIR, "expected.json"), "r", encoding="utf-8") as f:
+        expected = json.load(f)
+    for path in sorted(glob.glob(os.path.join(CORPUS_DIR, "*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            yield os.path.basename(path), f.read(), expected[os.path.basename(path)]
+
+def test_corpus_matches_expected():
+    for name, html, expected in load_corpus():
+        assert news_parser.parse_article_subtitle(html) == expected, name
+        assert subtitle_extractor.extract_subtitle(html) == expected, name
+
+def test_stream_matches_expected():
+    async def chunks(html, size):
+        for i in range(0, len(html), size):
+            yield html[i:i + size]
+
+    for name, html, expected in load_corpus():
+        for size in (1, 97, 4096):
+            result = asyncio.run(subtitle_extractor.extract_subtitle_from_stream(chunks(html, size)))
+            assert result == expected, (name, size)
+
+def test_stops_after_priority_element():
+    _, html, _ = next(c for c in load_corpus() if c[0] == "subheadline_basic.html")
+    extractor = subtitle_extractor.SubtitleExtractor()
+    consumed = 0
+    for i in range(0, len(html), 1024):
+        extractor.feed(html[i:i + 1024])
+        consumed = i + 1024
+        if extractor.done:
+            break
+    assert extractor.done
+    assert consumed < len(html) // 4